@@ -3,8 +3,11 @@
 import copy
 import os
 import sys
+import json
 import time
+import hashlib
 import inspect
+import tempfile
 import logging
 import threading
 import collections
@@ -19,8 +22,10 @@ from ayon_core import AYON_CORE_ROOT
 from ayon_core.lib import (
     Logger,
     is_dev_mode_enabled,
+    get_launcher_local_dir,
     get_launcher_storage_dir,
     is_headless_mode_enabled,
+    profile_phase,
 )
 from ayon_core.settings import get_studio_settings
 
@@ -38,6 +43,11 @@ IGNORED_DEFAULT_FILENAMES = {
     "__init__.py",
 }
 
+# Seconds for which cached bundle information is used without asking
+#   server, value can be changed with environment variable
+BUNDLE_CACHE_TTL_ENV_KEY = "AYON_BUNDLE_CACHE_TTL"
+DEFAULT_BUNDLE_CACHE_TTL = 300
+
 # When addon was moved from ayon-core codebase
 # - this is used to log the missing addon
 MOVED_ADDON_MILESTONE_VERSIONS = {
@@ -125,8 +135,15 @@ class _LoadCache:
     addons_lock = threading.Lock()
     addons_loaded = False
     addon_modules = []
+    # Lock for import of single addon
+    addon_lock = threading.RLock()
+    # Client directories of addons from bundle
+    addon_dirs = None
+    # Imported modules by addon name
+    addon_modules_by_name = {}
 
 
+@profile_phase("addons_import")
 def load_addons(force=False):
     """Load AYON addons as python modules.
 
@@ -144,6 +161,11 @@ def load_addons(force=False):
     if _LoadCache.addons_loaded and not force:
         return
 
+    if force:
+        with _LoadCache.addon_lock:
+            _LoadCache.addon_dirs = None
+            _LoadCache.addon_modules_by_name = {}
+
     if not _LoadCache.addons_lock.locked():
         with _LoadCache.addons_lock:
             _load_addons()
@@ -199,6 +221,106 @@ def _get_ayon_addons_information(bundle_info):
     return output
 
 
+def _get_bundle_cache_ttl():
+    value = os.getenv(BUNDLE_CACHE_TTL_ENV_KEY)
+    if not value:
+        return DEFAULT_BUNDLE_CACHE_TTL
+    try:
+        return float(value)
+    except ValueError:
+        return DEFAULT_BUNDLE_CACHE_TTL
+
+
+def _get_bundle_cache_path(bundle_name):
+    key = "{}|{}".format(ayon_api.get_base_url(), bundle_name)
+    return os.path.join(
+        get_launcher_local_dir("bundles"),
+        "{}.json".format(hashlib.sha1(key.encode("utf-8")).hexdigest())
+    )
+
+
+def _read_bundle_cache(cache_path, log):
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, "r") as stream:
+            return json.load(stream)
+    except (OSError, ValueError):
+        log.debug(
+            "Failed to read bundle cache '{}'".format(cache_path),
+            exc_info=True
+        )
+    return None
+
+
+def _write_bundle_cache(cache_path, bundle_info, addons_info, log):
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to temp file first so other processes never read
+        #   partially written file
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as stream:
+            json.dump(
+                {
+                    "timestamp": time.time(),
+                    "bundle": bundle_info,
+                    "addons": addons_info,
+                },
+                stream
+            )
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        log.debug(
+            "Failed to write bundle cache '{}'".format(cache_path),
+            exc_info=True
+        )
+
+
+def _get_bundle_addons_information(log):
+    """Bundle data and information about its addons.
+
+    Information is cached on disk per server and bundle name and used
+    without asking server for 'AYON_BUNDLE_CACHE_TTL' seconds. After that
+    only bundles are received from server and cached information about
+    addons is used if addon versions in bundle did not change.
+
+    Cache is not used in dev mode or for dev bundles because client code
+    paths of dev addons can change any time.
+
+    Args:
+        log (logging.Logger): Logger object.
+
+    Returns:
+        tuple[Union[dict[str, Any], None], list[dict[str, Any]]]: Bundle
+            data and information about addons to use.
+
+    """
+    bundle_name = os.getenv("AYON_BUNDLE_NAME")
+    ttl = _get_bundle_cache_ttl()
+    use_cache = bool(bundle_name) and ttl > 0 and not is_dev_mode_enabled()
+    cache_path = cached = None
+    if use_cache:
+        cache_path = _get_bundle_cache_path(bundle_name)
+        cached = _read_bundle_cache(cache_path, log)
+        if cached and time.time() - cached.get("timestamp", 0) < ttl:
+            return cached["bundle"], cached["addons"]
+
+    bundle_info = _get_ayon_bundle_data()
+    if (
+        cached
+        and bundle_info
+        and bundle_info.get("addons") == cached["bundle"].get("addons")
+    ):
+        addons_info = cached["addons"]
+    else:
+        addons_info = _get_ayon_addons_information(bundle_info)
+
+    if use_cache and bundle_info and not bundle_info.get("isDev"):
+        _write_bundle_cache(cache_path, bundle_info, addons_info, log)
+    return bundle_info, addons_info
+
+
 def _handle_moved_addons(addon_name, milestone_version, log):
     """Log message that addon version is not compatible with current core.
 
@@ -238,8 +360,8 @@ def _handle_moved_addons(addon_name, milestone_version, log):
     return addon_dir
 
 
-def _load_ayon_addons(log):
-    """Load AYON addons based on information from server.
+def _get_addon_dirs(log):
+    """Client code directories of addons based on information from server.
 
     This function should not trigger downloading of any addons but only use
     what is already available on the machine (at least in first stages of
@@ -248,12 +370,18 @@ def _load_ayon_addons(log):
     Args:
         log (logging.Logger): Logger object.
 
+    Returns:
+        list[tuple[str, str, str]]: Addon name, version and directory.
+
     """
-    all_addon_modules = []
-    bundle_info = _get_ayon_bundle_data()
-    addons_info = _get_ayon_addons_information(bundle_info)
+    if _LoadCache.addon_dirs is not None:
+        return _LoadCache.addon_dirs
+
+    output = []
+    bundle_info, addons_info = _get_bundle_addons_information(log)
     if not addons_info:
-        return all_addon_modules
+        _LoadCache.addon_dirs = output
+        return output
 
     addons_dir = os.environ.get("AYON_ADDONS_DIR")
     if not addons_dir:
@@ -314,62 +442,131 @@ def _load_ayon_addons(log):
         if not addon_dir:
             continue
 
-        sys.path.insert(0, addon_dir)
-        addon_modules = []
-        for name in os.listdir(addon_dir):
-            # Ignore of files is implemented to be able to run code from code
-            #   where usually is more files than just the addon
-            # Ignore start and setup scripts
-            if name in ("setup.py", "start.py", "__pycache__"):
-                continue
+        output.append((addon_name, addon_version, addon_dir))
 
-            path = os.path.join(addon_dir, name)
-            basename, ext = os.path.splitext(name)
-            # Ignore folders/files with dot in name
-            #   - dot names cannot be imported in Python
-            if "." in basename:
-                continue
-            is_dir = os.path.isdir(path)
-            is_py_file = ext.lower() == ".py"
-            if not is_py_file and not is_dir:
-                continue
+    _LoadCache.addon_dirs = output
+    return output
 
-            try:
-                mod = __import__(basename, fromlist=("",))
-                for attr_name in dir(mod):
-                    attr = getattr(mod, attr_name)
-                    if (
-                        inspect.isclass(attr)
-                        and issubclass(attr, AYONAddon)
-                    ):
-                        addon_modules.append(mod)
-                        break
-
-            except BaseException:
-                log.warning(
-                    "Failed to import \"{}\"".format(basename),
-                    exc_info=True
-                )
 
-        if not addon_modules:
-            log.warning("Addon {} {} has no content to import".format(
-                addon_name, addon_version
-            ))
+def _import_addon_dir(addon_name, addon_version, addon_dir, log):
+    """Import python modules with AYON addon from addon directory.
+
+    Args:
+        addon_name (str): Addon name.
+        addon_version (str): Addon version.
+        addon_dir (str): Directory with client code of addon.
+        log (logging.Logger): Logger object.
+
+    Returns:
+        list[types.ModuleType]: Modules containing AYON addon.
+
+    """
+    sys.path.insert(0, addon_dir)
+    addon_modules = []
+    for name in os.listdir(addon_dir):
+        # Ignore of files is implemented to be able to run code from code
+        #   where usually is more files than just the addon
+        # Ignore start and setup scripts
+        if name in ("setup.py", "start.py", "__pycache__"):
+            continue
+
+        path = os.path.join(addon_dir, name)
+        basename, ext = os.path.splitext(name)
+        # Ignore folders/files with dot in name
+        #   - dot names cannot be imported in Python
+        if "." in basename:
             continue
+        is_dir = os.path.isdir(path)
+        is_py_file = ext.lower() == ".py"
+        if not is_py_file and not is_dir:
+            continue
+
+        try:
+            mod = __import__(basename, fromlist=("",))
+            for attr_name in dir(mod):
+                attr = getattr(mod, attr_name)
+                if (
+                    inspect.isclass(attr)
+                    and issubclass(attr, AYONAddon)
+                ):
+                    addon_modules.append(mod)
+                    break
+
+        except BaseException:
+            log.warning(
+                "Failed to import \"{}\"".format(basename),
+                exc_info=True
+            )
 
-        if len(addon_modules) > 1:
-            log.warning((
-                "Multiple modules ({}) were found in addon '{}' in dir {}."
-            ).format(
-                ", ".join([m.__name__ for m in addon_modules]),
-                addon_name,
-                addon_dir,
-            ))
-        all_addon_modules.extend(addon_modules)
+    if not addon_modules:
+        log.warning("Addon {} {} has no content to import".format(
+            addon_name, addon_version
+        ))
+        return addon_modules
+
+    if len(addon_modules) > 1:
+        log.warning((
+            "Multiple modules ({}) were found in addon '{}' in dir {}."
+        ).format(
+            ", ".join([m.__name__ for m in addon_modules]),
+            addon_name,
+            addon_dir,
+        ))
+    return addon_modules
+
+
+def _load_ayon_addons(log):
+    """Load AYON addons based on information from server.
+
+    Args:
+        log (logging.Logger): Logger object.
+
+    Returns:
+        list[types.ModuleType]: Modules containing AYON addons.
+
+    """
+    all_addon_modules = []
+    with _LoadCache.addon_lock:
+        for addon_name, addon_version, addon_dir in _get_addon_dirs(log):
+            addon_modules = _LoadCache.addon_modules_by_name.get(addon_name)
+            if addon_modules is None:
+                addon_modules = _import_addon_dir(
+                    addon_name, addon_version, addon_dir, log
+                )
+                _LoadCache.addon_modules_by_name[addon_name] = addon_modules
+            all_addon_modules.extend(addon_modules)
 
     return all_addon_modules
 
 
+def _load_addon(addon_name):
+    """Import modules of single AYON addon from bundle.
+
+    Args:
+        addon_name (str): Addon name.
+
+    Returns:
+        Union[list[types.ModuleType], None]: Modules containing the addon or
+            None if addon is not available in bundle.
+
+    """
+    with _LoadCache.addon_lock:
+        addon_modules = _LoadCache.addon_modules_by_name.get(addon_name)
+        if addon_modules is not None:
+            return addon_modules
+
+        log = Logger.get_logger("AddonsLoader")
+        for name, addon_version, addon_dir in _get_addon_dirs(log):
+            if name != addon_name:
+                continue
+            addon_modules = _import_addon_dir(
+                addon_name, addon_version, addon_dir, log
+            )
+            _LoadCache.addon_modules_by_name[addon_name] = addon_modules
+            return addon_modules
+    return None
+
+
 def _load_addons_in_core(log):
     # Add current directory at first place
     #   - has small differences in import logic
@@ -645,31 +842,46 @@ class _AddonReportInfo:
 class AddonsManager:
     """Manager of addons that helps to load and prepare them to work.
 
+    Lazy manager does not import and initialize addons on init. Addon is
+    imported and initialized on first access by name with 'get',
+    'get_enabled_addon' or '[]'. All addons are initialized and connected
+    on first access to all addons, e.g. 'get_enabled_addons' or collecting
+    of plugin paths. Addons initialized by name are not connected with
+    other addons until then.
+
     Args:
         settings (Optional[dict[str, Any]]): AYON studio settings.
         initialize (Optional[bool]): Initialize addons on init.
             True by default.
+        lazy (Optional[bool]): Initialize addons on first access.
+            False by default.
 
     """
     # Helper attributes for report
     _report_total_key = "Total"
     _log = None
 
-    def __init__(self, settings=None, initialize=True):
+    def __init__(self, settings=None, initialize=True, lazy=False):
         self._settings = settings
+        self._lazy = lazy
+        self._all_initialized = False
 
         self._addons = []
         self._addons_by_id = {}
         self._addons_by_name = {}
+        self._initialized_classes = set()
         # For report of time consumption
         self._report = {}
 
-        if initialize:
+        if initialize and not lazy:
             self.initialize_addons()
             self.connect_addons()
 
     def __getitem__(self, addon_name):
-        return self._addons_by_name[addon_name]
+        addon = self.get(addon_name)
+        if addon is None:
+            raise KeyError(addon_name)
+        return addon
 
     @property
     def log(self):
@@ -688,18 +900,28 @@ class AddonsManager:
             Union[AYONAddon, Any]: Addon found by name or `default`.
 
         """
-        return self._addons_by_name.get(addon_name, default)
+        addon = self._addons_by_name.get(addon_name)
+        if addon is None and self._lazy and not self._all_initialized:
+            self._initialize_addon(addon_name)
+            addon = self._addons_by_name.get(addon_name)
+
+        if addon is None:
+            return default
+        return addon
 
     @property
     def addons(self):
+        self._ensure_all_initialized()
         return list(self._addons)
 
     @property
     def addons_by_id(self):
+        self._ensure_all_initialized()
         return dict(self._addons_by_id)
 
     @property
     def addons_by_name(self):
+        self._ensure_all_initialized()
         return dict(self._addons_by_name)
 
     def get_enabled_addon(self, addon_name, default=None):
@@ -728,12 +950,14 @@ class AddonsManager:
             list[AYONAddon]: Initialized and enabled addons.
 
         """
+        self._ensure_all_initialized()
         return [
             addon
             for addon in self._addons
             if addon.enabled
         ]
 
+    @profile_phase("addons_load")
     def initialize_addons(self):
         """Import and initialize addons."""
         # Make sure modules are loaded
@@ -741,17 +965,52 @@ class AddonsManager:
 
         self.log.debug("*** AYON addons initialization.")
 
-        # Prepare settings for addons
-        settings = self._settings
-        if settings is None:
-            settings = get_studio_settings()
-
         report = {}
         time_start = time.time()
-        prev_start_time = time_start
+        addon_classes = self._get_addon_classes(_LoadCache.addon_modules)
+        self._initialize_addon_classes(addon_classes, report)
+
+        for addon_name in sorted(self._addons_by_name.keys()):
+            addon = self._addons_by_name[addon_name]
+            enabled_str = "X" if addon.enabled else " "
+            self.log.debug(
+                f"[{enabled_str}] {addon.name} ({addon.version})"
+            )
+
+        if self._report is not None:
+            report[self._report_total_key] = time.time() - time_start
+            self._report["Initialization"] = report
+
+    def _ensure_all_initialized(self):
+        if not self._lazy or self._all_initialized:
+            return
+        # Set before initialization to avoid recursion
+        self._all_initialized = True
+        self.initialize_addons()
+        self.connect_addons()
+
+    @profile_phase("addons_load")
+    def _initialize_addon(self, addon_name):
+        """Import and initialize single addon of lazy manager."""
+        addon_modules = _load_addon(addon_name)
+        if addon_modules:
+            self._initialize_addon_classes(
+                self._get_addon_classes(addon_modules), {}
+            )
 
+        # Name of addon class might not match name of addon in bundle
+        #   or addon is in ayon-core 'modules'
+        if addon_name not in self._addons_by_name:
+            self._ensure_all_initialized()
+
+    def _get_settings(self):
+        if self._settings is None:
+            self._settings = get_studio_settings()
+        return self._settings
+
+    def _get_addon_classes(self, addon_modules):
         addon_classes = []
-        for module in _LoadCache.addon_modules:
+        for module in addon_modules:
             # Go through globals in `ayon_core.modules`
             for name in dir(module):
                 modules_item = getattr(module, name, None)
@@ -784,8 +1043,18 @@ class AddonsManager:
                     continue
 
                 addon_classes.append(modules_item)
+        return addon_classes
 
+    def _initialize_addon_classes(self, addon_classes, report):
+        # Prepare settings for addons
+        settings = self._get_settings()
+        prev_start_time = time.time()
         for addon_cls in addon_classes:
+            # Skip addons already initialized by lazy manager
+            if addon_cls in self._initialized_classes:
+                continue
+            self._initialized_classes.add(addon_cls)
+
             name = addon_cls.__name__
             try:
                 addon = addon_cls(self, settings)
@@ -804,17 +1073,7 @@ class AddonsManager:
                     exc_info=True
                 )
 
-        for addon_name in sorted(self._addons_by_name.keys()):
-            addon = self._addons_by_name[addon_name]
-            enabled_str = "X" if addon.enabled else " "
-            self.log.debug(
-                f"[{enabled_str}] {addon.name} ({addon.version})"
-            )
-
-        if self._report is not None:
-            report[self._report_total_key] = time.time() - time_start
-            self._report["Initialization"] = report
-
+    @profile_phase("addons_connect")
     def connect_addons(self):
         """Trigger connection with other enabled addons.
 
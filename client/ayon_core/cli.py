@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Package for handling AYON command line arguments."""
 import os
+import re
 import sys
 import code
 import traceback
@@ -17,6 +18,7 @@ from ayon_core.lib import (
     initialize_ayon_connection,
     is_running_from_build,
     Logger,
+    start_session_profiling,
 )
 
 
@@ -283,7 +285,19 @@ def _add_addons(addons_manager):
             )
 
 
+def _get_profiling_session_name():
+    """Session name for profiling based on command, e.g. 'cli_publish'."""
+    parts = ["cli"]
+    for arg in sys.argv[1:]:
+        if len(parts) > 2:
+            break
+        if re.match(r"^[a-zA-Z][\w\-]*$", arg):
+            parts.append(arg)
+    return "_".join(parts)
+
+
 def main(*args, **kwargs):
+    start_session_profiling(_get_profiling_session_name())
     initialize_ayon_connection()
     python_path = os.getenv("PYTHONPATH", "")
     split_paths = python_path.split(os.pathsep)
@@ -6,6 +6,7 @@ from ayon_applications.utils import (
     prepare_app_environments,
     prepare_context_environments
 )
+from ayon_core.lib import profile_phase
 from ayon_core.pipeline import Anatomy
 
 
@@ -13,6 +14,7 @@ class GlobalHostDataHook(PreLaunchHook):
     order = -100
     launch_types = set()
 
+    @profile_phase("launch_hook:GlobalHostDataHook")
     def execute(self):
         """Prepare global objects to `data` that will be used for sure."""
         self.prepare_global_data()
@@ -1,5 +1,6 @@
 from ayon_applications import PreLaunchHook
 
+from ayon_core.lib import profile_phase
 from ayon_core.pipeline.colorspace import get_imageio_config_preset
 from ayon_core.pipeline.template_data import get_template_data
 
@@ -23,6 +24,7 @@ class OCIOEnvHook(PreLaunchHook):
     }
     launch_types = set()
 
+    @profile_phase("launch_hook:OCIOEnvHook")
     def execute(self):
         """Hook entry method."""
 
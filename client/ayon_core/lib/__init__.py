@@ -1,137 +1,167 @@
 # -*- coding: utf-8 -*-
-# flake8: noqa E402
-"""AYON lib functions."""
-
-from .local_settings import (
-    IniSettingRegistry,
-    JSONSettingRegistry,
-    AYONSecureRegistry,
-    AYONSettingsRegistry,
-    get_launcher_local_dir,
-    get_launcher_storage_dir,
-    get_local_site_id,
-    get_ayon_username,
-)
-from .ayon_connection import initialize_ayon_connection
-from .cache import (
-    CacheItem,
-    NestedCacheItem,
-)
-from .events import (
-    emit_event,
-    register_event_callback
-)
-
-from .vendor_bin_utils import (
-    ToolNotFoundError,
-    find_executable,
-    get_oiio_tools_path,
-    get_oiio_tool_args,
-    get_ffmpeg_tool_path,
-    get_ffmpeg_tool_args,
-    is_oiio_supported,
-)
-
-from .attribute_definitions import (
-    AbstractAttrDef,
-
-    UIDef,
-    UISeparatorDef,
-    UILabelDef,
-
-    UnknownDef,
-    NumberDef,
-    TextDef,
-    EnumDef,
-    BoolDef,
-    FileDef,
-    FileDefItem,
-)
-
-from .env_tools import (
-    env_value_to_bool,
-    get_paths_from_environ,
-)
+"""AYON lib functions.
+
+Exported functions and classes are imported on first access, so import
+of 'ayon_core.lib' does not import all submodules.
+"""
+import importlib
+import importlib.util
 
 from .terminal import Terminal
-from .execute import (
-    get_ayon_launcher_args,
-    get_linux_launcher_args,
-    execute,
-    run_subprocess,
-    run_detached_process,
-    run_ayon_launcher_process,
-    path_to_subprocess_arg,
-    CREATE_NO_WINDOW
-)
-from .log import (
-    Logger,
-)
-
-from .path_templates import (
-    TemplateUnsolved,
-    StringTemplate,
-    FormatObject,
-)
-
-from .dateutils import (
-    get_datetime_data,
-    get_timestamp,
-    get_formatted_current_time
-)
-
-from .python_module_tools import (
-    import_filepath,
-    modules_from_path,
-    recursive_bases_from_class,
-    classes_from_module,
-    import_module_from_dirpath,
-    is_func_signature_supported,
-)
-
-from .profiles_filtering import (
-    compile_list_of_regexes,
-    filter_profiles
-)
-
-from .transcoding import (
-    get_transcode_temp_directory,
-    should_convert_for_ffmpeg,
-    convert_for_ffmpeg,
-    convert_input_paths_for_ffmpeg,
-    get_ffprobe_data,
-    get_ffprobe_streams,
-    get_ffmpeg_codec_args,
-    get_ffmpeg_format_args,
-    convert_ffprobe_fps_value,
-    convert_ffprobe_fps_to_float,
-    get_rescaled_command_arguments,
-    get_media_mime_type,
-)
-
-from .plugin_tools import (
-    prepare_template_data,
-    source_hash,
-)
-
-from .path_tools import (
-    format_file_size,
-    collect_frames,
-    create_hard_link,
-    version_up,
-    get_version_from_path,
-    get_last_version_from_path,
-)
-
-from .ayon_info import (
-    is_in_ayon_launcher_process,
-    is_running_from_build,
-    is_using_ayon_console,
-    is_headless_mode_enabled,
-    is_staging_enabled,
-    is_dev_mode_enabled,
-    is_in_tests,
-)
+
+# Exported names by submodule where they are defined
+_EXPORTS_BY_MODULE = {
+    ".local_settings": (
+        "IniSettingRegistry",
+        "JSONSettingRegistry",
+        "AYONSecureRegistry",
+        "AYONSettingsRegistry",
+        "get_launcher_local_dir",
+        "get_launcher_storage_dir",
+        "get_local_site_id",
+        "get_ayon_username",
+    ),
+    ".ayon_connection": (
+        "initialize_ayon_connection",
+    ),
+    ".cache": (
+        "CacheItem",
+        "NestedCacheItem",
+    ),
+    ".events": (
+        "emit_event",
+        "register_event_callback",
+    ),
+    ".vendor_bin_utils": (
+        "ToolNotFoundError",
+        "find_executable",
+        "get_oiio_tools_path",
+        "get_oiio_tool_args",
+        "get_ffmpeg_tool_path",
+        "get_ffmpeg_tool_args",
+        "is_oiio_supported",
+    ),
+    ".attribute_definitions": (
+        "AbstractAttrDef",
+        "UIDef",
+        "UISeparatorDef",
+        "UILabelDef",
+        "UnknownDef",
+        "NumberDef",
+        "TextDef",
+        "EnumDef",
+        "BoolDef",
+        "FileDef",
+        "FileDefItem",
+    ),
+    ".env_tools": (
+        "env_value_to_bool",
+        "get_paths_from_environ",
+    ),
+    ".execute": (
+        "get_ayon_launcher_args",
+        "get_linux_launcher_args",
+        "execute",
+        "run_subprocess",
+        "run_subprocess_streamed",
+        "run_detached_process",
+        "run_ayon_launcher_process",
+        "path_to_subprocess_arg",
+        "CREATE_NO_WINDOW",
+    ),
+    ".log": (
+        "Logger",
+    ),
+    ".path_templates": (
+        "TemplateUnsolved",
+        "StringTemplate",
+        "FormatObject",
+    ),
+    ".dateutils": (
+        "get_datetime_data",
+        "get_timestamp",
+        "get_formatted_current_time",
+    ),
+    ".python_module_tools": (
+        "import_filepath",
+        "import_filepath_cached",
+        "clear_imported_filepaths_cache",
+        "modules_from_path",
+        "recursive_bases_from_class",
+        "classes_from_module",
+        "import_module_from_dirpath",
+        "is_func_signature_supported",
+    ),
+    ".profiles_filtering": (
+        "compile_list_of_regexes",
+        "filter_profiles",
+    ),
+    ".media_probe_cache": (
+        "MediaProbeCache",
+        "get_media_probe_cache",
+        "invalidate_media_probe_cache",
+        "get_media_probe_cache_stats",
+    ),
+    ".tool_scheduler": (
+        "ToolScheduler",
+        "get_tool_scheduler",
+        "configure_tool_scheduler",
+        "get_tool_scheduler_stats",
+    ),
+    ".profiling": (
+        "is_profiling_enabled",
+        "get_profiling_dir",
+        "start_session_profiling",
+        "stop_session_profiling",
+        "profile_phase",
+        "get_phase_timings",
+        "write_profiling_outputs",
+    ),
+    ".transcoding": (
+        "get_transcode_temp_directory",
+        "should_convert_for_ffmpeg",
+        "convert_for_ffmpeg",
+        "convert_input_paths_for_ffmpeg",
+        "get_ffprobe_data",
+        "get_ffprobe_streams",
+        "get_ffmpeg_codec_args",
+        "get_ffmpeg_format_args",
+        "convert_ffprobe_fps_value",
+        "convert_ffprobe_fps_to_float",
+        "get_rescaled_command_arguments",
+        "get_media_mime_type",
+    ),
+    ".plugin_tools": (
+        "prepare_template_data",
+        "source_hash",
+    ),
+    ".path_tools": (
+        "format_file_size",
+        "collect_frames",
+        "create_hard_link",
+        "create_file_link",
+        "version_up",
+        "get_version_from_path",
+        "get_last_version_from_path",
+    ),
+    ".ayon_info": (
+        "is_in_ayon_launcher_process",
+        "is_running_from_build",
+        "is_using_ayon_console",
+        "is_headless_mode_enabled",
+        "is_staging_enabled",
+        "is_dev_mode_enabled",
+        "is_in_tests",
+    ),
+}
+# Exported names which are defined with different name in submodule
+_ALIASES = {}
+
+_MODULE_BY_NAME = {
+    name: module_name
+    for module_name, names in _EXPORTS_BY_MODULE.items()
+    for name in names
+}
 
 terminal = Terminal
 
@@ -157,6 +187,7 @@ __all__ = [
     "get_linux_launcher_args",
     "execute",
     "run_subprocess",
+    "run_subprocess_streamed",
     "run_detached_process",
     "run_ayon_launcher_process",
     "path_to_subprocess_arg",
@@ -188,12 +219,32 @@ __all__ = [
     "FileDefItem",
 
     "import_filepath",
+    "import_filepath_cached",
+    "clear_imported_filepaths_cache",
     "modules_from_path",
     "recursive_bases_from_class",
     "classes_from_module",
     "import_module_from_dirpath",
     "is_func_signature_supported",
 
+    "MediaProbeCache",
+    "get_media_probe_cache",
+    "invalidate_media_probe_cache",
+    "get_media_probe_cache_stats",
+
+    "ToolScheduler",
+    "get_tool_scheduler",
+    "configure_tool_scheduler",
+    "get_tool_scheduler_stats",
+
+    "is_profiling_enabled",
+    "get_profiling_dir",
+    "start_session_profiling",
+    "stop_session_profiling",
+    "profile_phase",
+    "get_phase_timings",
+    "write_profiling_outputs",
+
     "get_transcode_temp_directory",
     "should_convert_for_ffmpeg",
     "convert_for_ffmpeg",
@@ -217,6 +268,7 @@ __all__ = [
     "format_file_size",
     "collect_frames",
     "create_hard_link",
+    "create_file_link",
     "version_up",
     "get_version_from_path",
     "get_last_version_from_path",
@@ -241,3 +293,25 @@ __all__ = [
     "is_dev_mode_enabled",
     "is_in_tests",
 ]
+
+
+def __getattr__(name):
+    # Import exported names lazily on first access
+    module_name = _MODULE_BY_NAME.get(name)
+    if module_name is None:
+        # Submodules were available as attributes when all names were
+        #   imported eagerly
+        if importlib.util.find_spec("{}.{}".format(__name__, name)):
+            return importlib.import_module("." + name, __name__)
+        raise AttributeError(
+            "module '{}' has no attribute '{}'".format(__name__, name)
+        )
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, _ALIASES.get(name, name))
+    # Store value so '__getattr__' is not called for the name again
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,12 +1,15 @@
 import os
 import sys
 import subprocess
+import contextlib
+import collections
 import platform
 import json
 import tempfile
 
 from .log import Logger
 from .vendor_bin_utils import find_executable
+from .tool_scheduler import get_tool_name_from_args, get_tool_scheduler
 
 # MSDN process creation flag (Windows only)
 CREATE_NO_WINDOW = 0x08000000
@@ -79,11 +82,16 @@ def run_subprocess(*args, **kwargs):
     On windows are 'creationflags' filled with flags that should cause ignore
     creation of new window.
 
+    Media tools like 'ffmpeg' and 'oiiotool' are started through process
+    wide tool scheduler which limits number of concurrently running
+    processes.
+
     Args:
         *args: Variable length argument list passed to Popen.
         **kwargs : Arbitrary keyword arguments passed to Popen. Is possible to
             pass `logging.Logger` object under "logger" to use custom logger
-            for output.
+            for output and priority for tool scheduler under
+            "tool_priority".
 
     Returns:
         str: Full output of subprocess concatenated stdout and stderr.
@@ -92,6 +100,130 @@ def run_subprocess(*args, **kwargs):
         RuntimeError: Exception is raised if process finished with nonzero
             return code.
 
+    """
+    args, kwargs, logger, tool_slot = _prepare_subprocess_kwargs(
+        args, kwargs
+    )
+
+    # set overrides
+    kwargs["stdout"] = kwargs.get("stdout", subprocess.PIPE)
+    kwargs["stderr"] = kwargs.get("stderr", subprocess.PIPE)
+    kwargs["stdin"] = kwargs.get("stdin", subprocess.PIPE)
+
+    with tool_slot as slot:
+        proc = subprocess.Popen(*args, **kwargs)
+        _stdout, _stderr = proc.communicate()
+        if slot is not None and proc.returncode != 0:
+            slot["failed"] = True
+
+    full_output = ""
+    if _stdout:
+        _stdout = _stdout.decode("utf-8", errors="backslashreplace")
+        full_output += _stdout
+        logger.debug(_stdout)
+
+    if _stderr:
+        _stderr = _stderr.decode("utf-8", errors="backslashreplace")
+        # Add additional line break if output already contains stdout
+        if full_output:
+            full_output += "\n"
+        full_output += _stderr
+        logger.info(_stderr)
+
+    if proc.returncode != 0:
+        exc_msg = "Executing arguments was not successful: \"{}\"".format(args)
+        if _stdout:
+            exc_msg += "\n\nOutput:\n{}".format(_stdout)
+
+        if _stderr:
+            exc_msg += "Error:\n{}".format(_stderr)
+
+        raise RuntimeError(exc_msg)
+
+    return full_output
+
+
+def run_subprocess_streamed(
+    *args, output_callback=None, max_output_lines=1000, **kwargs
+):
+    """Run subprocess and process its output line by line while running.
+
+    Unlike 'run_subprocess' the full output is not kept in memory, only
+    last 'max_output_lines' lines are kept for error message and return
+    value. Stdout and stderr are merged into one stream.
+
+    Args:
+        *args: Variable length argument list passed to Popen.
+        output_callback (Optional[Callable[[str], bool]]): Called with
+            each line of output. Line is not logged nor kept in output if
+            callback returns 'True', e.g. when the line was used for
+            progress reporting.
+        max_output_lines (Optional[int]): Number of last lines of output
+            kept in memory. All lines are kept if 'None' is passed.
+        **kwargs: Arbitrary keyword arguments passed to Popen. Is possible to
+            pass `logging.Logger` object under "logger" to use custom logger
+            for output and priority for tool scheduler under
+            "tool_priority".
+
+    Returns:
+        str: Last lines of output of subprocess.
+
+    Raises:
+        RuntimeError: Exception is raised if process finished with nonzero
+            return code.
+
+    """
+    args, kwargs, logger, tool_slot = _prepare_subprocess_kwargs(
+        args, kwargs
+    )
+
+    kwargs["stdout"] = subprocess.PIPE
+    kwargs["stderr"] = subprocess.STDOUT
+    kwargs["stdin"] = kwargs.get("stdin", subprocess.DEVNULL)
+
+    output_lines = collections.deque(maxlen=max_output_lines)
+    callback_failed = False
+    with tool_slot as slot:
+        proc = subprocess.Popen(*args, **kwargs)
+        with proc.stdout:
+            for raw_line in iter(proc.stdout.readline, b""):
+                line = raw_line.decode(
+                    "utf-8", errors="backslashreplace"
+                ).rstrip("\r\n")
+                if output_callback is not None and not callback_failed:
+                    try:
+                        if output_callback(line):
+                            continue
+                    except Exception:
+                        # Failing callback must not break the process
+                        callback_failed = True
+                        logger.warning(
+                            "Output callback failed", exc_info=True
+                        )
+                output_lines.append(line)
+                logger.debug(line)
+        proc.wait()
+        if slot is not None and proc.returncode != 0:
+            slot["failed"] = True
+
+    output = "\n".join(output_lines)
+    if proc.returncode != 0:
+        exc_msg = "Executing arguments was not successful: \"{}\"".format(args)
+        if output:
+            exc_msg += "\n\nOutput:\n{}".format(output)
+        raise RuntimeError(exc_msg)
+
+    return output
+
+
+def _prepare_subprocess_kwargs(args, kwargs):
+    """Prepare arguments of subprocess shared by subprocess runners.
+
+    Returns:
+        tuple[tuple, dict[str, Any], logging.Logger, Any]: Arguments and
+            keyword arguments for Popen, logger and context manager
+            holding slot of tool scheduler while process runs.
+
     """
     # Modify creation flags on windows to hide console window if in UI mode
     if (
@@ -133,40 +265,17 @@ def run_subprocess(*args, **kwargs):
     if logger is None:
         logger = Logger.get_logger("run_subprocess")
 
-    # set overrides
-    kwargs["stdout"] = kwargs.get("stdout", subprocess.PIPE)
-    kwargs["stderr"] = kwargs.get("stderr", subprocess.PIPE)
-    kwargs["stdin"] = kwargs.get("stdin", subprocess.PIPE)
     kwargs["env"] = filtered_env
 
-    proc = subprocess.Popen(*args, **kwargs)
-
-    full_output = ""
-    _stdout, _stderr = proc.communicate()
-    if _stdout:
-        _stdout = _stdout.decode("utf-8", errors="backslashreplace")
-        full_output += _stdout
-        logger.debug(_stdout)
-
-    if _stderr:
-        _stderr = _stderr.decode("utf-8", errors="backslashreplace")
-        # Add additional line break if output already contains stdout
-        if full_output:
-            full_output += "\n"
-        full_output += _stderr
-        logger.info(_stderr)
-
-    if proc.returncode != 0:
-        exc_msg = "Executing arguments was not successful: \"{}\"".format(args)
-        if _stdout:
-            exc_msg += "\n\nOutput:\n{}".format(_stdout)
-
-        if _stderr:
-            exc_msg += "Error:\n{}".format(_stderr)
-
-        raise RuntimeError(exc_msg)
-
-    return full_output
+    tool_priority = kwargs.pop("tool_priority", 0)
+    tool_name = None
+    if args:
+        tool_name = get_tool_name_from_args(args[0])
+    if tool_name is None:
+        tool_slot = contextlib.nullcontext()
+    else:
+        tool_slot = get_tool_scheduler().acquire(tool_name, tool_priority)
+    return args, kwargs, logger, tool_slot
 
 
 def clean_envs_for_ayon_process(env=None):
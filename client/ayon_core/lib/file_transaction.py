@@ -2,6 +2,7 @@ import os
 import logging
 import sys
 import errno
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from ayon_core.lib import create_hard_link
 
@@ -48,12 +49,22 @@ class FileTransaction:
 
     Warning:
         Any folders created during the transfer will not be removed.
+
+    Args:
+        log (Optional[logging.Logger]): Logger.
+        allow_queue_replacements (bool): Allow replacing source of already
+            queued destination.
+        max_workers (Optional[int]): Number of threads used to transfer
+            files. Files are transferred one by one by default, 'None' lets
+            'ThreadPoolExecutor' decide number of threads.
     """
 
     MODE_COPY = 0
     MODE_HARDLINK = 1
 
-    def __init__(self, log=None, allow_queue_replacements=False):
+    def __init__(
+        self, log=None, allow_queue_replacements=False, max_workers=1
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
@@ -65,6 +76,10 @@ class FileTransaction:
 
         # Destination file paths that a file was transferred to
         self._transferred = []
+        # Stat of transferred files captured right after the transfer
+        self._transferred_stats = {}
+
+        self._max_workers = max_workers
 
         # Backup file location mapping to original locations
         self._backup_to_original = {}
@@ -109,11 +124,24 @@ class FileTransaction:
         self._transfers[dst] = (src, opts)
 
     def process(self):
+        # Existence of destination files is resolved from one listing of
+        #   each destination directory instead of checking each file
+        existing_filenames_by_dir = {}
+        same_path_dsts = set()
         # Backup any existing files
         for dst, (src, _) in self._transfers.items():
             self.log.debug("Checking file ... {} -> {}".format(src, dst))
-            path_same = self._same_paths(src, dst)
-            if path_same or not os.path.exists(dst):
+            dst_exists = self._dst_exists(dst, existing_filenames_by_dir)
+            if dst_exists:
+                path_same = self._same_paths(src, dst)
+            else:
+                path_same = src == dst
+
+            if path_same:
+                same_path_dsts.add(dst)
+                continue
+
+            if not dst_exists:
                 continue
 
             # Backup original file
@@ -125,25 +153,53 @@ class FileTransaction:
             os.rename(dst, backup)
 
         # Copy the files to transfer
+        created_dirs = set()
+        transfers = []
         for dst, (src, opts) in self._transfers.items():
-            path_same = self._same_paths(src, dst)
-            if path_same:
+            if dst in same_path_dsts:
                 self.log.debug(
                     "Source and destination are same files {} -> {}".format(
                         src, dst))
                 continue
 
-            self._create_folder_for_file(dst)
-
-            if opts["mode"] == self.MODE_COPY:
-                self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
-            elif opts["mode"] == self.MODE_HARDLINK:
-                self.log.debug("Hardlinking file ... {} -> {}".format(
-                    src, dst))
-                create_hard_link(src, dst)
-
-            self._transferred.append(dst)
+            # Create each destination folder only once
+            dirname = os.path.dirname(dst)
+            if dirname not in created_dirs:
+                self._create_folder_for_file(dst)
+                created_dirs.add(dirname)
+
+            transfers.append((src, dst, opts))
+
+        if self._max_workers == 1 or len(transfers) < 2:
+            for src, dst, opts in transfers:
+                stat_result = self._transfer_file(src, dst, opts)
+                self._add_transferred(dst, stat_result)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        futures = {
+            executor.submit(self._transfer_file, src, dst, opts): dst
+            for src, dst, opts in transfers
+        }
+        try:
+            for future in as_completed(futures):
+                self._add_transferred(futures[future], future.result())
+
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            # Make sure files transferred by other threads are known
+            #   for rollback
+            for future, dst in futures.items():
+                if (
+                    future.done()
+                    and not future.cancelled()
+                    and future.exception() is None
+                    and dst not in self._transferred_stats
+                ):
+                    self._add_transferred(dst, future.result())
+            raise
+
+        executor.shutdown()
 
     def finalize(self):
         # Delete any backed up files
@@ -187,6 +243,26 @@ class FileTransaction:
                 exc_info=True)
             raise last_exc
 
+    def get_transferred_stat(self, path):
+        """Get stat of transferred file.
+
+        Stat is captured right after the file was transferred so it's not
+        needed to access the file again. Stat is read from disk for
+        files that were not transferred.
+
+        Args:
+            path (str): Destination path.
+
+        Returns:
+            os.stat_result: Stat of the file.
+
+        """
+        path = os.path.normpath(os.path.abspath(path))
+        stat_result = self._transferred_stats.get(path)
+        if stat_result is None:
+            stat_result = os.stat(path)
+        return stat_result
+
     @property
     def transferred(self):
         """Return the processed transfers destination paths"""
@@ -197,6 +273,20 @@ class FileTransaction:
         """Return the backup file paths"""
         return list(self._backup_to_original.keys())
 
+    def _transfer_file(self, src, dst, opts):
+        if opts["mode"] == self.MODE_COPY:
+            self.log.debug("Copying file ... {} -> {}".format(src, dst))
+            copyfile(src, dst)
+        elif opts["mode"] == self.MODE_HARDLINK:
+            self.log.debug("Hardlinking file ... {} -> {}".format(
+                src, dst))
+            create_hard_link(src, dst)
+        return os.stat(dst)
+
+    def _add_transferred(self, dst, stat_result):
+        self._transferred.append(dst)
+        self._transferred_stats[dst] = stat_result
+
     def _create_folder_for_file(self, path):
         dirname = os.path.dirname(path)
         try:
@@ -206,6 +296,32 @@ class FileTransaction:
                 self.log.critical("An unexpected error occurred.")
                 raise e
 
+    def _dst_exists(self, dst, existing_filenames_by_dir):
+        """Check if destination file exists using cached directory listing.
+
+        Args:
+            dst (str): Destination path.
+            existing_filenames_by_dir (dict[str, set[str]]): Cache of
+                existing filenames by directory.
+
+        Returns:
+            bool: Destination file exists.
+
+        """
+        dirname, filename = os.path.split(dst)
+        existing_filenames = existing_filenames_by_dir.get(dirname)
+        if existing_filenames is None:
+            existing_filenames = set()
+            try:
+                with os.scandir(dirname) as scan_iter:
+                    for entry in scan_iter:
+                        existing_filenames.add(os.path.normcase(entry.name))
+            except OSError:
+                # Directory does not exist (yet)
+                pass
+            existing_filenames_by_dir[dirname] = existing_filenames
+        return os.path.normcase(filename) in existing_filenames
+
     def _same_paths(self, src, dst):
         # handles same paths but with C:/project vs c:/project
         if os.path.exists(src) and os.path.exists(dst):
@@ -0,0 +1,330 @@
+"""Cache of media probe outputs.
+
+Outputs of probing tools like 'oiiotool --info' or 'ffprobe' are cached
+by real path, size and modification time of the probed file and by
+arguments used for probing. Cache is stored in memory of the process and
+optionally on disk so other processes can re-use it. Disk cache is enabled
+by setting 'AYON_MEDIA_PROBE_CACHE_DIR' environment variable to a
+directory path.
+"""
+import os
+import stat
+import json
+import hashlib
+import logging
+import tempfile
+import threading
+import collections
+
+CACHE_DIR_ENV_KEY = "AYON_MEDIA_PROBE_CACHE_DIR"
+
+
+class MediaProbeCache:
+    """Cache of media probe outputs.
+
+    Cached output is invalidated automatically when size or modification
+    time of the file changes. Files which can't be accessed, e.g. paths
+    with frame pattern, are not cached.
+
+    Args:
+        cache_dir (Optional[str]): Directory where cache is stored on disk.
+            Cache is only in memory if not passed.
+        max_items (Optional[int]): Maximum number of outputs kept
+            in memory.
+
+    """
+    default_max_items = 1024
+
+    def __init__(self, cache_dir=None, max_items=None):
+        if max_items is None:
+            max_items = self.default_max_items
+        self._log = None
+        self._lock = threading.Lock()
+        self._outputs = collections.OrderedDict()
+        self._cache_dir = cache_dir
+        self._max_items = max_items
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._uncached = 0
+
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = logging.getLogger(self.__class__.__name__)
+        return self._log
+
+    @property
+    def cache_dir(self):
+        return self._cache_dir
+
+    def set_cache_dir(self, cache_dir):
+        """Change directory of disk cache.
+
+        Args:
+            cache_dir (Optional[str]): Directory path. Disk cache is disabled
+                if 'None' is passed.
+
+        """
+        self._cache_dir = cache_dir
+
+    @staticmethod
+    def get_file_key(filepath):
+        """Get cache key of a file.
+
+        Args:
+            filepath (str): Path to file.
+
+        Returns:
+            Union[tuple[str, int, int], None]: Real path, size and
+                modification time of file or 'None' if file can't be
+                accessed.
+
+        """
+        try:
+            realpath = os.path.realpath(filepath)
+            stat_result = os.stat(realpath)
+        except (OSError, ValueError):
+            return None
+
+        if not stat.S_ISREG(stat_result.st_mode):
+            return None
+        return (
+            os.path.normcase(realpath),
+            stat_result.st_size,
+            stat_result.st_mtime_ns,
+        )
+
+    def get(self, filepath, probe_args):
+        """Get cached output of a probe.
+
+        Args:
+            filepath (str): Path to probed file.
+            probe_args (Iterable[str]): Arguments used for probing without
+                the file path.
+
+        Returns:
+            Union[str, None]: Cached output or 'None' if output is not
+                cached.
+
+        """
+        key = self._get_key(filepath, probe_args)
+        if key is None:
+            with self._lock:
+                self._uncached += 1
+            return None
+
+        with self._lock:
+            output = self._outputs.get(key)
+            if output is not None:
+                self._outputs.move_to_end(key)
+                self._hits += 1
+                return output
+
+        output = self._read_from_disk(key)
+        with self._lock:
+            if output is None:
+                self._misses += 1
+            else:
+                self._disk_hits += 1
+                self._store(key, output)
+        return output
+
+    def set(self, filepath, probe_args, output):
+        """Store output of a probe.
+
+        Args:
+            filepath (str): Path to probed file.
+            probe_args (Iterable[str]): Arguments used for probing without
+                the file path.
+            output (str): Output of the probe.
+
+        """
+        key = self._get_key(filepath, probe_args)
+        if key is None:
+            return
+        with self._lock:
+            self._store(key, output)
+        self._write_to_disk(key, output)
+
+    def invalidate(self, filepath=None):
+        """Invalidate cached outputs.
+
+        Args:
+            filepath (Optional[str]): Invalidate only outputs of the file.
+                Whole cache, including disk cache, is invalidated if
+                not passed.
+
+        """
+        if filepath is None:
+            with self._lock:
+                self._outputs.clear()
+            self._remove_from_disk(None)
+            return
+
+        path = os.path.normcase(os.path.realpath(filepath))
+        with self._lock:
+            for key in tuple(self._outputs.keys()):
+                if key[0] == path:
+                    self._outputs.pop(key)
+        self._remove_from_disk(path)
+
+    def get_stats(self):
+        """Statistics of cache usage.
+
+        Returns:
+            dict[str, Union[int, float]]: Number of memory hits, disk hits,
+                misses, uncached probes, items in memory and hit rate.
+
+        """
+        with self._lock:
+            hits = self._hits + self._disk_hits
+            total = hits + self._misses + self._uncached
+            hit_rate = 0.0
+            if total:
+                hit_rate = hits / total
+            return {
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "uncached": self._uncached,
+                "items": len(self._outputs),
+                "hit_rate": hit_rate,
+            }
+
+    def reset_stats(self):
+        """Reset statistics of cache usage."""
+        with self._lock:
+            self._hits = 0
+            self._disk_hits = 0
+            self._misses = 0
+            self._uncached = 0
+
+    def _get_key(self, filepath, probe_args):
+        file_key = self.get_file_key(filepath)
+        if file_key is None:
+            return None
+        return file_key + (tuple(probe_args), )
+
+    def _store(self, key, output):
+        self._outputs[key] = output
+        self._outputs.move_to_end(key)
+        while len(self._outputs) > self._max_items:
+            self._outputs.popitem(last=False)
+
+    @staticmethod
+    def _hash(value):
+        return hashlib.sha1(value.encode("utf-8")).hexdigest()
+
+    def _get_disk_path(self, key):
+        """Path to disk cache file of a key.
+
+        Outputs are grouped in a directory by file path so all outputs of
+        a file can be invalidated at once.
+        """
+        if not self._cache_dir:
+            return None
+        path, size, mtime_ns, probe_args = key
+        return os.path.join(
+            self._cache_dir,
+            self._hash(path),
+            "{}.json".format(
+                self._hash(json.dumps([size, mtime_ns, probe_args]))
+            )
+        )
+
+    def _read_from_disk(self, key):
+        cache_path = self._get_disk_path(key)
+        if not cache_path or not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, "r") as stream:
+                return json.load(stream)["output"]
+        except Exception:
+            self.log.debug(
+                "Failed to read probe cache file \"{}\"".format(cache_path),
+                exc_info=True
+            )
+        return None
+
+    def _write_to_disk(self, key, output):
+        cache_path = self._get_disk_path(key)
+        if not cache_path:
+            return
+        dirpath = os.path.dirname(cache_path)
+        try:
+            os.makedirs(dirpath, exist_ok=True)
+            # Write to temp file first so other processes never read
+            #   partially written file
+            fd, tmp_path = tempfile.mkstemp(dir=dirpath, suffix=".tmp")
+            with os.fdopen(fd, "w") as stream:
+                json.dump({"path": key[0], "output": output}, stream)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            self.log.debug(
+                "Failed to write probe cache file \"{}\"".format(cache_path),
+                exc_info=True
+            )
+
+    def _remove_from_disk(self, path):
+        if not self._cache_dir or not os.path.exists(self._cache_dir):
+            return
+        if path is None:
+            dirpaths = [
+                os.path.join(self._cache_dir, dirname)
+                for dirname in os.listdir(self._cache_dir)
+            ]
+        else:
+            dirpaths = [os.path.join(self._cache_dir, self._hash(path))]
+
+        for dirpath in dirpaths:
+            if not os.path.isdir(dirpath):
+                continue
+            for filename in os.listdir(dirpath):
+                try:
+                    os.remove(os.path.join(dirpath, filename))
+                except OSError:
+                    pass
+            try:
+                os.rmdir(dirpath)
+            except OSError:
+                pass
+
+
+_MEDIA_PROBE_CACHE = None
+
+
+def get_media_probe_cache():
+    """Process wide media probe cache.
+
+    Returns:
+        MediaProbeCache: Media probe cache.
+
+    """
+    global _MEDIA_PROBE_CACHE
+    if _MEDIA_PROBE_CACHE is None:
+        _MEDIA_PROBE_CACHE = MediaProbeCache(
+            os.getenv(CACHE_DIR_ENV_KEY) or None
+        )
+    return _MEDIA_PROBE_CACHE
+
+
+def invalidate_media_probe_cache(filepath=None):
+    """Invalidate cached probe outputs.
+
+    Args:
+        filepath (Optional[str]): Invalidate only outputs of the file.
+            Whole cache is invalidated if not passed.
+
+    """
+    get_media_probe_cache().invalidate(filepath)
+
+
+def get_media_probe_cache_stats():
+    """Statistics of media probe cache usage.
+
+    Returns:
+        dict[str, Union[int, float]]: Cache statistics.
+
+    """
+    return get_media_probe_cache().get_stats()
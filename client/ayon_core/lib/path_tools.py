@@ -65,6 +65,49 @@ def create_hard_link(src_path, dst_path):
     )
 
 
+def create_file_link(src_path, dst_path, allow_symlink=True):
+    """Create link of file so its data don't have to be copied.
+
+    Hardlink is created if possible. Symlink is used as fallback, e.g. when
+    source is on different device.
+
+    Args:
+        src_path (str): Full path to a file which is used as source of link.
+        dst_path (str): Full path to a file where a link of source will be
+            added.
+        allow_symlink (Optional[bool]): Symlink can be created if hardlink
+            can't.
+
+    Returns:
+        bool: Link was created. Caller should copy the file if not.
+    """
+    try:
+        create_hard_link(src_path, dst_path)
+        return True
+    except (OSError, NotImplementedError):
+        log.debug(
+            "Failed to create hardlink \"{}\" -> \"{}\"".format(
+                src_path, dst_path
+            ),
+            exc_info=True
+        )
+
+    if not allow_symlink:
+        return False
+
+    try:
+        os.symlink(os.path.abspath(src_path), dst_path)
+        return True
+    except (OSError, NotImplementedError):
+        log.debug(
+            "Failed to create symlink \"{}\" -> \"{}\"".format(
+                src_path, dst_path
+            ),
+            exc_info=True
+        )
+    return False
+
+
 def collect_frames(files):
     """Returns dict of source path and its frame, if from sequence
 
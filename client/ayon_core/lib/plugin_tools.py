@@ -132,7 +132,7 @@ def prepare_template_data(fill_pairs):
     return output
 
 
-def source_hash(filepath, *args):
+def source_hash(filepath, *args, stat_result=None):
     """Generate simple identifier for a source file.
     This is used to identify whether a source file has previously been
     processe into the pipeline, e.g. a texture.
@@ -143,11 +143,15 @@ def source_hash(filepath, *args):
     faster and predictable enough for all our production use cases.
     Args:
         filepath (str): The source file path.
+        stat_result (Optional[os.stat_result]): Already known stat of the
+            file. File is not accessed if passed.
     You can specify additional arguments in the function
     to allow for specific 'processing' values to be included.
     """
+    if stat_result is None:
+        stat_result = os.stat(filepath)
     # We replace dots with comma because . cannot be a key in a pymongo dict.
     file_name = os.path.basename(filepath)
-    time = str(os.path.getmtime(filepath))
-    size = str(os.path.getsize(filepath))
+    time = str(stat_result.st_mtime)
+    size = str(stat_result.st_size)
     return "|".join([file_name, time, size] + list(args)).replace(".", ",")
@@ -1,7 +1,38 @@
 # -*- coding: utf-8 -*-
-"""Provide profiling decorator."""
+"""Provide profiling decorator and environment driven session profiling.
+
+Session profiling is enabled by environment variable 'AYON_PROFILE_DIR'
+with path to directory where outputs are stored, so slow sessions can be
+profiled without code changes. Outputs can be limited with environment
+variable 'AYON_PROFILE_MODES', comma separated list of modes:
+
+- 'cprofile': cProfile stats of main thread ('.prof' file).
+- 'importtime': Import times in format of 'python -X importtime'
+    ('_importtime.log' file).
+- 'phases': Summary of timed phases, e.g. addons load, settings fetch,
+    plugin discovery or publishing ('_phases.json' file).
+
+All modes are enabled if 'AYON_PROFILE_MODES' is not set. Outputs are
+written on process exit to files prefixed with session name and process
+id. Entry points start session with 'start_session_profiling', phases
+are timed with 'profile_phase'.
+"""
 import os
+import sys
+import json
+import time
+import atexit
+import logging
 import cProfile
+import importlib.abc
+import threading
+import contextlib
+
+PROFILE_DIR_ENV_KEY = "AYON_PROFILE_DIR"
+PROFILE_MODES_ENV_KEY = "AYON_PROFILE_MODES"
+PROFILE_MODES = ("cprofile", "importtime", "phases")
+
+log = logging.getLogger(__name__)
 
 
 def do_profile(fn, to_file=None):
@@ -27,3 +58,352 @@ def do_profile(fn, to_file=None):
                 profiler.dump_stats(to_file)
             else:
                 profiler.print_stats()
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """Measure execution time of imported modules.
+
+    Finder is added to start of 'sys.meta_path', uses other finders to find
+    module spec and wraps 'exec_module' of its loader. Builtin and frozen
+    modules are not measured.
+    """
+    def __init__(self):
+        self.records = []
+        self._local = threading.local()
+
+    def install(self):
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path=None, target=None):
+        local = self._local
+        if getattr(local, "finding", False):
+            return None
+
+        local.finding = True
+        spec = None
+        try:
+            for finder in sys.meta_path:
+                if finder is self:
+                    continue
+                find_spec = getattr(finder, "find_spec", None)
+                if find_spec is None:
+                    continue
+                spec = find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+        finally:
+            local.finding = False
+
+        loader = spec.loader if spec is not None else None
+        if (
+            loader is None
+            # Builtin and frozen importers are shared classes
+            or isinstance(loader, type)
+            or not hasattr(loader, "exec_module")
+        ):
+            return spec
+
+        try:
+            loader.exec_module = self._wrap_exec_module(
+                fullname, loader.exec_module
+            )
+        except AttributeError:
+            pass
+        return spec
+
+    def _get_stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+        return stack
+
+    def _wrap_exec_module(self, fullname, exec_module):
+        def timed_exec_module(module):
+            stack = self._get_stack()
+            # Time spent in imports of child modules
+            stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                cumulative = time.perf_counter() - start
+                children = stack.pop()
+                if stack:
+                    stack[-1] += cumulative
+                self.records.append(
+                    (fullname, cumulative - children, cumulative, len(stack))
+                )
+        return timed_exec_module
+
+    def write(self, filepath):
+        lines = ["import time: self [us] | cumulative | imported package"]
+        for fullname, self_time, cumulative, depth in list(self.records):
+            lines.append("import time: {:>9} | {:>10} | {}{}".format(
+                int(self_time * 1000000),
+                int(cumulative * 1000000),
+                "  " * depth,
+                fullname
+            ))
+        with open(filepath, "w") as stream:
+            stream.write("\n".join(lines) + "\n")
+
+
+class _ProfilingState:
+    lock = threading.RLock()
+    modes = None
+    output_dir = None
+    session_name = None
+    start_time = time.time()
+    profiler = None
+    import_timer = None
+    # Timings of phases by name, in order of first occurrence
+    phases = {}
+    writer_registered = False
+
+
+def _get_profiling_modes():
+    if _ProfilingState.modes is not None:
+        return _ProfilingState.modes
+
+    modes = set()
+    output_dir = os.getenv(PROFILE_DIR_ENV_KEY)
+    if output_dir:
+        modes_value = os.getenv(PROFILE_MODES_ENV_KEY)
+        if modes_value:
+            modes = {
+                mode.strip().lower()
+                for mode in modes_value.split(",")
+            }.intersection(PROFILE_MODES)
+        else:
+            modes = set(PROFILE_MODES)
+        _ProfilingState.output_dir = os.path.abspath(output_dir)
+    _ProfilingState.modes = modes
+    return modes
+
+
+def is_profiling_enabled(mode=None):
+    """Is session profiling enabled by environment variables.
+
+    Args:
+        mode (Optional[str]): Check specific mode, one of 'PROFILE_MODES'.
+            Any mode is checked if not passed.
+
+    Returns:
+        bool: Profiling is enabled.
+
+    """
+    modes = _get_profiling_modes()
+    if mode is None:
+        return bool(modes)
+    return mode in modes
+
+
+def get_profiling_dir():
+    """Directory where profiling outputs are stored.
+
+    Returns:
+        Union[str, None]: Path to directory or None if profiling is
+            disabled.
+
+    """
+    if not is_profiling_enabled():
+        return None
+    return _ProfilingState.output_dir
+
+
+def _register_writer():
+    if not _ProfilingState.writer_registered:
+        _ProfilingState.writer_registered = True
+        atexit.register(stop_session_profiling)
+
+
+def start_session_profiling(session_name):
+    """Start profiling of a session if enabled by environment variables.
+
+    Only the first started session in a process is profiled, e.g. publish
+    started from command line is part of session of the command line.
+    Outputs are written on process exit.
+
+    Args:
+        session_name (str): Name of session used in names of output files,
+            e.g. 'publish' or 'host_maya'.
+
+    Returns:
+        bool: Session profiling was started.
+
+    """
+    modes = _get_profiling_modes()
+    if not modes:
+        return False
+
+    with _ProfilingState.lock:
+        if _ProfilingState.session_name is not None:
+            return False
+        _ProfilingState.session_name = session_name
+        _ProfilingState.start_time = time.time()
+
+        if "importtime" in modes:
+            import_timer = _ImportTimer()
+            import_timer.install()
+            _ProfilingState.import_timer = import_timer
+
+        if "cprofile" in modes:
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+                _ProfilingState.profiler = profiler
+            except ValueError:
+                # Other profiler is already active
+                log.warning(
+                    "Failed to start cProfile of session '{}'".format(
+                        session_name),
+                    exc_info=True
+                )
+        _register_writer()
+    log.debug("Profiling of session '{}' started, outputs to '{}'".format(
+        session_name, _ProfilingState.output_dir
+    ))
+    return True
+
+
+@contextlib.contextmanager
+def profile_phase(phase_name):
+    """Measure time of a phase if phases profiling is enabled.
+
+    Phases can be nested, time of nested phase is also included in time
+    of parent phase. Can be used as context manager or decorator.
+
+    Example:
+        >>> with profile_phase("plugin_discovery"):
+        ...     plugins = discover_plugins()
+
+    Args:
+        phase_name (str): Name of phase, e.g. 'addons_load'.
+
+    """
+    if not is_profiling_enabled("phases"):
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start
+        with _ProfilingState.lock:
+            phase = _ProfilingState.phases.get(phase_name)
+            if phase is None:
+                phase = {
+                    "name": phase_name,
+                    "count": 0,
+                    "total": 0.0,
+                    "min": duration,
+                    "max": duration,
+                }
+                _ProfilingState.phases[phase_name] = phase
+            phase["count"] += 1
+            phase["total"] += duration
+            phase["min"] = min(phase["min"], duration)
+            phase["max"] = max(phase["max"], duration)
+            _register_writer()
+
+
+def get_phase_timings():
+    """Timings of profiled phases in current process.
+
+    Returns:
+        list[dict[str, Any]]: Name, count of runs, total, minimum and
+            maximum duration in seconds of phases in order of first run.
+
+    """
+    with _ProfilingState.lock:
+        return [
+            dict(phase)
+            for phase in _ProfilingState.phases.values()
+        ]
+
+
+def write_profiling_outputs():
+    """Write profiling outputs of current process.
+
+    Outputs are written on process exit automatically. This can be used
+    when process is not terminated gracefully, e.g. by some hosts.
+
+    Returns:
+        list[str]: Paths to written files.
+
+    """
+    return _write_outputs(stop=False)
+
+
+def stop_session_profiling():
+    """Stop profiling of session and write outputs.
+
+    Returns:
+        list[str]: Paths to written files.
+
+    """
+    return _write_outputs(stop=True)
+
+
+def _write_outputs(stop):
+    output_dir = get_profiling_dir()
+    if not output_dir:
+        return []
+
+    with _ProfilingState.lock:
+        session_name = _ProfilingState.session_name or "ayon"
+        prefix = os.path.join(
+            output_dir, "{}_{}".format(session_name, os.getpid())
+        )
+        profiler = _ProfilingState.profiler
+        import_timer = _ProfilingState.import_timer
+        if stop:
+            _ProfilingState.profiler = None
+            _ProfilingState.import_timer = None
+            if import_timer is not None:
+                import_timer.uninstall()
+
+        filepaths = []
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+            if profiler is not None:
+                filepath = prefix + ".prof"
+                # Dump of stats disables profiler
+                profiler.dump_stats(filepath)
+                if not stop:
+                    profiler.enable()
+                filepaths.append(filepath)
+
+            if import_timer is not None:
+                filepath = prefix + "_importtime.log"
+                import_timer.write(filepath)
+                filepaths.append(filepath)
+
+            if _ProfilingState.phases:
+                filepath = prefix + "_phases.json"
+                data = {
+                    "session": session_name,
+                    "pid": os.getpid(),
+                    "argv": list(sys.argv),
+                    "start_time": _ProfilingState.start_time,
+                    "duration": time.time() - _ProfilingState.start_time,
+                    "phases": get_phase_timings(),
+                }
+                with open(filepath, "w") as stream:
+                    json.dump(data, stream, indent=4)
+                filepaths.append(filepath)
+
+        except (OSError, ValueError):
+            log.warning(
+                "Failed to write profiling outputs to '{}'".format(
+                    output_dir),
+                exc_info=True
+            )
+    return filepaths
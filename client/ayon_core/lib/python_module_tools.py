@@ -1,12 +1,19 @@
 import os
 import sys
+import copy
 import types
 import importlib
 import inspect
 import logging
+import threading
 
 log = logging.getLogger(__name__)
 
+# Class attributes which can't be restored
+_NOT_RESTORED_CLASS_ATTRS = {"__dict__", "__weakref__"}
+# Types of class attribute values which can be modified in place
+_MUTABLE_CLASS_ATTR_TYPES = (list, dict, set)
+
 
 def import_filepath(filepath, module_name=None):
     """Import python file as python module.
@@ -32,11 +39,149 @@ def import_filepath(filepath, module_name=None):
     return module
 
 
-def modules_from_path(folder_path):
+class _ImportedFilepaths:
+    """Modules imported by 'import_filepath_cached'."""
+    lock = threading.Lock()
+    # '(filepath, module name)' -> (file key, module, classes snapshot)
+    modules = {}
+
+
+def _get_filepath_key(filepath):
+    stat_result = os.stat(filepath)
+    return stat_result.st_size, stat_result.st_mtime_ns
+
+
+def _deepcopy_values(values):
+    try:
+        return copy.deepcopy(values)
+    except Exception:
+        log.debug("Failed to copy class attributes", exc_info=True)
+        return None
+
+
+def _get_classes_snapshot(module):
+    """Copy of attributes of classes defined in module.
+
+    Lists, dictionaries and sets are deep copied, so their changes in
+    place can be reverted too.
+    """
+    output = []
+    for obj in tuple(vars(module).values()):
+        if not inspect.isclass(obj) or obj.__module__ != module.__name__:
+            continue
+        attrs = dict(vars(obj))
+        mutable_attrs = _deepcopy_values({
+            key: value
+            for key, value in attrs.items()
+            if isinstance(value, _MUTABLE_CLASS_ATTR_TYPES)
+        })
+        if mutable_attrs is None:
+            mutable_attrs = {}
+        output.append((obj, attrs, mutable_attrs))
+    return output
+
+
+def _restore_classes(classes_snapshot):
+    """Restore class attributes changed after import.
+
+    Plugins can have changed class attributes, e.g. by applied settings,
+    so reused module must behave same as freshly imported module. That
+    includes changes in place of lists, dictionaries and sets, other
+    objects are only set back to the class.
+    """
+    for cls, attrs, mutable_attrs in classes_snapshot:
+        for key in tuple(vars(cls).keys()):
+            if key not in attrs and key not in _NOT_RESTORED_CLASS_ATTRS:
+                delattr(cls, key)
+
+        # Copy again so changes of restored values don't affect snapshot
+        mutable_attrs = _deepcopy_values(mutable_attrs) or {}
+        for key, value in attrs.items():
+            if key in _NOT_RESTORED_CLASS_ATTRS:
+                continue
+            if key in mutable_attrs:
+                value = mutable_attrs[key]
+            elif vars(cls).get(key) is value:
+                continue
+            try:
+                setattr(cls, key, value)
+            except (AttributeError, TypeError):
+                pass
+
+
+def import_filepath_cached(filepath, module_name=None, force_reload=False):
+    """Import python file as python module and reuse it if file is unchanged.
+
+    Module is imported again only if size or modification time of the file
+    changed. Class attributes of classes defined in reused module are
+    restored to values they had right after import.
+
+    Args:
+        filepath (str): Path to python file.
+        module_name (Optional[str]): Name of loaded module. By default
+            is filled with filename of filepath.
+        force_reload (Optional[bool]): Import the file even if it did
+            not change.
+
+    Returns:
+        types.ModuleType: Imported module.
+
+    """
+    if module_name is None:
+        module_name = os.path.splitext(os.path.basename(filepath))[0]
+
+    key = (os.path.normpath(filepath), module_name)
+    file_key = _get_filepath_key(filepath)
+    with _ImportedFilepaths.lock:
+        cached = _ImportedFilepaths.modules.get(key)
+
+    if not force_reload and cached is not None and cached[0] == file_key:
+        _, module, classes_snapshot = cached
+        _restore_classes(classes_snapshot)
+        return module
+
+    try:
+        module = import_filepath(filepath, module_name)
+    except Exception:
+        with _ImportedFilepaths.lock:
+            _ImportedFilepaths.modules.pop(key, None)
+        raise
+
+    with _ImportedFilepaths.lock:
+        _ImportedFilepaths.modules[key] = (
+            file_key, module, _get_classes_snapshot(module)
+        )
+    return module
+
+
+def clear_imported_filepaths_cache(filepath=None):
+    """Clear cache of modules imported by 'import_filepath_cached'.
+
+    Args:
+        filepath (Optional[str]): Clear only modules imported from the
+            file. Whole cache is cleared if not passed.
+
+    """
+    with _ImportedFilepaths.lock:
+        if filepath is None:
+            _ImportedFilepaths.modules.clear()
+            return
+
+        filepath = os.path.normpath(filepath)
+        for key in tuple(_ImportedFilepaths.modules.keys()):
+            if key[0] == filepath:
+                _ImportedFilepaths.modules.pop(key)
+
+
+def modules_from_path(folder_path, use_cache=False, force_reload=False):
     """Get python scripts as modules from a path.
 
     Arguments:
         path (str): Path to folder containing python scripts.
+        use_cache (Optional[bool]): Reuse modules of files which did not
+            change since previous import with cache.
+        force_reload (Optional[bool]): Import all files again and update
+            cache. Used only with 'use_cache'.
 
     Returns:
         tuple<list, list>: First list contains successfully imported modules
@@ -76,7 +221,12 @@ def modules_from_path(folder_path):
             continue
 
         try:
-            module = import_filepath(full_path, mod_name)
+            if use_cache:
+                module = import_filepath_cached(
+                    full_path, mod_name, force_reload
+                )
+            else:
+                module = import_filepath(full_path, mod_name)
             modules.append((full_path, module))
 
         except Exception:
@@ -0,0 +1,399 @@
+"""Process wide scheduler of external media tools.
+
+Media tools like 'ffmpeg' or 'oiiotool' are often started concurrently from
+multiple threads, e.g. by publish plugins converting sequences in chunks.
+Scheduler caps number of concurrently running processes, globally and per
+tool, and can wait for free memory or low system load before starting
+another process. Waiting processes are started by priority.
+
+Subprocess runners in 'ayon_core.lib.execute' use the scheduler
+automatically for recognized tools.
+
+Limits can be changed with 'configure_tool_scheduler' or with environment
+variables 'AYON_TOOL_MAX_PROCESSES', 'AYON_TOOL_MIN_FREE_MEMORY_MB' and
+'AYON_TOOL_MAX_LOAD_FACTOR'.
+"""
+import os
+import time
+import shlex
+import logging
+import platform
+import itertools
+import threading
+import contextlib
+import collections
+
+# Tools that are scheduled by executable name
+SCHEDULED_TOOL_NAMES = {"ffmpeg", "oiiotool"}
+
+
+def get_tool_name_from_args(args):
+    """Name of scheduled tool executed by subprocess arguments.
+
+    Args:
+        args (Union[str, list[str]]): Arguments passed to Popen.
+
+    Returns:
+        Union[str, None]: Tool name or None if arguments don't execute
+            scheduled tool.
+
+    """
+    if isinstance(args, str):
+        try:
+            args = shlex.split(
+                args, posix=platform.system().lower() != "windows"
+            )
+        except ValueError:
+            args = args.split(" ")
+
+    if not args or not isinstance(args[0], str):
+        return None
+    executable = args[0].strip("\"'")
+    name = os.path.splitext(os.path.basename(executable))[0].lower()
+    if name in SCHEDULED_TOOL_NAMES:
+        return name
+    return None
+
+
+def _get_available_memory_mb():
+    """Available system memory in megabytes.
+
+    Returns:
+        Union[float, None]: Available memory or None if it can't be
+            detected.
+
+    """
+    try:
+        import psutil
+
+        return psutil.virtual_memory().available / (1024 * 1024)
+    except Exception:
+        pass
+
+    try:
+        with open("/proc/meminfo", "r") as stream:
+            for line in stream:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _get_load_factor():
+    """System load average per CPU core.
+
+    Returns:
+        Union[float, None]: Load per core or None if it can't be detected.
+
+    """
+    if not hasattr(os, "getloadavg"):
+        return None
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except OSError:
+        return None
+
+
+class ToolScheduler:
+    """Limit concurrently running external tool processes.
+
+    Process is always started if nothing is running, so system resources
+    only delay processes but never block them completely.
+
+    Args:
+        max_processes (Optional[int]): Maximum number of all concurrently
+            running processes. Number of CPU cores is used if not set.
+        tool_limits (Optional[dict[str, int]]): Maximum number of
+            concurrently running processes per tool.
+        min_free_memory_mb (Optional[int]): Don't start process if there
+            is less available memory.
+        max_load_factor (Optional[float]): Don't start process if system
+            load per CPU core is higher.
+
+    """
+    poll_interval = 0.5
+
+    def __init__(
+        self,
+        max_processes=None,
+        tool_limits=None,
+        min_free_memory_mb=None,
+        max_load_factor=None,
+    ):
+        self._log = None
+        self._condition = threading.Condition()
+        self._counter = itertools.count()
+        # Waiting tickets '(-priority, order)' with tool name
+        self._waiting = {}
+        self._running = collections.Counter()
+        self._stats = {}
+        self._max_processes = None
+        self._tool_limits = {}
+        self._min_free_memory_mb = 0
+        self._max_load_factor = 0.0
+        self.configure(
+            max_processes,
+            tool_limits,
+            min_free_memory_mb,
+            max_load_factor,
+        )
+
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = logging.getLogger(self.__class__.__name__)
+        return self._log
+
+    def configure(
+        self,
+        max_processes=None,
+        tool_limits=None,
+        min_free_memory_mb=None,
+        max_load_factor=None,
+    ):
+        """Change limits of scheduler.
+
+        Values which are not passed are not changed. Value '0' of
+        'max_processes' uses number of CPU cores.
+
+        """
+        with self._condition:
+            if max_processes is not None:
+                self._max_processes = max_processes or None
+            if tool_limits is not None:
+                self._tool_limits = {
+                    name: limit
+                    for name, limit in tool_limits.items()
+                    if limit
+                }
+            if min_free_memory_mb is not None:
+                self._min_free_memory_mb = min_free_memory_mb
+            if max_load_factor is not None:
+                self._max_load_factor = max_load_factor
+            self._condition.notify_all()
+
+    def get_max_processes(self):
+        if self._max_processes:
+            return self._max_processes
+        return os.cpu_count() or 1
+
+    def get_limit(self, tool_name=None):
+        """Maximum number of concurrently running processes of a tool.
+
+        Args:
+            tool_name (Optional[str]): Name of tool. Global limit is
+                returned if not passed.
+
+        Returns:
+            int: Maximum number of processes.
+
+        """
+        max_processes = self.get_max_processes()
+        tool_limit = self._tool_limits.get(tool_name)
+        if tool_limit:
+            return min(tool_limit, max_processes)
+        return max_processes
+
+    @contextlib.contextmanager
+    def acquire(self, tool_name, priority=0):
+        """Wait until tool process can be started.
+
+        Yielded slot is a dictionary where "failed" key can be set to
+        'True' when process failed without raising an exception.
+
+        Args:
+            tool_name (str): Name of tool.
+            priority (Optional[int]): Processes with higher priority are
+                started first.
+
+        """
+        ticket = (-priority, next(self._counter))
+        wait_start = time.time()
+        with self._condition:
+            self._waiting[ticket] = tool_name
+            try:
+                while not self._can_start(ticket, tool_name):
+                    self._condition.wait(self.poll_interval)
+            finally:
+                self._waiting.pop(ticket)
+            self._running[tool_name] += 1
+            stats = self._get_tool_stats(tool_name)
+            stats["processes"] += 1
+            stats["wait_time"] += time.time() - wait_start
+            stats["max_concurrent"] = max(
+                stats["max_concurrent"], self._running[tool_name]
+            )
+
+        slot = {"tool": tool_name, "failed": False}
+        run_start = time.time()
+        try:
+            yield slot
+
+        except BaseException:
+            slot["failed"] = True
+            raise
+
+        finally:
+            with self._condition:
+                self._running[tool_name] -= 1
+                stats = self._get_tool_stats(tool_name)
+                stats["run_time"] += time.time() - run_start
+                if slot["failed"]:
+                    stats["failed"] += 1
+                self._condition.notify_all()
+
+    def get_stats(self):
+        """Statistics of scheduled processes per tool.
+
+        Returns:
+            dict[str, dict[str, Union[int, float]]]: Number of processes,
+                failed processes, running and waiting processes, maximum
+                of concurrently running processes, total wait and run time
+                in seconds.
+
+        """
+        with self._condition:
+            output = {}
+            for tool_name, stats in self._stats.items():
+                tool_stats = dict(stats)
+                tool_stats["running"] = self._running[tool_name]
+                tool_stats["waiting"] = sum(
+                    1
+                    for name in self._waiting.values()
+                    if name == tool_name
+                )
+                output[tool_name] = tool_stats
+            return output
+
+    def reset_stats(self):
+        with self._condition:
+            self._stats = {}
+
+    def _get_tool_stats(self, tool_name):
+        stats = self._stats.get(tool_name)
+        if stats is None:
+            stats = {
+                "processes": 0,
+                "failed": 0,
+                "max_concurrent": 0,
+                "wait_time": 0.0,
+                "run_time": 0.0,
+            }
+            self._stats[tool_name] = stats
+        return stats
+
+    def _has_capacity(self, tool_name):
+        running_total = sum(self._running.values())
+        if running_total >= self.get_max_processes():
+            return False
+        return self._running[tool_name] < self.get_limit(tool_name)
+
+    def _can_start(self, ticket, tool_name):
+        if not self._has_capacity(tool_name):
+            return False
+
+        # Waiting process with higher priority which could start goes first
+        for other_ticket, other_tool_name in self._waiting.items():
+            if (
+                other_ticket < ticket
+                and self._has_capacity(other_tool_name)
+            ):
+                return False
+
+        # Always start if nothing is running
+        if not any(self._running.values()):
+            return True
+
+        if self._min_free_memory_mb:
+            available = _get_available_memory_mb()
+            if (
+                available is not None
+                and available < self._min_free_memory_mb
+            ):
+                return False
+
+        if self._max_load_factor:
+            load_factor = _get_load_factor()
+            if (
+                load_factor is not None
+                and load_factor > self._max_load_factor
+            ):
+                return False
+        return True
+
+
+_TOOL_SCHEDULER = None
+_TOOL_SCHEDULER_LOCK = threading.Lock()
+
+
+def _get_env_number(key, value_type):
+    value = os.getenv(key)
+    if not value:
+        return None
+    try:
+        return value_type(value)
+    except ValueError:
+        return None
+
+
+def get_tool_scheduler():
+    """Process wide tool scheduler.
+
+    Returns:
+        ToolScheduler: Tool scheduler.
+
+    """
+    global _TOOL_SCHEDULER
+    if _TOOL_SCHEDULER is None:
+        with _TOOL_SCHEDULER_LOCK:
+            if _TOOL_SCHEDULER is None:
+                _TOOL_SCHEDULER = ToolScheduler(
+                    _get_env_number("AYON_TOOL_MAX_PROCESSES", int),
+                    min_free_memory_mb=_get_env_number(
+                        "AYON_TOOL_MIN_FREE_MEMORY_MB", int
+                    ),
+                    max_load_factor=_get_env_number(
+                        "AYON_TOOL_MAX_LOAD_FACTOR", float
+                    ),
+                )
+    return _TOOL_SCHEDULER
+
+
+def configure_tool_scheduler(
+    max_processes=None,
+    tool_limits=None,
+    min_free_memory_mb=None,
+    max_load_factor=None,
+):
+    """Change limits of process wide tool scheduler.
+
+    Values which are not passed are not changed.
+
+    Args:
+        max_processes (Optional[int]): Maximum number of all concurrently
+            running processes, '0' uses number of CPU cores.
+        tool_limits (Optional[dict[str, int]]): Maximum number of
+            concurrently running processes per tool.
+        min_free_memory_mb (Optional[int]): Don't start process if there
+            is less available memory.
+        max_load_factor (Optional[float]): Don't start process if system
+            load per CPU core is higher.
+
+    """
+    get_tool_scheduler().configure(
+        max_processes,
+        tool_limits,
+        min_free_memory_mb,
+        max_load_factor,
+    )
+
+
+def get_tool_scheduler_stats():
+    """Statistics of scheduled processes per tool.
+
+    Returns:
+        dict[str, dict[str, Union[int, float]]]: Statistics per tool.
+
+    """
+    return get_tool_scheduler().get_stats()
@@ -1,21 +1,28 @@
 import os
 import re
+import math
+import time
 import logging
 import json
 import collections
 import tempfile
 import subprocess
 import platform
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
 import xml.etree.ElementTree
 
-from .execute import run_subprocess
+from .execute import run_subprocess, run_subprocess_streamed
 from .vendor_bin_utils import (
     get_ffmpeg_tool_args,
     get_oiio_tool_args,
     is_oiio_supported,
 )
+from .media_probe_cache import get_media_probe_cache
+from .tool_scheduler import get_tool_scheduler
 
 # Max length of string that is supported by ffmpeg
 MAX_FFMPEG_STRING_LEN = 8196
@@ -58,6 +65,9 @@ IMAGE_EXTENSIONS = {
     ".wbmp", ".webp", ".xr", ".xt", ".xbm", ".xcf", ".xpm", ".xwd"
 }
 
+# Text printed by oiiotool after each written frame
+OIIO_PROGRESS_MARKER = "ayon-progress-frame"
+
 VIDEO_EXTENSIONS = {
     ".3g2", ".3gp", ".amv", ".asf", ".avi", ".drc", ".f4a", ".f4b",
     ".f4p", ".f4v", ".flv", ".gif", ".gifv", ".m2v", ".m4p", ".m4v",
@@ -92,9 +102,14 @@ def get_oiio_info_for_input(filepath, logger=None, subimages=False):
     if subimages:
         args.append("-a")
 
-    args.extend(["-i:infoformat=xml", filepath])
+    args.append("-i:infoformat=xml")
 
-    output = run_subprocess(args, logger=logger)
+    # Output is cached for unchanged file
+    probe_cache = get_media_probe_cache()
+    output = probe_cache.get(filepath, args)
+    if output is None:
+        output = run_subprocess(args + [filepath], logger=logger)
+        probe_cache.set(filepath, args, output)
     output = output.replace("\r\n", "\n")
 
     xml_started = False
@@ -792,9 +807,16 @@ def get_ffprobe_data(path_to_file, logger=None):
         "-show_chapters",
         "-show_private_data",
         "-print_format", "json",
-        path_to_file
     ]
 
+    # Output is cached for unchanged file
+    probe_cache = get_media_probe_cache()
+    output = probe_cache.get(path_to_file, args)
+    if output is not None:
+        logger.debug("Using cached FFprobe output.")
+        return json.loads(output)
+
+    args.append(path_to_file)
     logger.debug("FFprobe command: {}".format(
         subprocess.list2cmdline(args)
     ))
@@ -822,7 +844,13 @@ def get_ffprobe_data(path_to_file, logger=None):
             popen_stderr.decode("utf-8")
         ))
 
-    return json.loads(popen_stdout)
+    output = json.loads(popen_stdout)
+    # Cache only successful probes
+    if popen.returncode == 0:
+        probe_cache.set(
+            path_to_file, args[:-1], popen_stdout.decode("utf-8")
+        )
+    return output
 
 
 def get_ffprobe_streams(path_to_file, logger=None):
@@ -1107,6 +1135,7 @@ def convert_colorspace(
     display=None,
     additional_command_args=None,
     logger=None,
+    input_info=None,
 ):
     """Convert source file from one color space to another.
 
@@ -1129,24 +1158,68 @@ def convert_colorspace(
         additional_command_args (list): arguments for oiiotool (like binary
             depth for .dpx)
         logger (logging.Logger): Logger used for logging.
+        input_info (Optional[dict]): Information about input from oiio tool.
+            Input is probed if not passed.
     Raises:
         ValueError: if misconfigured
     """
     if logger is None:
         logger = logging.getLogger(__name__)
 
-    input_info = get_oiio_info_for_input(input_path, logger=logger)
+    if input_info is None:
+        input_info = get_oiio_info_for_input(input_path, logger=logger)
+
+    oiio_cmd = _get_convert_colorspace_args(
+        input_path,
+        output_path,
+        input_info,
+        config_path,
+        source_colorspace,
+        target_colorspace,
+        view,
+        display,
+        additional_command_args,
+    )
+
+    logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
+    run_subprocess(oiio_cmd, logger=logger)
+
+
+def _get_convert_colorspace_args(
+    input_path,
+    output_path,
+    input_info,
+    config_path,
+    source_colorspace,
+    target_colorspace=None,
+    view=None,
+    display=None,
+    additional_command_args=None,
+    global_args=None,
+):
+    """Prepare oiiotool arguments for colorspace conversion.
+
+    Args:
+        global_args (Optional[list[str]]): Arguments added right after
+            oiiotool executable, e.g. '--frames'.
+
+    Returns:
+        list[str]: Arguments of oiiotool subprocess.
 
+    """
     # Collect channels to export
     input_arg, channels_arg = get_oiio_input_and_channel_args(input_info)
 
     # Prepare subprocess arguments
-    oiio_cmd = get_oiio_tool_args(
-        "oiiotool",
+    oiio_cmd = get_oiio_tool_args("oiiotool")
+    if global_args:
+        oiio_cmd.extend(global_args)
+
+    oiio_cmd.extend([
         # Don't add any additional attributes
         "--nosoftwareattrib",
         "--colorconfig", config_path
-    )
+    ])
 
     oiio_cmd.extend([
         input_arg, input_path,
@@ -1174,9 +1247,320 @@ def convert_colorspace(
         oiio_cmd.extend(["--ociodisplay:subimages=0", display, view])
 
     oiio_cmd.extend(["-o", output_path])
+    return oiio_cmd
 
-    logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
-    run_subprocess(oiio_cmd, logger=logger)
+
+def _frames_to_oiio_spec(frames):
+    """Convert frames to oiiotool frame range specification.
+
+    Example:
+        >>> _frames_to_oiio_spec([1001, 1002, 1003, 1005])
+        '1001-1003,1005'
+
+    Args:
+        frames (list[int]): Sorted frames.
+
+    Returns:
+        str: Frame specification for '--frames' argument.
+
+    """
+    ranges = []
+    start = end = frames[0]
+    for frame in frames[1:]:
+        if frame == end + 1:
+            end = frame
+            continue
+        ranges.append((start, end))
+        start = end = frame
+    ranges.append((start, end))
+    return ",".join(
+        str(start) if start == end else "{}-{}".format(start, end)
+        for start, end in ranges
+    )
+
+
+def convert_colorspace_sequence(
+    input_collection,
+    output_collection,
+    config_path,
+    source_colorspace,
+    target_colorspace=None,
+    view=None,
+    display=None,
+    additional_command_args=None,
+    logger=None,
+    max_workers=None,
+    min_chunk_size=10,
+    progress_callback=None,
+):
+    """Convert image sequence from one color space to another in chunks.
+
+    Input is probed only once using first frame. Frames are split into
+    chunks converted by concurrently running oiiotool processes using
+    '--frames' argument. Each oiiotool process is limited to its share
+    of available cores.
+
+    Args:
+        input_collection (clique.Collection): Input sequence with full
+            paths.
+        output_collection (clique.Collection): Output sequence with full
+            paths. Must have same indexes as input collection.
+        config_path (str): path to OCIO config file
+        source_colorspace (str): ocio valid color space of source files
+        target_colorspace (str): ocio valid target color space
+                    if filled, 'view' and 'display' must be empty
+        view (str): name for viewer space (ocio valid)
+        display (str): name for display-referred reference space (ocio valid)
+        additional_command_args (list): arguments for oiiotool (like binary
+            depth for .dpx)
+        logger (logging.Logger): Logger used for logging.
+        max_workers (Optional[int]): Maximum number of concurrent oiiotool
+            processes. Limit of tool scheduler is used if not passed.
+        min_chunk_size (int): Minimum number of frames in one chunk.
+        progress_callback (Optional[Callable[[dict[str, Any]], None]]):
+            Called with progress data of conversion of whole sequence,
+            see 'ToolProgressParser'.
+
+    Raises:
+        ValueError: if misconfigured
+        RuntimeError: If conversion of any chunk failed. Message contains
+            frames of failed chunks.
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    frames = sorted(input_collection.indexes)
+    first_input_path = input_collection.format("{head}{padding}{tail}") % (
+        frames[0]
+    )
+    input_info = get_oiio_info_for_input(first_input_path, logger=logger)
+
+    cpu_count = os.cpu_count() or 1
+    if not max_workers:
+        max_workers = get_tool_scheduler().get_limit("oiiotool")
+    chunk_count = max(
+        1,
+        min(max_workers, len(frames) // max(1, min_chunk_size))
+    )
+    chunk_size = int(math.ceil(len(frames) / chunk_count))
+    chunks = [
+        frames[idx:idx + chunk_size]
+        for idx in range(0, len(frames), chunk_size)
+    ]
+    threads_per_chunk = max(1, cpu_count // len(chunks))
+
+    input_path = _get_oiio_sequence_path(input_collection)
+    output_path = _get_oiio_sequence_path(output_collection)
+
+    progress_parser = None
+    if progress_callback is not None:
+        progress_parser = OIIOToolProgressParser(
+            progress_callback, len(frames)
+        )
+
+    def _convert_chunk(chunk_frames):
+        oiio_cmd = _get_convert_colorspace_args(
+            input_path,
+            output_path,
+            input_info,
+            config_path,
+            source_colorspace,
+            target_colorspace,
+            view,
+            display,
+            additional_command_args,
+            global_args=[
+                "--threads", str(threads_per_chunk),
+                "--frames", _frames_to_oiio_spec(chunk_frames),
+            ],
+        )
+        if progress_parser is None:
+            logger.debug(
+                "Conversion command: {}".format(" ".join(oiio_cmd))
+            )
+            run_subprocess(oiio_cmd, logger=logger)
+            return
+
+        oiio_cmd.extend(get_oiio_progress_args())
+        logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
+        run_subprocess_streamed(
+            oiio_cmd, output_callback=progress_parser, logger=logger
+        )
+
+    if len(chunks) == 1:
+        _convert_chunk(chunks[0])
+        return
+
+    logger.debug("Converting {} frames in {} chunks.".format(
+        len(frames), len(chunks)
+    ))
+    failed_chunks = []
+    with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+        futures = {
+            executor.submit(_convert_chunk, chunk_frames): chunk_frames
+            for chunk_frames in chunks
+        }
+        for future in as_completed(futures):
+            exc = future.exception()
+            if exc is not None:
+                failed_chunks.append((futures[future], exc))
+
+    if failed_chunks:
+        raise RuntimeError("\n".join(
+            "Conversion of frames {} failed: {}".format(
+                _frames_to_oiio_spec(chunk_frames), str(exc)
+            )
+            for chunk_frames, exc in sorted(failed_chunks)
+        ))
+
+
+def get_ffmpeg_progress_args():
+    """Arguments making ffmpeg print machine readable progress to stdout.
+
+    Arguments are global and should be added right after ffmpeg
+    executable. Output can be parsed with 'FFmpegProgressParser'.
+
+    Returns:
+        list[str]: Arguments for ffmpeg.
+
+    """
+    return ["-progress", "pipe:1", "-nostats"]
+
+
+def get_oiio_progress_args():
+    """Arguments making oiiotool print a line after each written frame.
+
+    Arguments must be added at the end of oiiotool command. Output can be
+    parsed with 'OIIOToolProgressParser'.
+
+    Returns:
+        list[str]: Arguments for oiiotool.
+
+    """
+    return ["--echo", OIIO_PROGRESS_MARKER]
+
+
+class ToolProgressParser(ABC):
+    """Parse output of media tool to progress of processed frames.
+
+    Parser is used as 'output_callback' of 'run_subprocess_streamed' and
+    calls the callback with progress data. Progress data contain keys
+    "tool", "frame", "total_frames", "fps", "speed" and "done".
+
+    Args:
+        callback (Callable[[dict[str, Any]], None]): Called with
+            progress data.
+        total_frames (Optional[int]): Expected number of frames.
+
+    """
+    tool_name = None
+
+    def __init__(self, callback, total_frames=None):
+        self._callback = callback
+        self._total_frames = total_frames
+        self._started = time.time()
+
+    @abstractmethod
+    def __call__(self, line):
+        """Process line of output.
+
+        Returns:
+            bool: Line was used for progress reporting.
+
+        """
+        pass
+
+    def _report(self, frame, fps=None, speed=None, done=False):
+        if fps is None:
+            elapsed = time.time() - self._started
+            if elapsed > 0:
+                fps = frame / elapsed
+        self._callback({
+            "tool": self.tool_name,
+            "frame": frame,
+            "total_frames": self._total_frames,
+            "fps": fps,
+            "speed": speed,
+            "done": done,
+        })
+
+
+class FFmpegProgressParser(ToolProgressParser):
+    """Parse output of ffmpeg ran with 'get_ffmpeg_progress_args'.
+
+    Ffmpeg prints block of 'key=value' lines ending with 'progress' key.
+    """
+    tool_name = "ffmpeg"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values = {}
+
+    def __call__(self, line):
+        key, sep, value = line.strip().partition("=")
+        if not sep or not key or " " in key:
+            return False
+
+        self._values[key] = value.strip()
+        if key == "progress":
+            values = self._values
+            self._values = {}
+            self._report(
+                self._to_number(int, values.get("frame")) or 0,
+                fps=self._to_number(float, values.get("fps")),
+                speed=self._to_number(
+                    float, (values.get("speed") or "").rstrip("x")
+                ),
+                done=value.strip() == "end",
+            )
+        return True
+
+    @staticmethod
+    def _to_number(value_type, value):
+        try:
+            return value_type(value)
+        except (TypeError, ValueError):
+            return None
+
+
+class OIIOToolProgressParser(ToolProgressParser):
+    """Parse output of oiiotool ran with 'get_oiio_progress_args'.
+
+    Parser can be shared by concurrently running oiiotool processes
+    converting parts of one sequence.
+    """
+    tool_name = "oiiotool"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock = threading.Lock()
+        self._frame = 0
+
+    def __call__(self, line):
+        if line.strip() != OIIO_PROGRESS_MARKER:
+            return False
+
+        with self._lock:
+            self._frame += 1
+            done = (
+                self._total_frames is not None
+                and self._frame >= self._total_frames
+            )
+            self._report(self._frame, done=done)
+        return True
+
+
+def _get_oiio_sequence_path(collection):
+    """Path of collection with oiiotool frame number wildcard.
+
+    '#' is used for 4 digits padding, '@' for each padded digit
+    otherwise.
+    """
+    if collection.padding == 4:
+        wildcard = "#"
+    else:
+        wildcard = "@" * max(1, collection.padding)
+    return "{}{}{}".format(collection.head, wildcard, collection.tail)
 
 
 def split_cmd_args(in_args):
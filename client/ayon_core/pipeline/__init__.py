@@ -1,3 +1,11 @@
+"""Public API of AYON pipeline.
+
+Exported functions and classes are imported on first access, so import
+of 'ayon_core.pipeline' does not import all submodules.
+"""
+import importlib
+import importlib.util
+
 from .constants import (
     AVALON_CONTAINER_ID,
     AVALON_INSTANCE_ID,
@@ -6,107 +14,107 @@ from .constants import (
     HOST_WORKFILE_EXTENSIONS,
 )
 
-from .anatomy import Anatomy
-
-from .create import (
-    BaseCreator,
-    Creator,
-    AutoCreator,
-    HiddenCreator,
-    CreatedInstance,
-    CreatorError,
-
-    LegacyCreator,
-    legacy_create,
-
-    discover_creator_plugins,
-    discover_legacy_creator_plugins,
-    register_creator_plugin,
-    deregister_creator_plugin,
-    register_creator_plugin_path,
-    deregister_creator_plugin_path,
-)
-
-from .load import (
-    HeroVersionType,
-    IncompatibleLoaderError,
-    LoaderPlugin,
-    ProductLoaderPlugin,
-
-    discover_loader_plugins,
-    register_loader_plugin,
-    deregister_loader_plugin_path,
-    register_loader_plugin_path,
-    deregister_loader_plugin,
-
-    load_container,
-    remove_container,
-    update_container,
-    switch_container,
-
-    loaders_from_representation,
-    get_representation_path,
-    get_representation_context,
-    get_repres_contexts,
-)
-
-from .publish import (
-    KnownPublishError,
-    PublishError,
-    PublishValidationError,
-    PublishXmlValidationError,
-    AYONPyblishPluginMixin,
-    OptionalPyblishPluginMixin,
-)
-
-from .actions import (
-    LauncherAction,
-
-    InventoryAction,
-
-    discover_launcher_actions,
-    register_launcher_action,
-    register_launcher_action_path,
-
-    discover_inventory_actions,
-    register_inventory_action,
-    register_inventory_action_path,
-    deregister_inventory_action,
-    deregister_inventory_action_path,
-)
-
-from .context_tools import (
-    install_ayon_plugins,
-    install_host,
-    uninstall_host,
-    is_installed,
-
-    register_root,
-    registered_root,
-
-    register_host,
-    registered_host,
-    deregister_host,
-    get_process_id,
-
-    get_global_context,
-    get_current_context,
-    get_current_host_name,
-    get_current_project_name,
-    get_current_folder_path,
-    get_current_task_name
-)
-
-from .workfile import (
-    discover_workfile_build_plugins,
-    register_workfile_build_plugin,
-    deregister_workfile_build_plugin,
-    register_workfile_build_plugin_path,
-    deregister_workfile_build_plugin_path,
-)
-
-install = install_host
-uninstall = uninstall_host
+# Exported names by submodule where they are defined
+_EXPORTS_BY_MODULE = {
+    ".anatomy": (
+        "Anatomy",
+    ),
+    ".create": (
+        "BaseCreator",
+        "Creator",
+        "AutoCreator",
+        "HiddenCreator",
+        "CreatedInstance",
+        "CreatorError",
+        "LegacyCreator",
+        "legacy_create",
+        "discover_creator_plugins",
+        "discover_legacy_creator_plugins",
+        "register_creator_plugin",
+        "deregister_creator_plugin",
+        "register_creator_plugin_path",
+        "deregister_creator_plugin_path",
+    ),
+    ".load": (
+        "HeroVersionType",
+        "IncompatibleLoaderError",
+        "LoaderPlugin",
+        "ProductLoaderPlugin",
+        "discover_loader_plugins",
+        "register_loader_plugin",
+        "deregister_loader_plugin_path",
+        "register_loader_plugin_path",
+        "deregister_loader_plugin",
+        "load_container",
+        "remove_container",
+        "update_container",
+        "switch_container",
+        "loaders_from_representation",
+        "get_representation_path",
+        "get_representation_context",
+        "get_repres_contexts",
+    ),
+    ".publish": (
+        "KnownPublishError",
+        "PublishError",
+        "PublishValidationError",
+        "PublishXmlValidationError",
+        "AYONPyblishPluginMixin",
+        "OptionalPyblishPluginMixin",
+    ),
+    ".actions": (
+        "LauncherAction",
+        "InventoryAction",
+        "discover_launcher_actions",
+        "register_launcher_action",
+        "register_launcher_action_path",
+        "discover_inventory_actions",
+        "register_inventory_action",
+        "register_inventory_action_path",
+        "deregister_inventory_action",
+        "deregister_inventory_action_path",
+    ),
+    ".context_tools": (
+        "install_ayon_plugins",
+        "install_host",
+        "uninstall_host",
+        "is_installed",
+        "register_root",
+        "registered_root",
+        "register_host",
+        "registered_host",
+        "deregister_host",
+        "get_process_id",
+        "get_global_context",
+        "get_current_context",
+        "get_current_host_name",
+        "get_current_project_name",
+        "get_current_folder_path",
+        "get_current_task_name",
+
+        # Backwards compatible function names
+        "install",
+        "uninstall",
+    ),
+    ".workfile": (
+        "discover_workfile_build_plugins",
+        "register_workfile_build_plugin",
+        "deregister_workfile_build_plugin",
+        "register_workfile_build_plugin_path",
+        "deregister_workfile_build_plugin_path",
+    ),
+}
+# Exported names which are defined with different name in submodule
+_ALIASES = {
+    "install": "install_host",
+    "uninstall": "uninstall_host",
+}
+
+_MODULE_BY_NAME = {
+    name: module_name
+    for module_name, names in _EXPORTS_BY_MODULE.items()
+    for name in names
+}
 
 
 __all__ = (
@@ -216,3 +224,25 @@ __all__ = (
     "install",
     "uninstall",
 )
+
+
+def __getattr__(name):
+    # Import exported names lazily on first access
+    module_name = _MODULE_BY_NAME.get(name)
+    if module_name is None:
+        # Submodules were available as attributes when all names were
+        #   imported eagerly
+        if importlib.util.find_spec("{}.{}".format(__name__, name)):
+            return importlib.import_module("." + name, __name__)
+        raise AttributeError(
+            "module '{}' has no attribute '{}'".format(__name__, name)
+        )
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, _ALIASES.get(name, name))
+    # Store value so '__getattr__' is not called for the name again
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -438,7 +438,8 @@ class Anatomy(BaseAnatomy):
     @classmethod
     def get_sitesync_addon(cls):
         if not cls._sitesync_addon_cache.is_valid:
-            manager = AddonsManager()
+            # Initialize only sitesync addon
+            manager = AddonsManager(lazy=True)
             cls._sitesync_addon_cache.update_data(
                 manager.get_enabled_addon("sitesync")
             )
@@ -1,11 +1,17 @@
 import re
 import os
 import json
+import time
+import queue
+import atexit
+import hashlib
 import contextlib
 import functools
 import platform
 import tempfile
 import warnings
+import threading
+import subprocess
 from copy import deepcopy
 
 import ayon_api
@@ -15,9 +21,12 @@ from ayon_core.settings import get_project_settings
 from ayon_core.lib import (
     filter_profiles,
     StringTemplate,
+    get_ayon_launcher_args,
+    get_launcher_local_dir,
     run_ayon_launcher_process,
     Logger,
 )
+from ayon_core.lib.execute import clean_envs_for_ayon_process
 from ayon_core.lib.transcoding import VIDEO_EXTENSIONS, IMAGE_EXTENSIONS
 from ayon_core.pipeline import Anatomy
 from ayon_core.pipeline.template_data import get_template_data
@@ -25,12 +34,29 @@ from ayon_core.pipeline.load import get_representation_path_with_anatomy
 
 log = Logger.get_logger(__name__)
 
+# Prefix of response lines printed by OCIO worker process
+OCIO_WORKER_RESPONSE_PREFIX = "ayon-ocio-rpc:"
+# Subfolder of launcher local dir with cached data of OCIO configs
+OCIO_CONFIG_CACHE_DIRNAME = "ocio_configs"
+# Increment when structure of cached data changes
+_OCIO_CONFIG_CACHE_VERSION = 1
+# Environment variables changing colorspaces, displays and views of config
+_OCIO_CONFIG_ENV_KEYS = (
+    "OCIO_ACTIVE_DISPLAYS",
+    "OCIO_ACTIVE_VIEWS",
+    "OCIO_INACTIVE_COLORSPACES",
+)
+
 
 class CachedData:
     remapping = {}
     has_compatible_ocio_package = None
     config_version_data = {}
     ocio_config_colorspaces = {}
+    ocio_config_views = {}
+    ocio_config_cache_keys = {}
+    ocio_configs = {}
+    colorspace_resolvers = {}
     allowed_exts = {
         ext.lstrip(".") for ext in IMAGE_EXTENSIONS.union(VIDEO_EXTENSIONS)
     }
@@ -181,42 +207,52 @@ def get_colorspace_name_from_filepath(
             project_name, host_name, project_settings
         )
 
-    # use ImageIO file rules
-    colorspace_name = get_imageio_file_rules_colorspace_from_filepath(
-        filepath,
-        host_name,
-        project_name,
-        config_data=config_data,
-        file_rules=file_rules,
-        project_settings=project_settings
-    )
+    resolver = get_colorspace_resolver(config_data, file_rules)
+    return resolver.get_colorspace_name(filepath, validate=validate)
 
-    # try to get colorspace from OCIO v2 file rules
-    if (
-        not colorspace_name
-        and compatibility_check_config_version(config_data["path"], major=2)
-    ):
-        colorspace_name = get_config_file_rules_colorspace_from_filepath(
-            config_data["path"], filepath)
-
-    # use parse colorspace from filepath as fallback
-    colorspace_name = colorspace_name or parse_colorspace_from_filepath(
-        filepath, config_path=config_data["path"]
-    )
 
-    if not colorspace_name:
-        log.info("No imageio file rule matched input path: '{}'".format(
-            filepath
-        ))
-        return None
+def get_colorspace_names_from_filepaths(
+    filepaths,
+    host_name,
+    project_name,
+    config_data,
+    file_rules=None,
+    project_settings=None,
+    validate=True
+):
+    """Get colorspace names of multiple filepaths.
+
+    Same as 'get_colorspace_name_from_filepath' but file rules and config
+    data are prepared only once for all paths.
 
-    # validate matching colorspace with config
-    if validate:
-        validate_imageio_colorspace_in_config(
-            config_data["path"], colorspace_name
+    Args:
+        filepaths (Iterable[str]): Path strings, file rule pattern is
+            tested on them.
+        host_name (str): Host name.
+        project_name (str): Project name.
+        config_data (dict): Config path and template in dict.
+        file_rules (Optional[dict]): File rule data from settings.
+        project_settings (Optional[dict]): Project settings.
+        validate (Optional[bool]): should resulting colorspaces be validated
+            with config file? Defaults to True.
+
+    Returns:
+        dict[str, Union[str, None]]: Colorspace name by filepath.
+
+    """
+    filepaths = list(filepaths)
+    if not config_data:
+        return {filepath: None for filepath in filepaths}
+
+    if file_rules is None:
+        if project_settings is None:
+            project_settings = get_project_settings(project_name)
+        file_rules = get_imageio_file_rules(
+            project_name, host_name, project_settings
         )
 
-    return colorspace_name
+    resolver = get_colorspace_resolver(config_data, file_rules)
+    return resolver.get_colorspace_names(filepaths, validate=validate)
 
 
 def get_imageio_file_rules_colorspace_from_filepath(
@@ -254,22 +290,8 @@ def get_imageio_file_rules_colorspace_from_filepath(
             project_name, host_name, project_settings
         )
 
-    # match file rule from path
-    colorspace_name = None
-    for file_rule in file_rules:
-        pattern = file_rule["pattern"]
-        extension = file_rule["ext"]
-        ext_match = re.match(
-            r".*(?=.{})".format(extension), filepath
-        )
-        file_match = re.search(
-            pattern, filepath
-        )
-
-        if ext_match and file_match:
-            colorspace_name = file_rule["colorspace"]
-
-    return colorspace_name
+    resolver = get_colorspace_resolver(config_data, file_rules)
+    return resolver.get_file_rules_colorspace_name(filepath)
 
 
 def get_config_file_rules_colorspace_from_filepath(config_path, filepath):
@@ -316,18 +338,54 @@ def get_config_version_data(config_path):
 
     """
     if config_path not in CachedData.config_version_data:
-        if has_compatible_ocio_package():
-            version_data = _get_config_version_data(config_path)
-        else:
-            version_data = _get_wrapped_with_subprocess(
+        def _getter():
+            if has_compatible_ocio_package():
+                return _get_config_version_data(config_path)
+            return _get_wrapped_with_subprocess(
                 "get_config_version_data",
                 config_path=config_path
             )
-        CachedData.config_version_data[config_path] = version_data
+
+        CachedData.config_version_data[config_path] = (
+            _get_disk_cached_config_data(config_path, "version", _getter)
+        )
 
     return deepcopy(CachedData.config_version_data[config_path])
 
 
+def _get_colorspace_matcher(colorspaces):
+    """Return a regex pattern matching colorspace names.
+
+    Allows to search a colorspace match in a filename. Colorspace names
+    with spaces are matched also with underscores because the integrator
+    replaces spaces with underscores in filenames.
+
+    Args:
+        colorspaces (Iterable[str]): Colorspace names.
+
+    Returns:
+        tuple[re.Pattern, dict[str, str]]: Regex pattern and mapping of
+            underscored colorspace names to original names.
+
+    """
+    colorspaces = list(colorspaces)
+    underscored_colorspaces = {
+        key.replace(" ", "_"): key for key in colorspaces
+        if " " in key
+    }
+    pattern = "|".join(
+        re.escape(colorspace)
+        # Sort by longest first so the regex matches longer matches
+        # over smaller matches, e.g. matching 'Output - sRGB' over 'sRGB'
+        for colorspace in sorted(
+            colorspaces + list(underscored_colorspaces),
+            key=len,
+            reverse=True
+        )
+    )
+    return re.compile(pattern), underscored_colorspaces
+
+
 def parse_colorspace_from_filepath(
     filepath, colorspaces=None, config_path=None
 ):
@@ -354,27 +412,6 @@ def parse_colorspace_from_filepath(
     Returns:
         str: name of colorspace
     """
-    def _get_colorspace_match_regex(colorspaces):
-        """Return a regex pattern
-
-        Allows to search a colorspace match in a filename
-
-        Args:
-            colorspaces (list): List of colorspace names
-
-        Returns:
-            re.Pattern: regex pattern
-        """
-        pattern = "|".join(
-            # Allow to match spaces also as underscores because the
-            # integrator replaces spaces with underscores in filenames
-            re.escape(colorspace)
-            # Sort by longest first so the regex matches longer matches
-            # over smaller matches, e.g. matching 'Output - sRGB' over 'sRGB'
-            for colorspace in sorted(colorspaces, key=len, reverse=True)
-        )
-        return re.compile(pattern)
-
     if not colorspaces and not config_path:
         raise ValueError(
             "Must provide `config_path` if `colorspaces` is not provided."
@@ -384,14 +421,11 @@ def parse_colorspace_from_filepath(
         colorspaces
         or get_ocio_config_colorspaces(config_path)["colorspaces"]
     )
-    underscored_colorspaces = {
-        key.replace(" ", "_"): key for key in colorspaces
-        if " " in key
-    }
+    regex_pattern, underscored_colorspaces = _get_colorspace_matcher(
+        colorspaces
+    )
 
     # match colorspace from  filepath
-    regex_pattern = _get_colorspace_match_regex(
-        list(colorspaces) + list(underscored_colorspaces))
     match = regex_pattern.search(filepath)
     colorspace = match.group(0) if match else None
 
@@ -430,9 +464,504 @@ def validate_imageio_colorspace_in_config(config_path, colorspace_name):
     return True
 
 
+def _get_ocio_version_label():
+    """Identifier of OCIO used to query config data.
+
+    Returns:
+        str: PyOpenColorIO version of current process or AYON launcher
+            version if queries are processed by AYON launcher.
+
+    """
+    if has_compatible_ocio_package():
+        import PyOpenColorIO
+
+        return "PyOpenColorIO-{}".format(PyOpenColorIO.__version__)
+    return "ayon-launcher-{}".format(os.getenv("AYON_VERSION", "unknown"))
+
+
+def _get_ocio_env_values():
+    """Values of environment variables changing content of OCIO config.
+
+    Returns:
+        tuple[Union[str, None], ...]: Values of '_OCIO_CONFIG_ENV_KEYS'.
+
+    """
+    return tuple(os.getenv(key) for key in _OCIO_CONFIG_ENV_KEYS)
+
+
+def _get_ocio_config_cache_filepath(config_path):
+    """Path to disk cache file with data of OCIO config.
+
+    Cache file is identified by hash of config content, OCIO version and
+    OCIO environment variables which change available colorspaces,
+    displays and views, so changed config is never loaded from outdated
+    cache. Content hash is calculated only once per process unless config
+    file or the environment variables change.
+
+    Args:
+        config_path (str): Path to config.ocio file.
+
+    Returns:
+        Union[str, None]: Path to cache file or None if config file can't
+            be read.
+
+    """
+    try:
+        stat_result = os.stat(config_path)
+    except (OSError, TypeError, ValueError):
+        return None
+
+    env_values = _get_ocio_env_values()
+    stat_key = (
+        os.path.abspath(config_path),
+        stat_result.st_size,
+        stat_result.st_mtime_ns,
+        env_values,
+    )
+    cache_key = CachedData.ocio_config_cache_keys.get(stat_key)
+    if cache_key is None:
+        hasher = hashlib.sha1()
+        try:
+            with open(config_path, "rb") as stream:
+                for chunk in iter(lambda: stream.read(1024 * 1024), b""):
+                    hasher.update(chunk)
+        except OSError:
+            return None
+        hasher.update(json.dumps([
+            _get_ocio_version_label(),
+            _OCIO_CONFIG_CACHE_VERSION,
+            list(env_values),
+        ]).encode("utf-8"))
+        cache_key = hasher.hexdigest()
+        CachedData.ocio_config_cache_keys[stat_key] = cache_key
+
+    return os.path.join(
+        get_launcher_local_dir(OCIO_CONFIG_CACHE_DIRNAME),
+        "{}.json".format(cache_key)
+    )
+
+
+def _get_disk_cached_config_data(config_path, data_key, getter):
+    """Get data of OCIO config using cache on disk.
+
+    Cache is shared by all processes on the machine so config does not
+    have to be parsed again by each process.
+
+    Args:
+        config_path (str): Path to config.ocio file.
+        data_key (str): Key of data in cache file.
+        getter (Callable[[], Any]): Function returning the data if they
+            are not cached.
+
+    Returns:
+        Any: Data of config.
+
+    """
+    cache_path = _get_ocio_config_cache_filepath(config_path)
+    cache_data = {}
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "r") as stream:
+                cache_data = json.load(stream)
+        except (OSError, ValueError):
+            log.debug(
+                "Failed to read OCIO config cache '{}'".format(cache_path),
+                exc_info=True
+            )
+
+        if data_key in cache_data:
+            return cache_data[data_key]
+
+    data = getter()
+    if not cache_path or data is None:
+        return data
+
+    cache_data[data_key] = data
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to temp file first so other processes never read
+        #   partially written file
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as stream:
+            json.dump(cache_data, stream)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        log.debug(
+            "Failed to write OCIO config cache '{}'".format(cache_path),
+            exc_info=True
+        )
+    return data
+
+
+class ColorspaceResolver:
+    """Resolve colorspace names of filepaths for one config and file rules.
+
+    File rule patterns and colorspace name matcher are compiled only once
+    and resolved colorspaces are cached by filepath.
+
+    Frames of a sequence are not grouped, because file rule patterns and
+    colorspace names in filenames may differ only by numbers, e.g.
+    'img_Gamma_2.2.exr' and 'img_Gamma_2.4.exr'.
+
+    Use 'get_colorspace_resolver' to get cached resolver.
+
+    Args:
+        config_data (dict): Config path and template in dict.
+        file_rules (Optional[list[dict]]): File rule data from settings.
+
+    """
+    def __init__(self, config_data, file_rules=None):
+        self._config_path = config_data["path"]
+        self._file_rules = [
+            (
+                re.compile(r".*(?=.{})".format(file_rule["ext"])),
+                re.compile(file_rule["pattern"]),
+                file_rule["colorspace"],
+            )
+            for file_rule in file_rules or []
+        ]
+        self._colorspaces = None
+        self._colorspace_matcher = None
+        self._use_config_file_rules = None
+        self._file_rules_cache = {}
+        self._colorspace_cache = {}
+
+    @property
+    def config_path(self):
+        return self._config_path
+
+    def get_colorspaces(self):
+        """Colorspace names available in config.
+
+        Returns:
+            set[str]: Colorspace names.
+
+        """
+        if self._colorspaces is None:
+            self._colorspaces = set(
+                get_ocio_config_colorspaces(self._config_path)["colorspaces"]
+            )
+        return self._colorspaces
+
+    def get_file_rules_colorspace_name(self, filepath):
+        """Colorspace name of filepath based on file rules from settings.
+
+        Args:
+            filepath (str): Path string, file rule pattern is tested on it.
+
+        Returns:
+            Union[str, None]: Name of colorspace.
+
+        """
+        if filepath not in self._file_rules_cache:
+            # Last matching rule wins
+            colorspace_name = None
+            for ext_regex, pattern_regex, colorspace in self._file_rules:
+                if (
+                    ext_regex.match(filepath)
+                    and pattern_regex.search(filepath)
+                ):
+                    colorspace_name = colorspace
+            self._file_rules_cache[filepath] = colorspace_name
+        return self._file_rules_cache[filepath]
+
+    def get_colorspace_name(self, filepath, validate=True):
+        """Colorspace name of filepath.
+
+        File rules from settings are used first, then OCIO v2 file rules
+        of config and colorspace name in filepath as fallback.
+
+        Args:
+            filepath (str): Path string, file rule pattern is tested on it.
+            validate (Optional[bool]): Validate that colorspace is
+                available in config.
+
+        Raises:
+            KeyError: Resolved colorspace is not available in config.
+
+        Returns:
+            Union[str, None]: Name of colorspace.
+
+        """
+        if filepath not in self._colorspace_cache:
+            self._colorspace_cache[filepath] = (
+                self._resolve_colorspace_name(filepath)
+            )
+        colorspace_name = self._colorspace_cache[filepath]
+        if not colorspace_name:
+            return None
+
+        if validate and colorspace_name not in self.get_colorspaces():
+            raise KeyError(
+                "Missing colorspace '{}' in config file '{}'".format(
+                    colorspace_name, self._config_path)
+            )
+        return colorspace_name
+
+    def get_colorspace_names(self, filepaths, validate=True):
+        """Colorspace names of multiple filepaths.
+
+        Args:
+            filepaths (Iterable[str]): Path strings.
+            validate (Optional[bool]): Validate that colorspaces are
+                available in config.
+
+        Raises:
+            KeyError: Resolved colorspace is not available in config.
+
+        Returns:
+            dict[str, Union[str, None]]: Colorspace name by filepath.
+
+        """
+        return {
+            filepath: self.get_colorspace_name(filepath, validate)
+            for filepath in filepaths
+        }
+
+    def _resolve_colorspace_name(self, filepath):
+        colorspace_name = self.get_file_rules_colorspace_name(filepath)
+
+        # try to get colorspace from OCIO v2 file rules
+        if self._use_config_file_rules is None:
+            self._use_config_file_rules = compatibility_check_config_version(
+                self._config_path, major=2
+            )
+        if not colorspace_name and self._use_config_file_rules:
+            colorspace_name = get_config_file_rules_colorspace_from_filepath(
+                self._config_path, filepath)
+
+        # use parse colorspace from filepath as fallback
+        if not colorspace_name:
+            if self._colorspace_matcher is None:
+                self._colorspace_matcher = _get_colorspace_matcher(
+                    self.get_colorspaces()
+                )
+            regex_pattern, underscored_colorspaces = (
+                self._colorspace_matcher
+            )
+            match = regex_pattern.search(filepath)
+            if match:
+                colorspace_name = underscored_colorspaces.get(
+                    match.group(0), match.group(0)
+                )
+
+        if not colorspace_name:
+            log.info("No imageio file rule matched input path: '{}'".format(
+                filepath
+            ))
+        return colorspace_name
+
+
+def get_colorspace_resolver(config_data, file_rules=None):
+    """Get cached colorspace resolver for config and file rules.
+
+    Args:
+        config_data (dict): Config path and template in dict.
+        file_rules (Optional[list[dict]]): File rule data from settings.
+
+    Returns:
+        ColorspaceResolver: Colorspace resolver.
+
+    """
+    key = (
+        config_data["path"],
+        json.dumps(file_rules or [], sort_keys=True),
+    )
+    resolver = CachedData.colorspace_resolvers.get(key)
+    if resolver is None:
+        resolver = ColorspaceResolver(config_data, file_rules)
+        CachedData.colorspace_resolvers[key] = resolver
+    return resolver
+
+
+class _OCIOWorkerError(Exception):
+    """Communication with OCIO worker process failed."""
+
+
+class _OCIOWorker:
+    """Long running process answering OCIO queries.
+
+    Process runs 'ocio_wrapper.py serve' using AYON launcher which has
+    compatible 'PyOpenColorIO'. Requests and responses are JSON lines on
+    stdin and stdout, so each config is loaded only once by the process
+    and each query does not have to start new process.
+
+    Process is started lazily on first request and stopped at exit. Output
+    of process is read by separate thread, so stalled process, e.g. waiting
+    for login or loading config, is killed after 'request_timeout'.
+
+    Process is restarted when OCIO environment variables change, because
+    they are read by OCIO on config load in the process.
+    """
+    stop_timeout = 5
+    # Seconds to wait for response, includes start of the process
+    request_timeout = 60
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._process = None
+        self._output_queue = None
+        self._env_values = None
+        self._request_id = 0
+        self._failed = False
+        self._atexit_registered = False
+
+    def request(self, method, **params):
+        """Send request to worker and wait for response.
+
+        Args:
+            method (str): Name of command in 'ocio_wrapper.py'.
+            **params: Command arguments.
+
+        Returns:
+            Any: Result of the command.
+
+        Raises:
+            _OCIOWorkerError: Communication with worker failed.
+            RuntimeError: Command failed in worker process.
+
+        """
+        with self._lock:
+            if self._failed:
+                raise _OCIOWorkerError("OCIO worker is not available")
+
+            try:
+                response = self._request(method, params)
+            except (OSError, ValueError, _OCIOWorkerError) as exc:
+                # Don't try to start worker again
+                self._failed = True
+                self._kill()
+                raise _OCIOWorkerError(str(exc))
+
+        if "error" in response:
+            raise RuntimeError(
+                "OCIO worker failed to process '{}': {}".format(
+                    method, response["error"]
+                )
+            )
+        return response.get("result")
+
+    def stop(self):
+        """Stop worker process if it is running."""
+        with self._lock:
+            self._stop()
+
+    def _stop(self):
+        process = self._process
+        self._process = None
+        if process is None or process.poll() is not None:
+            return
+
+        try:
+            process.stdin.write(
+                (json.dumps({"method": "shutdown"}) + "\n").encode()
+            )
+            process.stdin.close()
+            process.wait(timeout=self.stop_timeout)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            process.kill()
+
+    def _start(self, env_values):
+        args = get_ayon_launcher_args(
+            "run", get_ocio_config_script_path(), "serve"
+        )
+        kwargs = {}
+        if platform.system().lower() == "windows":
+            kwargs["creationflags"] = getattr(
+                subprocess, "CREATE_NO_WINDOW", 0
+            )
+        log.debug("Starting OCIO worker: {}".format(" ".join(args)))
+        self._process = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=clean_envs_for_ayon_process(os.environ),
+            **kwargs
+        )
+        self._env_values = env_values
+        self._output_queue = queue.Queue()
+        thread = threading.Thread(
+            target=self._read_output,
+            args=(self._process.stdout, self._output_queue),
+            daemon=True
+        )
+        thread.start()
+        if not self._atexit_registered:
+            self._atexit_registered = True
+            atexit.register(self.stop)
+
+    @staticmethod
+    def _read_output(stdout, output_queue):
+        try:
+            for raw_line in iter(stdout.readline, b""):
+                output_queue.put(raw_line)
+        except (OSError, ValueError):
+            pass
+        # Process ended
+        output_queue.put(None)
+
+    def _kill(self):
+        process = self._process
+        self._process = None
+        if process is not None and process.poll() is None:
+            process.kill()
+
+    def _request(self, method, params):
+        env_values = _get_ocio_env_values()
+        if (
+            self._process is not None
+            and self._env_values != env_values
+        ):
+            log.debug("OCIO environment changed, restarting OCIO worker.")
+            self._stop()
+
+        if self._process is None or self._process.poll() is not None:
+            self._start(env_values)
+
+        self._request_id += 1
+        request_id = self._request_id
+        request = {"id": request_id, "method": method, "params": params}
+        self._process.stdin.write(
+            (json.dumps(request) + "\n").encode("utf-8")
+        )
+        self._process.stdin.flush()
+
+        # Skip any other output of the process, e.g. launcher logs
+        deadline = time.monotonic() + self.request_timeout
+        while True:
+            try:
+                raw_line = self._output_queue.get(
+                    timeout=max(0.0, deadline - time.monotonic())
+                )
+            except queue.Empty:
+                raise _OCIOWorkerError(
+                    "OCIO worker did not respond in {} seconds".format(
+                        self.request_timeout
+                    )
+                )
+            if raw_line is None:
+                raise _OCIOWorkerError("OCIO worker process ended")
+            line = raw_line.decode("utf-8", errors="replace").strip()
+            if not line.startswith(OCIO_WORKER_RESPONSE_PREFIX):
+                continue
+            response = json.loads(
+                line[len(OCIO_WORKER_RESPONSE_PREFIX):]
+            )
+            if response.get("id") == request_id:
+                return response
+
+
+_OCIO_WORKER = _OCIOWorker()
+
+
 def _get_wrapped_with_subprocess(command, **kwargs):
     """Get data via subprocess.
 
+    Data are received from long running OCIO worker process. New process
+    is started for the command if worker is not available.
+
     Args:
         command (str): command name
         **kwargs: command arguments
@@ -440,6 +969,14 @@ def _get_wrapped_with_subprocess(command, **kwargs):
     Returns:
         Any[dict, None]: data
     """
+    try:
+        return _OCIO_WORKER.request(command, **kwargs)
+    except _OCIOWorkerError:
+        log.debug(
+            "OCIO worker is not available, using single process.",
+            exc_info=True
+        )
+
     with _make_temp_json_file() as tmp_json_path:
         # Prepare subprocess arguments
         args = [
@@ -493,14 +1030,17 @@ def get_ocio_config_colorspaces(config_path):
 
     """
     if config_path not in CachedData.ocio_config_colorspaces:
-        if has_compatible_ocio_package():
-            config_colorspaces = _get_ocio_config_colorspaces(config_path)
-        else:
-            config_colorspaces = _get_wrapped_with_subprocess(
+        def _getter():
+            if has_compatible_ocio_package():
+                return _get_ocio_config_colorspaces(config_path)
+            return _get_wrapped_with_subprocess(
                 "get_ocio_config_colorspaces",
                 config_path=config_path
             )
-        CachedData.ocio_config_colorspaces[config_path] = config_colorspaces
+
+        CachedData.ocio_config_colorspaces[config_path] = (
+            _get_disk_cached_config_data(config_path, "colorspaces", _getter)
+        )
 
     return deepcopy(CachedData.ocio_config_colorspaces[config_path])
 
@@ -690,13 +1230,20 @@ def get_ocio_config_views(config_path):
         dict: `display/viewer` and viewer data
 
     """
-    if has_compatible_ocio_package():
-        return _get_ocio_config_views(config_path)
+    if config_path not in CachedData.ocio_config_views:
+        def _getter():
+            if has_compatible_ocio_package():
+                return _get_ocio_config_views(config_path)
+            return _get_wrapped_with_subprocess(
+                "get_ocio_config_views",
+                config_path=config_path
+            )
 
-    return _get_wrapped_with_subprocess(
-        "get_ocio_config_views",
-        config_path=config_path
-    )
+        CachedData.ocio_config_views[config_path] = (
+            _get_disk_cached_config_data(config_path, "views", _getter)
+        )
+
+    return deepcopy(CachedData.ocio_config_views[config_path])
 
 
 def _get_global_config_data(
@@ -1234,10 +1781,6 @@ def set_colorspace_data_to_representation(
 
     log.debug("Config data is: `{}`".format(config_data))
 
-    project_name = context_data["projectName"]
-    host_name = context_data["hostName"]
-    project_settings = context_data["project_settings"]
-
     # get one filename
     filename = representation["files"]
     if isinstance(filename, list):
@@ -1245,14 +1788,8 @@ def set_colorspace_data_to_representation(
 
     # get matching colorspace from rules
     if colorspace is None:
-        colorspace = get_imageio_file_rules_colorspace_from_filepath(
-            filename,
-            host_name,
-            project_name,
-            config_data=config_data,
-            file_rules=file_rules,
-            project_settings=project_settings
-        )
+        resolver = get_colorspace_resolver(config_data, file_rules)
+        colorspace = resolver.get_file_rules_colorspace_name(filename)
 
     # infuse data to representation
     if colorspace:
@@ -1307,7 +1844,17 @@ def _get_ocio_config(config_path):
     if not os.path.isfile(config_path):
         raise IOError("Input path should be `config.ocio` file")
 
-    return PyOpenColorIO.Config.CreateFromFile(config_path)
+    # Config is loaded again only if file or OCIO environment changed
+    key = (
+        config_path,
+        os.path.getmtime(config_path),
+        _get_ocio_env_values(),
+    )
+    config = CachedData.ocio_configs.get(key)
+    if config is None:
+        config = PyOpenColorIO.Config.CreateFromFile(config_path)
+        CachedData.ocio_configs[key] = config
+    return config
 
 
 def _get_config_file_rules_colorspace_from_filepath(config_path, filepath):
@@ -15,7 +15,8 @@ from ayon_core.lib import (
     is_in_tests,
     initialize_ayon_connection,
     emit_event,
-    version_up
+    version_up,
+    start_session_profiling,
 )
 from ayon_core.addon import load_addons, AddonsManager
 from ayon_core.settings import get_project_settings
@@ -109,6 +110,10 @@ def install_host(host):
 
     _is_installed = True
 
+    start_session_profiling(
+        "host_{}".format(getattr(host, "name", None) or "unknown")
+    )
+
     # Make sure global AYON connection has set site id and version
     initialize_ayon_connection()
 
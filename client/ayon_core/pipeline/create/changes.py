@@ -1,13 +1,66 @@
 import copy
+import collections
 
 _EMPTY_VALUE = object()
+# Types of values which can't be modified in place
+_IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+def is_immutable_value(value):
+    """Value can't be modified in place.
+
+    Args:
+        value (Any): Value to check.
+
+    Returns:
+        bool: Value is immutable.
+    """
+
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(is_immutable_value(item) for item in value)
+    return False
+
+
+def copy_value(value):
+    """Deep copy of a value which shares its immutable parts.
+
+    Faster alternative of 'copy.deepcopy' for json-like data. Copies of
+    dictionaries and lists are created recursively, immutable values are
+    not copied and other values are deep copied.
+
+    Args:
+        value (Any): Value to copy.
+
+    Returns:
+        Any: Copy of value.
+    """
+
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    value_type = type(value)
+    if value_type is dict or value_type is collections.OrderedDict:
+        return value_type(
+            (key, copy_value(item))
+            for key, item in value.items()
+        )
+    if value_type is list:
+        return [copy_value(item) for item in value]
+    return copy.deepcopy(value)
 
 
 class TrackChangesItem:
     """Helper object to track changes in data.
 
-    Has access to full old and new data and will create deep copy of them,
-    so it is not needed to create copy before passed in.
+    Has access to full old and new data and will create copy of them,
+    so it is not needed to create copy before passed in. Changes are
+    calculated lazily on first access and values returned by the object
+    are copies.
+
+    Values are not copied if candidate keys are passed, in that case caller
+    is responsible for passing values which are not modified after the
+    object is created.
 
     Can work as a dictionary if old or new value is a dictionary. In
     that case received object is another object of 'TrackChangesItem'.
@@ -71,21 +124,46 @@ class TrackChangesItem:
     Args:
         old_value (Any): Old value.
         new_value (Any): New value.
+        candidate_keys (Optional[Iterable[str]]): Keys of dictionary values
+            which may have changed, values of other keys are considered
+            unchanged and are not compared. All keys are compared if not
+            passed.
     """
 
-    def __init__(self, old_value, new_value):
-        self._changed = old_value != new_value
-        # Resolve if value is '_EMPTY_VALUE' after comparison of the values
+    def __init__(self, old_value, new_value, candidate_keys=None):
+        if candidate_keys is None:
+            old_value = copy_value(old_value)
+            new_value = copy_value(new_value)
+        self._set_values(old_value, new_value, candidate_keys)
+
+    @classmethod
+    def _create_without_copy(cls, old_value, new_value):
+        """Create item of values owned by another item."""
+
+        item = cls.__new__(cls)
+        item._set_values(old_value, new_value, None)
+        return item
+
+    def _set_values(self, old_value, new_value, candidate_keys):
+        # Missing value is different from 'None'
+        self._empty_changed = (
+            (old_value is _EMPTY_VALUE) != (new_value is _EMPTY_VALUE)
+        )
         if old_value is _EMPTY_VALUE:
             old_value = None
         if new_value is _EMPTY_VALUE:
             new_value = None
-        self._old_value = copy.deepcopy(old_value)
-        self._new_value = copy.deepcopy(new_value)
+        self._old_value = old_value
+        self._new_value = new_value
 
         self._old_is_dict = isinstance(old_value, dict)
         self._new_is_dict = isinstance(new_value, dict)
 
+        if candidate_keys is not None:
+            candidate_keys = set(candidate_keys)
+        self._candidate_keys = candidate_keys
+
+        self._changed = None
         self._old_keys = None
         self._new_keys = None
         self._available_keys = None
@@ -93,26 +171,28 @@ class TrackChangesItem:
 
         self._changed_keys = None
 
-        self._sub_items = None
+        self._sub_items = {}
 
     def __getitem__(self, key):
         """Getter looks into subitems if object is dictionary."""
 
-        if self._sub_items is None:
-            self._prepare_sub_items()
+        if key not in self._sub_items:
+            if key not in self.available_keys:
+                raise KeyError(key)
+            self._sub_items[key] = self._create_sub_item(key)
         return self._sub_items[key]
 
     def __bool__(self):
         """Boolean of object is if old and new value are the same."""
 
-        return self._changed
+        return self.changed
 
     def get(self, key, default=None):
         """Try to get sub item."""
 
-        if self._sub_items is None:
-            self._prepare_sub_items()
-        return self._sub_items.get(key, default)
+        if key not in self.available_keys:
+            return default
+        return self[key]
 
     @property
     def old_value(self):
@@ -122,7 +202,7 @@ class TrackChangesItem:
             Any: Whatever old value was.
         """
 
-        return copy.deepcopy(self._old_value)
+        return copy_value(self._old_value)
 
     @property
     def new_value(self):
@@ -132,7 +212,7 @@ class TrackChangesItem:
             Any: Whatever new value was.
         """
 
-        return copy.deepcopy(self._new_value)
+        return copy_value(self._new_value)
 
     @property
     def changed(self):
@@ -142,6 +222,18 @@ class TrackChangesItem:
             bool: If data changed.
         """
 
+        if self._changed is None:
+            if self._empty_changed:
+                changed = True
+            elif (
+                self._candidate_keys is not None
+                and self._old_is_dict
+                and self._new_is_dict
+            ):
+                changed = bool(self.changed_keys)
+            else:
+                changed = self._old_value != self._new_value
+            self._changed = changed
         return self._changed
 
     @property
@@ -170,15 +262,13 @@ class TrackChangesItem:
         if not self.is_dict:
             return output
 
-        old_value = self.old_value
-        new_value = self.new_value
         for key in self.changed_keys:
             _old = None
             _new = None
             if self._old_is_dict:
-                _old = old_value.get(key)
+                _old = copy_value(self._old_value.get(key))
             if self._new_is_dict:
-                _new = new_value.get(key)
+                _new = copy_value(self._new_value.get(key))
             output[key] = (_old, _new)
         return output
 
@@ -222,7 +312,7 @@ class TrackChangesItem:
         """
 
         if self._changed_keys is None:
-            self._prepare_sub_items()
+            self._prepare_changed_keys()
         return set(self._changed_keys)
 
     @property
@@ -249,7 +339,7 @@ class TrackChangesItem:
         """
 
         if self._removed_keys is None:
-            self._prepare_sub_items()
+            self._prepare_keys()
         return set(self._removed_keys)
 
     def _prepare_keys(self):
@@ -270,44 +360,39 @@ class TrackChangesItem:
         self._available_keys = old_keys | new_keys
         self._removed_keys = old_keys - new_keys
 
-    def _prepare_sub_items(self):
-        sub_items = {}
-        changed_keys = set()
+    def _prepare_changed_keys(self):
+        if not (self._old_is_dict and self._new_is_dict):
+            # All keys are changed if only one of values is a dictionary
+            self._changed_keys = set(self.available_keys)
+            return
 
+        old_value = self._old_value
+        new_value = self._new_value
         old_keys = self.old_keys
         new_keys = self.new_keys
-        new_value = self.new_value
-        old_value = self.old_value
-        if self._old_is_dict and self._new_is_dict:
-            for key in self.available_keys:
-                item = TrackChangesItem(
-                    old_value.get(key), new_value.get(key)
-                )
-                sub_items[key] = item
-                if item.changed or key not in old_keys or key not in new_keys:
-                    changed_keys.add(key)
-
-        elif self._old_is_dict:
-            old_keys = set(old_value.keys())
-            available_keys = set(old_keys)
-            changed_keys = set(available_keys)
-            for key in available_keys:
-                # NOTE Use '_EMPTY_VALUE' because old value could be 'None'
-                #   which would result in "unchanged" item
-                sub_items[key] = TrackChangesItem(
-                    old_value.get(key), _EMPTY_VALUE
-                )
-
-        elif self._new_is_dict:
-            new_keys = set(new_value.keys())
-            available_keys = set(new_keys)
-            changed_keys = set(available_keys)
-            for key in available_keys:
-                # NOTE Use '_EMPTY_VALUE' because new value could be 'None'
-                #   which would result in "unchanged" item
-                sub_items[key] = TrackChangesItem(
-                    _EMPTY_VALUE, new_value.get(key)
-                )
-
-        self._sub_items = sub_items
+        # Added and removed keys are always changed
+        changed_keys = old_keys ^ new_keys
+        keys = old_keys & new_keys
+        if self._candidate_keys is not None:
+            keys &= self._candidate_keys
+
+        for key in keys:
+            if old_value[key] != new_value[key]:
+                changed_keys.add(key)
         self._changed_keys = changed_keys
+
+    def _create_sub_item(self, key):
+        if self._old_is_dict and self._new_is_dict:
+            return self._create_without_copy(
+                self._old_value.get(key), self._new_value.get(key)
+            )
+
+        # NOTE Use '_EMPTY_VALUE' because old or new value could be 'None'
+        #   which would result in "unchanged" item
+        if self._old_is_dict:
+            return self._create_without_copy(
+                self._old_value.get(key), _EMPTY_VALUE
+            )
+        return self._create_without_copy(
+            _EMPTY_VALUE, self._new_value.get(key)
+        )
@@ -10,15 +10,20 @@ import typing
 from typing import Optional, Iterable, Dict
 
 import pyblish.logic
+import pyblish.plugin
 import pyblish.api
 import ayon_api
 
 from ayon_core.settings import get_project_settings
-from ayon_core.lib import is_func_signature_supported
+from ayon_core.lib import is_func_signature_supported, profile_phase
 from ayon_core.lib.attribute_definitions import get_default_values
 from ayon_core.host import IPublishHost, IWorkfileHost
 from ayon_core.pipeline import Anatomy
-from ayon_core.pipeline.plugin_discover import DiscoverResult
+from ayon_core.pipeline.plugin_discover import (
+    DiscoverResult,
+    get_discover_state,
+    get_paths_state,
+)
 
 from .exceptions import (
     CreatorError,
@@ -34,8 +39,10 @@ from .exceptions import (
 from .changes import TrackChangesItem
 from .structures import PublishAttributes, ConvertorItem, InstanceContextInfo
 from .creator_plugins import (
+    BaseCreator,
     Creator,
     AutoCreator,
+    ProductConvertorPlugin,
     discover_creator_plugins,
     discover_convertor_plugins,
 )
@@ -108,6 +115,12 @@ class CreateContext:
         reset(bool): Reset context on initialization.
         discover_publish_plugins(bool): Discover publish plugins during reset
             phase.
+
+    Incremental reset skips discovery of plugins if their paths, files
+    and project settings did not change, and collects instances only of
+    creators which are dirty. Creator is dirty if it was used to create,
+    update or remove instances, if host context changed or if its
+    collection state changed (see 'BaseCreator.get_collection_state').
     """
 
     def __init__(
@@ -192,6 +205,16 @@ class CreateContext:
 
         self.thumbnail_paths_by_instance_id = {}
 
+        # Incremental reset helpers
+        # - state of plugins discovery by plugins type
+        self._plugins_states = {}
+        # - creator identifiers which must be collected on next reset
+        self._dirty_creator_identifiers = set()
+        # - collection states of creators after last reset
+        self._collection_states = {}
+        # - creator identifiers collected on last reset of instances
+        self._collected_creator_identifiers = set()
+
         # Trigger reset if was enabled
         if reset:
             self.reset(discover_publish_plugins)
@@ -453,22 +476,30 @@ class CreateContext:
             self._log = logging.getLogger(self.__class__.__name__)
         return self._log
 
-    def reset(self, discover_publish_plugins=True):
+    @profile_phase("create_context_reset")
+    def reset(self, discover_publish_plugins=True, incremental=False):
         """Reset context with all plugins and instances.
 
         All changes will be lost if were not saved explicitely.
+
+        Args:
+            discover_publish_plugins (bool): Discover publish plugins.
+            incremental (bool): Discover plugins and collect instances
+                only if something changed since previous reset.
         """
 
         self.reset_preparation()
 
+        if incremental and self.context_has_changed:
+            self.mark_creators_dirty()
         self.reset_current_context()
-        self.reset_plugins(discover_publish_plugins)
+        self.reset_plugins(discover_publish_plugins, incremental)
         self.reset_context_data()
 
         with self.bulk_instances_collection():
-            self.reset_instances()
+            self.reset_instances(incremental)
             self.find_convertor_items()
-            self.execute_autocreators()
+            self.execute_autocreators(incremental)
 
         self.reset_finalization()
 
@@ -508,8 +539,71 @@ class CreateContext:
 
         # Stop access to collection shared data
         self._collection_shared_data = None
+        self._store_collection_states()
         self.refresh_thumbnails()
 
+    def mark_creators_dirty(self, identifiers=None):
+        """Mark creators to collect instances on next incremental reset.
+
+        Hosts can use this when they know that scene data of instances
+        changed out of create context.
+
+        Args:
+            identifiers (Optional[Iterable[str]]): Identifiers of creators.
+                All creators are marked if not passed.
+        """
+
+        if identifiers is None:
+            identifiers = self.creators.keys()
+            self._collection_states = {}
+        self._dirty_creator_identifiers |= set(identifiers)
+
+    def _get_collection_state(self, creator):
+        try:
+            return creator.get_collection_state()
+        except Exception:
+            self.log.warning(
+                "Failed to get collection state of creator \"{}\"".format(
+                    creator.identifier
+                ),
+                exc_info=True
+            )
+        return None
+
+    def _store_collection_states(self):
+        collection_states = {}
+        for identifier, creator in self.creators.items():
+            if identifier in self._dirty_creator_identifiers:
+                continue
+            state = self._get_collection_state(creator)
+            if state is not None:
+                collection_states[identifier] = state
+        self._collection_states = collection_states
+
+    def _get_creators_to_collect(self):
+        """Identifiers of creators which must collect instances.
+
+        Returns:
+            set[str]: Creator identifiers.
+        """
+
+        identifiers = set()
+        for identifier, creator in self.creators.items():
+            prev_state = self._collection_states.get(identifier)
+            if (
+                identifier in self._dirty_creator_identifiers
+                or prev_state is None
+                or prev_state != self._get_collection_state(creator)
+            ):
+                identifiers.add(identifier)
+
+        # Unsaved changes of instances are lost on reset
+        for instance in self._instances_by_id.values():
+            identifier = instance.creator_identifier
+            if identifier not in identifiers and instance.has_changes():
+                identifiers.add(identifier)
+        return identifiers
+
     def _get_current_host_context(self):
         project_name = folder_path = task_name = workfile_path = None
         if hasattr(self.host, "get_current_context"):
@@ -558,16 +652,62 @@ class CreateContext:
         self._current_project_anatomy = None
         self._current_project_settings = None
 
-    def reset_plugins(self, discover_publish_plugins=True):
+    def reset_plugins(self, discover_publish_plugins=True, incremental=False):
         """Reload plugins.
 
         Reloads creators from preregistered paths and can load publish plugins
         if it's enabled on context.
+
+        Args:
+            discover_publish_plugins (bool): Discover publish plugins.
+            incremental (bool): Skip discovery of plugins if registered
+                plugins, files in plugin paths and project settings did not
+                change since previous reset.
         """
 
-        self._reset_publish_plugins(discover_publish_plugins)
-        self._reset_creator_plugins()
-        self._reset_convertor_plugins()
+        project_settings = (
+            self.get_current_project_name(),
+            self.get_current_project_settings(),
+        )
+        plugins_states = {
+            "publish": (
+                project_settings,
+                self._get_publish_plugins_state(discover_publish_plugins),
+            ),
+            "creator": (
+                project_settings,
+                self.host_name,
+                get_discover_state(BaseCreator),
+            ),
+            "convertor": (get_discover_state(ProductConvertorPlugin), ),
+        }
+        prev_states = {}
+        if incremental:
+            prev_states = self._plugins_states
+        self._plugins_states = plugins_states
+
+        if plugins_states["publish"] != prev_states.get("publish"):
+            self._reset_publish_plugins(discover_publish_plugins)
+            # Publish attributes of instances changed
+            self.mark_creators_dirty()
+
+        if plugins_states["creator"] != prev_states.get("creator"):
+            self._reset_creator_plugins()
+            self.mark_creators_dirty()
+
+        if plugins_states["convertor"] != prev_states.get("convertor"):
+            self._reset_convertor_plugins()
+
+    def _get_publish_plugins_state(self, discover_publish_plugins):
+        if not discover_publish_plugins:
+            return None
+        return (
+            get_paths_state(pyblish.plugin.plugin_paths()),
+            tuple(pyblish.plugin.registered_plugins()),
+            tuple(pyblish.plugin.registered_hosts()),
+            tuple(pyblish.logic.registered_targets()),
+            tuple(pyblish.plugin._registered_plugin_filters),
+        )
 
     def _reset_publish_plugins(self, discover_publish_plugins):
         from ayon_core.pipeline import AYONPyblishPluginMixin
@@ -816,6 +956,7 @@ class CreateContext:
         """
 
         creator = self._get_creator_in_create(creator_identifier)
+        self._dirty_creator_identifiers.add(creator_identifier)
 
         project_name = self.project_name
         if folder_entity is None:
@@ -943,6 +1084,7 @@ class CreateContext:
                 the method should raise.
         """
 
+        self._dirty_creator_identifiers.add(identifier)
         result, fail_info = self._create_with_unified_error(
             identifier, None, *args, **kwargs
         )
@@ -1003,14 +1145,40 @@ class CreateContext:
             )
             self.get_instances_context_info(instances_to_validate)
 
-    def reset_instances(self):
-        """Reload instances"""
+    def reset_instances(self, incremental=False):
+        """Reload instances.
+
+        Args:
+            incremental (bool): Collect instances only of dirty creators
+                and keep instances of other creators.
+        """
+
+        if incremental:
+            identifiers = self._get_creators_to_collect()
+        else:
+            identifiers = set(self.creators.keys())
+        self._collected_creator_identifiers = identifiers
+        self._dirty_creator_identifiers = set()
+
+        prev_instances_by_identifier = collections.defaultdict(list)
+        for instance in self._instances_by_id.values():
+            identifier = instance.creator_identifier
+            if identifier not in identifiers:
+                prev_instances_by_identifier[identifier].append(instance)
         self._instances_by_id = collections.OrderedDict()
 
         # Collect instances
         error_message = "Collection of instances for creator {} failed. {}"
         failed_info = []
         for creator in self.sorted_creators:
+            if creator.identifier not in identifiers:
+                # Keep instances collected on previous reset
+                for instance in prev_instances_by_identifier[
+                    creator.identifier
+                ]:
+                    self._instances_by_id[instance.id] = instance
+                continue
+
             label = creator.label
             identifier = creator.identifier
             failed = False
@@ -1034,6 +1202,7 @@ class CreateContext:
                 )
 
             if failed:
+                self._dirty_creator_identifiers.add(identifier)
                 failed_info.append(
                     prepare_failed_creator_operation_info(
                         identifier, label, exc_info, add_traceback
@@ -1074,17 +1243,27 @@ class CreateContext:
         if failed_info:
             raise ConvertorsFindFailed(failed_info)
 
-    def execute_autocreators(self):
+    def execute_autocreators(self, incremental=False):
         """Execute discovered AutoCreator plugins.
 
         Reset instances if any autocreator executed properly.
+
+        Args:
+            incremental (bool): Execute only autocreators which collected
+                instances on last reset of instances.
         """
 
         failed_info = []
         for creator in self.sorted_autocreators:
             identifier = creator.identifier
+            if (
+                incremental
+                and identifier not in self._collected_creator_identifiers
+            ):
+                continue
             _, fail_info = self._create_with_unified_error(identifier, creator)
             if fail_info is not None:
+                self._dirty_creator_identifiers.add(identifier)
                 failed_info.append(fail_info)
 
         if failed_info:
@@ -1247,6 +1426,9 @@ class CreateContext:
         """Save instance specific values."""
         instances_by_identifier = collections.defaultdict(list)
         for instance in self._instances_by_id.values():
+            # Cheap check avoids calculation of changes of all instances
+            if not instance.has_changes():
+                continue
             instance_changes = instance.changes()
             if not instance_changes:
                 continue
@@ -1269,6 +1451,7 @@ class CreateContext:
             update_list = instances_by_identifier[identifier]
             if not update_list:
                 continue
+            self._dirty_creator_identifiers.add(identifier)
 
             label = creator.label
             failed = False
@@ -1319,6 +1502,7 @@ class CreateContext:
         for instance in instances:
             identifier = instance.creator_identifier
             instances_by_identifier[identifier].append(instance)
+        self._dirty_creator_identifiers |= set(instances_by_identifier)
 
         # Just remove instances from context if creator is not available
         missing_creators = set(instances_by_identifier) - set(self.creators)
@@ -1434,6 +1618,8 @@ class CreateContext:
 
         convertor = self.convertors_plugins.get(convertor_identifier)
         if convertor is not None:
+            # Converted instances can belong to any creator
+            self.mark_creators_dirty()
             convertor.convert()
 
     def run_convertors(self, convertor_identifiers):
@@ -427,6 +427,24 @@ class BaseCreator(ABC):
 
         pass
 
+    def get_collection_state(self):
+        """State of scene data from which are instances collected.
+
+        Incremental reset of 'CreateContext' does not call
+        'collect_instances' if state did not change since previous reset
+        and keeps instances collected previously. State must change
+        whenever 'collect_instances' would collect different instances,
+        e.g. it can be a modification counter of scene nodes holding
+        instances data. Computation of state should be much faster than
+        collection of instances.
+
+        Returns:
+            Optional[Hashable]: State of scene data or 'None' if state is
+                not known and instances are always collected.
+        """
+
+        return None
+
     @abstractmethod
     def update_instances(self, update_list):
         """Store changes of existing instances so they can be recollected.
@@ -14,7 +14,7 @@ from ayon_core.pipeline import (
 )
 
 from .exceptions import ImmutableKeyError
-from .changes import TrackChangesItem
+from .changes import TrackChangesItem, copy_value, is_immutable_value
 
 
 class ConvertorItem:
@@ -78,6 +78,10 @@ class AttributeValues:
 
     Has dictionary like methods. Not all of them are allowed all the time.
 
+    Result of 'has_changes' is cached until values are changed using
+    methods of the object. Values which can be modified in place are
+    compared on each call.
+
     Args:
         attr_defs(AbstractAttrDef): Definitions of value type and properties.
         values(dict): Values after possible conversion.
@@ -86,8 +90,10 @@ class AttributeValues:
 
     def __init__(self, attr_defs, values, origin_data=None):
         if origin_data is None:
-            origin_data = copy.deepcopy(values)
+            origin_data = copy_value(values)
         self._origin_data = origin_data
+        self._has_changes = None
+        self._has_mutable_values = False
 
         attr_defs_by_key = {
             attr_def.key: attr_def
@@ -147,8 +153,12 @@ class AttributeValues:
             self._data[_key] = _value
             changes[_key] = _value
 
+        if changes:
+            self._on_values_change()
+
     def pop(self, key, default=None):
         value = self._data.pop(key, default)
+        self._on_values_change()
         # Remove attribute definition if is 'UnknownDef'
         # - gives option to get rid of unknown values
         attr_def = self._attr_defs_by_key.get(key)
@@ -159,9 +169,32 @@ class AttributeValues:
 
     def reset_values(self):
         self._data = {}
+        self._on_values_change()
 
     def mark_as_stored(self):
-        self._origin_data = copy.deepcopy(self._data)
+        # Stored data contain default values of not set attributes
+        # - origin data are replaced, never modified, so they can be shared
+        self._origin_data = copy_value(self.data_to_store())
+        self._on_values_change()
+
+    def has_changes(self):
+        """Values changed since they were loaded or stored.
+
+        Returns:
+            bool: Data to store are different from origin data.
+        """
+
+        if self._has_changes is None or self._has_mutable_values:
+            data = self.data_to_store()
+            self._has_changes = self._origin_data != data
+            self._has_mutable_values = not all(
+                is_immutable_value(value)
+                for value in data.values()
+            )
+        return self._has_changes
+
+    def _on_values_change(self):
+        self._has_changes = None
 
     @property
     def attr_defs(self):
@@ -175,7 +208,7 @@ class AttributeValues:
 
     @property
     def origin_data(self):
-        return copy.deepcopy(self._origin_data)
+        return copy_value(self._origin_data)
 
     def data_to_store(self):
         """Create new dictionary with data to store.
@@ -234,6 +267,10 @@ class PublishAttributeValues(AttributeValues):
     def parent(self):
         return self.publish_attributes.parent
 
+    def _on_values_change(self):
+        super()._on_values_change()
+        self.publish_attributes._on_values_change()
+
 
 class PublishAttributes:
     """Wrapper for publish plugin attribute definitions.
@@ -251,12 +288,14 @@ class PublishAttributes:
 
     def __init__(self, parent, origin_data, attr_plugins=None):
         self.parent = parent
-        self._origin_data = copy.deepcopy(origin_data)
+        self._origin_data = copy_value(origin_data)
+        self._has_changes = None
+        self._has_mutable_values = False
 
         attr_plugins = attr_plugins or []
         self.attr_plugins = attr_plugins
 
-        self._data = copy.deepcopy(origin_data)
+        self._data = copy_value(origin_data)
         self._plugin_names_order = []
         self._missing_plugins = []
 
@@ -294,6 +333,7 @@ class PublishAttributes:
         if key in self._missing_plugins:
             self._missing_plugins.remove(key)
             removed_item = self._data.pop(key)
+            self._on_values_change()
             return removed_item.data_to_store()
 
         value_item = self._data[key]
@@ -310,7 +350,28 @@ class PublishAttributes:
             yield name
 
     def mark_as_stored(self):
-        self._origin_data = copy.deepcopy(self.data_to_store())
+        self._origin_data = copy_value(self.data_to_store())
+        self._on_values_change()
+
+    def has_changes(self):
+        """Values of any plugin changed since they were loaded or stored.
+
+        Returns:
+            bool: Data to store are different from origin data.
+        """
+
+        if self._has_changes is None or self._has_mutable_values:
+            data = self.data_to_store()
+            self._has_changes = self._origin_data != data
+            self._has_mutable_values = not all(
+                is_immutable_value(value)
+                for plugin_values in data.values()
+                for value in plugin_values.values()
+            )
+        return self._has_changes
+
+    def _on_values_change(self):
+        self._has_changes = None
 
     def data_to_store(self):
         """Convert attribute values to "data to store"."""
@@ -322,7 +383,7 @@ class PublishAttributes:
 
     @property
     def origin_data(self):
-        return copy.deepcopy(self._origin_data)
+        return copy_value(self._origin_data)
 
     def set_publish_plugins(self, attr_plugins):
         """Set publish plugins attribute definitions."""
@@ -348,7 +409,7 @@ class PublishAttributes:
             self._plugin_names_order.append(key)
 
             value = data.get(key) or {}
-            orig_value = copy.deepcopy(origin_data.get(key) or {})
+            orig_value = copy_value(origin_data.get(key) or {})
             self._data[key] = PublishAttributeValues(
                 self, attr_defs, value, orig_value
             )
@@ -359,6 +420,7 @@ class PublishAttributes:
                 self._data[key] = PublishAttributeValues(
                     self, [], value, value
                 )
+        self._on_values_change()
 
     def serialize_attributes(self):
         return {
@@ -384,7 +446,7 @@ class PublishAttributes:
         for plugin_name, attr_defs_data in attr_defs.items():
             attr_defs = deserialize_attr_defs(attr_defs_data)
             value = data.get(plugin_name) or {}
-            orig_value = copy.deepcopy(origin_data.get(plugin_name) or {})
+            orig_value = copy_value(origin_data.get(plugin_name) or {})
             self._data[plugin_name] = PublishAttributeValues(
                 self, attr_defs, value, orig_value
             )
@@ -395,6 +457,7 @@ class PublishAttributes:
                 self._data[key] = PublishAttributeValues(
                     self, [], value, value
                 )
+        self._on_values_change()
 
 
 class InstanceContextInfo:
@@ -438,6 +501,13 @@ class CreatedInstance:
         group_label (str): Default group label from creator plugin.
         creator_attr_defs (List[AbstractAttrDef]): Attribute definitions from
             creator.
+
+    Notes:
+        Changes are tracked by keys written using dictionary like methods.
+            Origin data are replaced on 'mark_as_stored', never modified,
+            so unchanged values are shared with previous origin data. Values
+            which can be modified in place (e.g. lists) are compared on
+            each change check.
     """
 
     # Keys that can't be changed or removed from data after loading using
@@ -489,7 +559,9 @@ class CreatedInstance:
         orig_publish_attributes = data.pop("publish_attributes", None) or {}
 
         # Store original value of passed data
-        self._orig_data = copy.deepcopy(data)
+        self._orig_data = copy_value(data)
+        # Keys which were set or removed since origin data were stored
+        self._written_keys = set()
 
         # Pop 'productType' and 'productName' to prevent unexpected changes
         data.pop("productType", None)
@@ -526,7 +598,7 @@ class CreatedInstance:
         self._data["variant"] = self._data.get("variant") or ""
         # Stored creator specific attribute values
         # {key: value}
-        creator_values = copy.deepcopy(orig_creator_attributes)
+        creator_values = copy_value(orig_creator_attributes)
 
         self._data["creator_attributes"] = CreatorAttributeValues(
             self,
@@ -547,6 +619,8 @@ class CreatedInstance:
         if not self._data.get("instance_id"):
             self._data["instance_id"] = str(uuid4())
 
+        self._reset_written_keys()
+
     def __str__(self):
         return (
             "<CreatedInstance {product[name]}"
@@ -568,6 +642,7 @@ class CreatedInstance:
         # Validate immutable keys
         if key not in self.__immutable_keys:
             self._data[key] = value
+            self._written_keys.add(key)
 
         elif value != self._data.get(key):
             # Raise exception if key is immutable and value has changed
@@ -582,6 +657,7 @@ class CreatedInstance:
             raise ImmutableKeyError(key)
 
         self._data.pop(key, *args, **kwargs)
+        self._written_keys.add(key)
 
     def keys(self):
         return self._data.keys()
@@ -617,7 +693,7 @@ class CreatedInstance:
 
     @property
     def origin_data(self):
-        output = copy.deepcopy(self._orig_data)
+        output = copy_value(self._orig_data)
         output["creator_attributes"] = self.creator_attributes.origin_data
         output["publish_attributes"] = self.publish_attributes.origin_data
         return output
@@ -673,10 +749,53 @@ class CreatedInstance:
 
         return self._transient_data
 
+    def has_changes(self):
+        """Instance data changed since they were loaded or stored.
+
+        Cheaper alternative of 'changes' when only information if instance
+            changed is needed.
+
+        Returns:
+            bool: Instance has changes.
+        """
+
+        return bool(
+            self._get_changed_keys()
+            or self.creator_attributes.has_changes()
+            or self.publish_attributes.has_changes()
+        )
+
     def changes(self):
-        """Calculate and return changes."""
+        """Calculate and return changes.
+
+        Only keys which could change are compared. Output is a snapshot of
+            current data, only values of changed keys are copied. Unchanged
+            values are taken from origin data which are never modified.
 
-        return TrackChangesItem(self.origin_data, self.data_to_store())
+        Returns:
+            TrackChangesItem: Changes of instance data.
+        """
+
+        candidate_keys = self._get_changed_keys()
+        if self.creator_attributes.has_changes():
+            candidate_keys.add("creator_attributes")
+        if self.publish_attributes.has_changes():
+            candidate_keys.add("publish_attributes")
+
+        origin_data = dict(self._orig_data)
+        origin_data["creator_attributes"] = (
+            self.creator_attributes._origin_data
+        )
+        origin_data["publish_attributes"] = (
+            self.publish_attributes._origin_data
+        )
+        new_data = self.data_to_store()
+        for key, value in new_data.items():
+            if key in candidate_keys or key not in origin_data:
+                new_data[key] = copy_value(value)
+            else:
+                new_data[key] = origin_data[key]
+        return TrackChangesItem(origin_data, new_data, candidate_keys)
 
     def mark_as_stored(self):
         """Should be called when instance data are stored.
@@ -684,19 +803,64 @@ class CreatedInstance:
         Origin data are replaced by current data so changes are cleared.
         """
 
-        orig_keys = set(self._orig_data.keys())
-        for key, value in self._data.items():
-            orig_keys.discard(key)
-            if key in ("creator_attributes", "publish_attributes"):
-                continue
-            self._orig_data[key] = copy.deepcopy(value)
-
-        for key in orig_keys:
-            self._orig_data.pop(key)
+        changed_keys = self._get_changed_keys()
+        if changed_keys:
+            # Create new origin data so previous origin data, which may be
+            #   used by changes objects, are not modified
+            orig_data = dict(self._orig_data)
+            for key in changed_keys:
+                if key in self._data:
+                    orig_data[key] = copy_value(self._data[key])
+                else:
+                    orig_data.pop(key, None)
+            self._orig_data = orig_data
+        self._written_keys = set()
 
         self.creator_attributes.mark_as_stored()
         self.publish_attributes.mark_as_stored()
 
+    def _get_changed_keys(self, keys=None):
+        """Keys with changed values, except attribute values.
+
+        Args:
+            keys (Optional[Iterable[str]]): Keys to compare. Written keys
+                and keys with values which can be modified in place are
+                compared if not passed.
+
+        Returns:
+            Set[str]: Keys with values different from origin data.
+        """
+
+        data = self._data
+        orig_data = self._orig_data
+        if keys is None:
+            keys = set(self._written_keys)
+            for key, value in data.items():
+                if key not in keys and not is_immutable_value(value):
+                    keys.add(key)
+
+        changed_keys = set()
+        for key in keys:
+            if key in ("creator_attributes", "publish_attributes"):
+                continue
+            in_data = key in data
+            if in_data != (key in orig_data):
+                changed_keys.add(key)
+            elif in_data and data[key] != orig_data[key]:
+                changed_keys.add(key)
+        return changed_keys
+
+    def _reset_written_keys(self):
+        """Compare all keys with origin data to find written keys.
+
+        Used when origin data are set from outside of dictionary like
+            methods, e.g. on initialization.
+        """
+
+        self._written_keys = self._get_changed_keys(
+            set(self._orig_data) | set(self._data)
+        )
+
     @property
     def creator_attributes(self):
         return self._data["creator_attributes"]
@@ -850,6 +1014,7 @@ class CreatedInstance:
             creator_attr_defs=creator_attr_defs
         )
         obj._orig_data = serialized_data["orig_data"]
+        obj._reset_written_keys()
         obj.publish_attributes.deserialize_attributes(publish_attributes)
 
         return obj
@@ -3,12 +3,53 @@ import os
 import copy
 import shutil
 import glob
+import time
+import logging
 import clique
 import collections
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    FIRST_COMPLETED,
+    wait,
+)
 
 from ayon_core.lib import create_hard_link
 
 
+def _copy_file_data(src_path, dst_path):
+    """Copy content of file.
+
+    Uses 'os.copy_file_range' when available which allows filesystems that
+    support reflinks (e.g. Btrfs or XFS) to share data blocks instead of
+    copying them. Falls back to 'shutil.copyfile', also when
+    'os.copy_file_range' stops before whole file is copied, which happens
+    on some FUSE, overlay or network filesystems.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        shutil.copyfile(src_path, dst_path)
+        return
+
+    remaining = None
+    try:
+        with open(src_path, "rb") as src_stream:
+            with open(dst_path, "wb") as dst_stream:
+                remaining = os.fstat(src_stream.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_file_range(
+                        src_stream.fileno(), dst_stream.fileno(), remaining
+                    )
+                    if copied == 0:
+                        break
+                    remaining -= copied
+    except OSError:
+        remaining = None
+
+    # Copy is not complete
+    if remaining != 0:
+        shutil.copyfile(src_path, dst_path)
+
+
 def _copy_file(src_path, dst_path):
     """Hardlink file if possible(to save space), copy if not.
 
@@ -24,7 +65,145 @@ def _copy_file(src_path, dst_path):
             dst_path
         )
     except OSError:
-        shutil.copyfile(src_path, dst_path)
+        _copy_file_data(src_path, dst_path)
+
+
+class DeliveryTransfers:
+    """Transfers of delivery processed in parallel.
+
+    All transfers are collected first and processed at once using thread
+    pool. Files are hardlinked when possible, copied otherwise. Existing
+    destination files are skipped.
+
+    Progress callback is called from thread which called 'process' with
+    dictionary containing 'transferred_files', 'total_files',
+    'transferred_bytes', 'total_bytes', 'bytes_per_second' and 'eta'
+    (seconds or None if unknown).
+
+    Args:
+        max_workers (Optional[int]): Maximum number of threads. Decided
+            by 'ThreadPoolExecutor' if not passed.
+        progress_callback (Optional[Callable[[dict[str, Any]], None]]):
+            Callback called with progress information.
+        log (Optional[logging.Logger]): Logger.
+
+    """
+    # Interval of progress callback calls in seconds
+    progress_interval = 0.2
+
+    def __init__(self, max_workers=None, progress_callback=None, log=None):
+        if log is None:
+            log = logging.getLogger(self.__class__.__name__)
+        self._max_workers = max_workers
+        self._progress_callback = progress_callback
+        self._log = log
+        self._transfers = {}
+
+    def __len__(self):
+        return len(self._transfers)
+
+    @property
+    def total_bytes(self):
+        return sum(size for _, size in self._transfers.values())
+
+    def add(self, src_path, dst_path, size=None):
+        """Add file to transfer.
+
+        Args:
+            src_path (str): Source path.
+            dst_path (str): Destination path.
+            size (Optional[int]): Size of source file in bytes. Size is
+                read from source file if not passed.
+
+        """
+        if size is None:
+            try:
+                size = os.path.getsize(src_path)
+            except OSError:
+                size = 0
+        self._transfers[dst_path] = (src_path, size)
+
+    def process(self):
+        """Process all added transfers.
+
+        Returns:
+            int: Number of processed transfers.
+
+        """
+        total_files = len(self._transfers)
+        total_bytes = self.total_bytes
+        dirpaths = {
+            os.path.dirname(dst_path)
+            for dst_path in self._transfers
+        }
+        for dirpath in dirpaths:
+            if not os.path.exists(dirpath):
+                os.makedirs(dirpath)
+
+        transferred_files = 0
+        transferred_bytes = 0
+        start_time = time.time()
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        try:
+            size_by_future = {}
+            for dst_path, (src_path, size) in self._transfers.items():
+                self._log.debug(
+                    "Copying single: {} -> {}".format(src_path, dst_path)
+                )
+                future = executor.submit(_copy_file, src_path, dst_path)
+                size_by_future[future] = size
+
+            pending = set(size_by_future)
+            while pending:
+                done, pending = wait(
+                    pending,
+                    timeout=self.progress_interval,
+                    return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    future.result()
+                    transferred_files += 1
+                    transferred_bytes += size_by_future[future]
+
+                self._emit_progress(
+                    start_time,
+                    transferred_files,
+                    total_files,
+                    transferred_bytes,
+                    total_bytes
+                )
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return transferred_files
+
+    def _emit_progress(
+        self,
+        start_time,
+        transferred_files,
+        total_files,
+        transferred_bytes,
+        total_bytes
+    ):
+        if self._progress_callback is None:
+            return
+
+        elapsed = time.time() - start_time
+        bytes_per_second = 0.0
+        eta = None
+        if elapsed > 0:
+            bytes_per_second = transferred_bytes / elapsed
+        if bytes_per_second > 0:
+            eta = (total_bytes - transferred_bytes) / bytes_per_second
+
+        self._progress_callback({
+            "transferred_files": transferred_files,
+            "total_files": total_files,
+            "transferred_bytes": transferred_bytes,
+            "total_bytes": total_bytes,
+            "bytes_per_second": bytes_per_second,
+            "eta": eta,
+        })
 
 
 def get_format_dict(anatomy, location_path):
@@ -114,7 +293,7 @@ def check_destination_path(
     return report_items
 
 
-def deliver_single_file(
+def get_single_file_delivery_path(
     src_path,
     repre,
     anatomy,
@@ -124,7 +303,7 @@ def deliver_single_file(
     report_items,
     log
 ):
-    """Copy single file to calculated path based on template
+    """Calculate delivery path of single file based on template.
 
     Args:
         src_path(str): path of source representation file
@@ -138,7 +317,8 @@ def deliver_single_file(
         log (logging.Logger): for log printing
 
     Returns:
-        (collections.defaultdict, int)
+        (collections.defaultdict, Union[str, None]): Report items and
+            delivery path. Path is 'None' if file can't be delivered.
     """
 
     # Make sure path is valid for all platforms
@@ -147,7 +327,7 @@ def deliver_single_file(
     if not os.path.exists(src_path):
         msg = "{} doesn't exist for {}".format(src_path, repre["id"])
         report_items["Source file was not found"].append(msg)
-        return report_items, 0
+        return report_items, None
 
     if format_dict:
         anatomy_data = copy.deepcopy(anatomy_data)
@@ -164,6 +344,50 @@ def deliver_single_file(
     # Remove newlines from the end of the string to avoid OSError during copy
     delivery_path = delivery_path.rstrip()
 
+    return report_items, delivery_path
+
+
+def deliver_single_file(
+    src_path,
+    repre,
+    anatomy,
+    template_name,
+    anatomy_data,
+    format_dict,
+    report_items,
+    log
+):
+    """Copy single file to calculated path based on template
+
+    Args:
+        src_path(str): path of source representation file
+        repre (dict): full repre, used only in deliver_sequence, here only
+            as to share same signature
+        anatomy (Anatomy)
+        template_name (string): user selected delivery template name
+        anatomy_data (dict): data from repre to fill anatomy with
+        format_dict (dict): root dictionary with names and values
+        report_items (collections.defaultdict): to return error messages
+        log (logging.Logger): for log printing
+
+    Returns:
+        (collections.defaultdict, int)
+    """
+
+    report_items, delivery_path = get_single_file_delivery_path(
+        src_path,
+        repre,
+        anatomy,
+        template_name,
+        anatomy_data,
+        format_dict,
+        report_items,
+        log
+    )
+    if delivery_path is None:
+        return report_items, 0
+
+    src_path = os.path.normpath(src_path.replace("\\", "/"))
     delivery_folder = os.path.dirname(delivery_path)
     if not os.path.exists(delivery_folder):
         os.makedirs(delivery_folder)
@@ -174,7 +398,7 @@ def deliver_single_file(
     return report_items, 1
 
 
-def deliver_sequence(
+def get_sequence_delivery_transfers(
     src_path,
     repre,
     anatomy,
@@ -186,14 +410,10 @@ def deliver_sequence(
     has_renumbered_frame=False,
     new_frame_start=0
 ):
-    """ For Pype2(mainly - works in 3 too) where representation might not
-        contain files.
-
-        Uses listing physical files (not 'files' on repre as a)might not be
-         present, b)might not be reliable for representation and copying them.
+    """Calculate source and delivery paths of sequence files.
 
-         TODO Should be refactored when files are sufficient to drive all
-         representations.
+    Uses listing physical files (not 'files' on repre as a)might not be
+    present, b)might not be reliable for representation).
 
     Args:
         src_path(str): path of source representation file
@@ -206,7 +426,8 @@ def deliver_sequence(
         log (logging.Logger): for log printing
 
     Returns:
-        (collections.defaultdict, int)
+        (collections.defaultdict, list[tuple[str, str]]): Report items and
+            source and destination paths of files to transfer.
     """
 
     src_path = os.path.normpath(src_path.replace("\\", "/"))
@@ -222,7 +443,7 @@ def deliver_sequence(
         msg = "{} doesn't exist for {}".format(
             src_path, repre["id"])
         report_items["Source file was not found"].append(msg)
-        return report_items, 0
+        return report_items, []
 
     delivery_template = anatomy.get_template_item(
         "delivery", template_name, "path", default=None
@@ -233,7 +454,7 @@ def deliver_sequence(
             " was not found"
         ).format(template_name, anatomy.project_name)
         report_items[""].append(msg)
-        return report_items, 0
+        return report_items, []
 
     # Check if 'frame' key is available in template which is required
     #   for sequence delivery
@@ -244,7 +465,7 @@ def deliver_sequence(
             " can't be processed."
         ).format(template_name, anatomy.project_name)
         report_items[""].append(msg)
-        return report_items, 0
+        return report_items, []
 
     dir_path, file_name = os.path.split(str(src_path))
 
@@ -255,7 +476,7 @@ def deliver_sequence(
         msg = "Source extension not found, cannot find collection"
         report_items[msg].append(src_path)
         log.warning("{} <{}>".format(msg, context))
-        return report_items, 0
+        return report_items, []
 
     ext = "." + ext
     # context.representation could be .psd
@@ -274,7 +495,7 @@ def deliver_sequence(
         msg = "Source collection of files was not found"
         report_items[msg].append(src_path)
         log.warning("{} <{}>".format(msg, src_path))
-        return report_items, 0
+        return report_items, []
 
     frame_indicator = "@####@"
 
@@ -285,7 +506,6 @@ def deliver_sequence(
     delivery_path = delivery_template.format_strict(anatomy_data)
 
     delivery_path = os.path.normpath(delivery_path.replace("\\", "/"))
-    delivery_folder = os.path.dirname(delivery_path)
     dst_head, dst_tail = delivery_path.split(frame_indicator)
     dst_padding = src_collection.padding
     dst_collection = clique.Collection(
@@ -294,12 +514,9 @@ def deliver_sequence(
         padding=dst_padding
     )
 
-    if not os.path.exists(delivery_folder):
-        os.makedirs(delivery_folder)
-
     src_head = src_collection.head
     src_tail = src_collection.tail
-    uploaded = 0
+    transfers = []
     first_frame = min(src_collection.indexes)
     for index in src_collection.indexes:
         src_padding = src_collection.format("{padding}") % index
@@ -318,12 +535,67 @@ def deliver_sequence(
                 msg = "Renumber frame has a smaller number than original frame"     # noqa
                 report_items[msg].append(src_file_name)
                 log.warning("{} <{}>".format(msg, context))
-                return report_items, 0
+                return report_items, []
         dst_padding = dst_collection.format("{padding}") % dst_index
         dst = "{}{}{}".format(dst_head, dst_padding, dst_tail)
-        log.debug("Copying single: {} -> {}".format(src, dst))
-        _copy_file(src, dst)
+        transfers.append((src, dst))
+
+    return report_items, transfers
+
+
+def deliver_sequence(
+    src_path,
+    repre,
+    anatomy,
+    template_name,
+    anatomy_data,
+    format_dict,
+    report_items,
+    log,
+    has_renumbered_frame=False,
+    new_frame_start=0
+):
+    """ For Pype2(mainly - works in 3 too) where representation might not
+        contain files.
+
+        Uses listing physical files (not 'files' on repre as a)might not be
+         present, b)might not be reliable for representation and copying them.
+
+         TODO Should be refactored when files are sufficient to drive all
+         representations.
+
+    Args:
+        src_path(str): path of source representation file
+        repre (dict): full representation
+        anatomy (Anatomy)
+        template_name (string): user selected delivery template name
+        anatomy_data (dict): data from repre to fill anatomy with
+        format_dict (dict): root dictionary with names and values
+        report_items (collections.defaultdict): to return error messages
+        log (logging.Logger): for log printing
+
+    Returns:
+        (collections.defaultdict, int)
+    """
+
+    report_items, transfers = get_sequence_delivery_transfers(
+        src_path,
+        repre,
+        anatomy,
+        template_name,
+        anatomy_data,
+        format_dict,
+        report_items,
+        log,
+        has_renumbered_frame,
+        new_frame_start
+    )
+    if not transfers:
+        return report_items, 0
 
-        uploaded += 1
+    delivery_transfers = DeliveryTransfers(log=log)
+    for src, dst in transfers:
+        delivery_transfers.add(src, dst)
+    uploaded = delivery_transfers.process()
 
     return report_items, uploaded
@@ -7,7 +7,7 @@ from copy import deepcopy
 import attr
 import ayon_api
 import clique
-from ayon_core.lib import Logger
+from ayon_core.lib import Logger, create_file_link
 from ayon_core.pipeline import get_current_project_name, get_representation_path
 from ayon_core.pipeline.create import get_product_name
 from ayon_core.pipeline.farm.patterning import match_aov_pattern
@@ -1161,6 +1161,7 @@ def copy_extend_frames(instance, representation):
 
     This will copy all existing frames from product's latest version back
     to render directory and rename them to what renderer is expecting.
+    Frames out of rendered frame range are hardlinked if possible.
 
     Arguments:
         instance (pyblish.plugin.Instance): instance to get required
@@ -1222,12 +1223,13 @@ def copy_extend_frames(instance, representation):
         # silencing linter as we need to compare to True, not to
         # type
         assert fn is not None, "padding string wasn't found"
-        # list of tuples (source, destination)
+        # list of tuples (source, destination, frame)
         staging = representation.get("stagingDir")
         staging = anatomy.fill_root(staging)
         resource_files.append(
             (frame, os.path.join(
-                staging, "{}{}{}".format(pre, fn["frame"], post)))
+                staging, "{}{}{}".format(pre, fn["frame"], post)),
+             int(fn["frame"]))
         )
 
     # test if destination dir exists and create it if not
@@ -1235,12 +1237,27 @@ def copy_extend_frames(instance, representation):
     if not os.path.isdir(output_dir):
         os.makedirs(output_dir)
 
-    # copy files
-    for source in resource_files:
-        speedcopy.copy(source[0], source[1])
-        log.info("  > {}".format(source[1]))
+    # Hardlink frames which won't be rendered, renderer could write into
+    #   published file through a link. Copy files if link can't be created.
+    linked_count = 0
+    for src_path, dst_path, frame in resource_files:
+        is_rendered = (
+            start is None
+            or end is None
+            or start <= frame <= end
+        )
+        if (
+            not is_rendered
+            and create_file_link(src_path, dst_path, allow_symlink=False)
+        ):
+            linked_count += 1
+        else:
+            speedcopy.copy(src_path, dst_path)
+        log.info("  > {}".format(dst_path))
 
-    log.info("Finished copying %i files" % len(resource_files))
+    log.info("Finished linking {} and copying {} files".format(
+        linked_count, len(resource_files) - linked_count
+    ))
 
 
 def attach_instances_to_product(attach_to, instances):
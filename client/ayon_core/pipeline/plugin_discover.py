@@ -2,7 +2,7 @@ import os
 import inspect
 import traceback
 
-from ayon_core.lib import Logger
+from ayon_core.lib import Logger, profile_phase
 from ayon_core.lib.python_module_tools import (
     modules_from_path,
     classes_from_module,
@@ -100,8 +100,9 @@ class PluginDiscoverContext(object):
     """Store and discover registered types nad registered paths to types.
 
     Keeps in memory all registered types and their paths. Paths are dynamically
-    loaded on discover so different discover calls won't return the same
-    class objects even if were loaded from same file.
+    loaded on discover. Files which did not change since previous discover
+    are not imported again, so discover calls return the same class objects
+    with class attributes restored to values they had after import.
     """
 
     def __init__(self):
@@ -121,12 +122,14 @@ class PluginDiscoverContext(object):
 
         return self._last_discovered_plugins.get(superclass)
 
+    @profile_phase("plugin_discovery")
     def discover(
         self,
         superclass,
         allow_duplicates=True,
         ignore_classes=None,
-        return_report=False
+        return_report=False,
+        force_reload=False
     ):
         """Find and return subclasses of `superclass`
 
@@ -136,6 +139,8 @@ class PluginDiscoverContext(object):
             ignore_classes (list): List of classes that will be ignored
                 and not added to result.
             return_report (bool): Output will be full report if set to 'True'.
+            force_reload (bool): Import all files from registered paths
+                even if they did not change.
 
         Returns:
             Union[DiscoverResult, list[Any]]: Object holding successfully
@@ -168,7 +173,9 @@ class PluginDiscoverContext(object):
 
         # Include plug-ins from registered paths
         for path in registered_paths:
-            modules, crashed = modules_from_path(path)
+            modules, crashed = modules_from_path(
+                path, use_cache=True, force_reload=force_reload
+            )
             for item in crashed:
                 filepath, exc_info = item
                 result.crashed_file_paths[filepath] = exc_info
@@ -204,6 +211,27 @@ class PluginDiscoverContext(object):
             return result
         return result.plugins
 
+    def get_discover_state(self, superclass):
+        """State of inputs for discover of plugins of a superclass.
+
+        State changes when plugin or plugin path of the superclass is
+        registered or deregistered, or when python file in registered paths
+        is added, removed or modified.
+
+        Args:
+            superclass (type): Superclass of plugins.
+
+        Returns:
+            tuple: State which can be compared with previous state.
+        """
+
+        return (
+            tuple(self._registered_plugins.get(superclass) or []),
+            get_paths_state(
+                self._registered_plugin_paths.get(superclass) or []
+            ),
+        )
+
     def register_plugin(self, superclass, cls):
         """Register a directory containing plug-ins of type `superclass`
 
@@ -273,7 +301,8 @@ def discover(
     superclass,
     allow_duplicates=True,
     ignore_classes=None,
-    return_report=False
+    return_report=False,
+    force_reload=False
 ):
     """Find and return subclasses of `superclass`
 
@@ -283,6 +312,8 @@ def discover(
         ignore_classes (list): List of classes that will be ignored
             and not added to result.
         return_report (bool): Output will be full report if set to 'True'.
+        force_reload (bool): Import all files from registered paths
+            even if they did not change.
 
     Returns:
         Union[DiscoverResult, list[Any]]: Object holding successfully
@@ -295,10 +326,52 @@ def discover(
         superclass,
         allow_duplicates,
         ignore_classes,
-        return_report
+        return_report,
+        force_reload
     )
 
 
+def get_paths_state(paths):
+    """State of python files in plugin directories.
+
+    Files are filtered the same way as on discover, so state changes only
+    when a file which would be imported is added, removed or modified.
+
+    Args:
+        paths (Iterable[str]): Paths to plugin directories.
+
+    Returns:
+        tuple: State which can be compared with previous state.
+    """
+
+    output = []
+    for path in paths:
+        path = os.path.normpath(path)
+        files_state = []
+        try:
+            filenames = sorted(os.listdir(path))
+        except OSError:
+            filenames = []
+
+        for filename in filenames:
+            if filename.startswith("_") or not filename.endswith(".py"):
+                continue
+            try:
+                stat_result = os.stat(os.path.join(path, filename))
+            except OSError:
+                continue
+            files_state.append(
+                (filename, stat_result.st_size, stat_result.st_mtime_ns)
+            )
+        output.append((path, tuple(files_state)))
+    return tuple(output)
+
+
+def get_discover_state(superclass):
+    context = _GlobalDiscover.get_context()
+    return context.get_discover_state(superclass)
+
+
 def get_last_discovered_plugins(superclass):
     context = _GlobalDiscover.get_context()
     return context.get_last_discovered_plugins(superclass)
@@ -42,6 +42,7 @@ from .lib import (
     apply_plugin_settings_automatically,
     get_plugin_settings,
     get_publish_instance_label,
+    get_tool_progress_callback,
     get_publish_instance_families,
 
     main_cli_publish,
@@ -94,6 +95,7 @@ __all__ = (
     "apply_plugin_settings_automatically",
     "get_plugin_settings",
     "get_publish_instance_label",
+    "get_tool_progress_callback",
     "get_publish_instance_families",
 
     "main_cli_publish",
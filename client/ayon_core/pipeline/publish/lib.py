@@ -1,5 +1,6 @@
 import os
 import sys
+import time
 import inspect
 import copy
 import tempfile
@@ -13,8 +14,11 @@ import pyblish.api
 
 from ayon_core.lib import (
     Logger,
-    import_filepath,
+    import_filepath_cached,
     filter_profiles,
+    emit_event,
+    profile_phase,
+    start_session_profiling,
 )
 from ayon_core.settings import get_project_settings
 from ayon_core.addon import AddonsManager
@@ -23,6 +27,7 @@ from ayon_core.pipeline import (
     Anatomy
 )
 from ayon_core.pipeline.plugin_discover import DiscoverResult
+from .plugin_manifest import get_publish_plugins_manifest
 from .constants import (
     DEFAULT_PUBLISH_TEMPLATE,
     DEFAULT_HERO_PUBLISH_TEMPLATE,
@@ -212,15 +217,28 @@ def load_help_content_from_plugin(plugin):
     return load_help_content_from_filepath(filepath)
 
 
-def publish_plugins_discover(paths=None):
+@profile_phase("plugin_discovery")
+def publish_plugins_discover(
+    paths=None, force_reload=False, use_manifest=True, targets=None
+):
     """Find and return available pyblish plug-ins
 
     Overridden function from `pyblish` module to be able to collect
         crashed files and reason of their crash.
 
+    Files which did not change since previous discovery are not imported
+        again. Files where all plugins are not compatible with registered
+        hosts, based on manifest of plugins directory, are not imported.
+
     Arguments:
         paths (list, optional): Paths to discover plug-ins from.
             If no paths are provided, all paths are searched.
+        force_reload (bool, optional): Import all files even if they did
+            not change.
+        use_manifest (bool, optional): Use manifest of plugin directories
+            to skip files with plugins for other hosts.
+        targets (Iterable[str], optional): Skip also files where all
+            plugins have other targets. Used only with manifest.
     """
 
     # The only difference with `pyblish.api.discover`
@@ -236,11 +254,18 @@ def publish_plugins_discover(paths=None):
     if not paths:
         paths = pyblish.plugin.plugin_paths()
 
+    hosts = pyblish.plugin.registered_hosts()
+    manifests = []
     for path in paths:
         path = os.path.normpath(path)
         if not os.path.isdir(path):
             continue
 
+        manifest = None
+        if use_manifest:
+            manifest = get_publish_plugins_manifest(path)
+            manifests.append(manifest)
+
         for fname in os.listdir(path):
             if fname.startswith("_"):
                 continue
@@ -255,8 +280,17 @@ def publish_plugins_discover(paths=None):
             if mod_ext != ".py":
                 continue
 
+            if (
+                manifest is not None
+                and not manifest.is_file_applicable(abspath, hosts, targets)
+            ):
+                log.debug("Skipped: \"%s\" (not applicable)", mod_name)
+                continue
+
             try:
-                module = import_filepath(abspath, mod_name)
+                module = import_filepath_cached(
+                    abspath, mod_name, force_reload
+                )
 
                 # Store reference to original module, to avoid
                 # garbage collection from collecting it's global
@@ -289,6 +323,9 @@ def publish_plugins_discover(paths=None):
                 key = "{0}.{1}".format(plugin.__module__, plugin.__name__)
                 plugins[key] = plugin
 
+    for manifest in manifests:
+        manifest.save()
+
     # Include plug-ins from registration.
     # Directly registered plug-ins take precedence.
     for plugin in pyblish.plugin.registered_plugins():
@@ -913,6 +950,61 @@ def get_publish_instance_label(instance):
     )
 
 
+def get_tool_progress_callback(label, logger=None, log_interval=10.0):
+    """Create callback reporting progress of external media tool.
+
+    Callback can be passed to progress parsers from
+    'ayon_core.lib.transcoding' like 'FFmpegProgressParser'. Each progress
+    update is emitted as global event 'publish.tool.progress' and logged
+    at most once per 'log_interval' so farm logs show throughput.
+
+    Args:
+        label (str): Label of processed item, e.g. output name.
+        logger (Optional[logging.Logger]): Logger used for progress.
+        log_interval (float): Minimum time in seconds between logged
+            progress messages.
+
+    Returns:
+        Callable[[dict[str, Any]], None]: Progress callback.
+
+    """
+    if logger is None:
+        logger = Logger.get_logger("publish.progress")
+
+    last_log_time = [time.time()]
+
+    def _callback(progress):
+        event_data = dict(progress)
+        event_data["label"] = label
+        emit_event("publish.tool.progress", event_data, "publish")
+
+        now = time.time()
+        if (
+            not progress["done"]
+            and now - last_log_time[0] < log_interval
+        ):
+            return
+        last_log_time[0] = now
+
+        frame = progress["frame"]
+        total_frames = progress["total_frames"]
+        if total_frames:
+            msg = "{}: frame {}/{} ({:.0f}%)".format(
+                label, frame, total_frames,
+                min(100.0, frame * 100.0 / total_frames)
+            )
+        else:
+            msg = "{}: frame {}".format(label, frame)
+
+        if progress["fps"]:
+            msg += ", {:.1f} fps".format(progress["fps"])
+        if progress["speed"]:
+            msg += ", {:.2f}x".format(progress["speed"])
+        logger.info(msg)
+
+    return _callback
+
+
 def get_publish_instance_families(instance):
     """Get all families of the instance.
 
@@ -1010,6 +1102,8 @@ def main_cli_publish(
     if not isinstance(path, str):
         raise RuntimeError("Path to JSON must be a string.")
 
+    start_session_profiling("publish")
+
     # Fix older jobs
     for src_key, dst_key in (
         ("AVALON_PROJECT", "AYON_PROJECT_NAME"),
@@ -1074,7 +1168,8 @@ def main_cli_publish(
 
     log.info("Running publish ...")
 
-    plugins = pyblish.api.discover()
+    with profile_phase("plugin_discovery"):
+        plugins = pyblish.api.discover()
     print("Using plugins:")
     for plugin in plugins:
         print(plugin)
@@ -1083,10 +1178,11 @@ def main_cli_publish(
     error_format = ("Failed {plugin.__name__}: "
                     "{error} -- {error.traceback}")
 
-    for result in pyblish.util.publish_iter():
-        if result["error"]:
-            log.error(error_format.format(**result))
-            # uninstall()
-            sys.exit(1)
+    with profile_phase("publish"):
+        for result in pyblish.util.publish_iter():
+            if result["error"]:
+                log.error(error_format.format(**result))
+                # uninstall()
+                sys.exit(1)
 
     log.info("Publish finished.")
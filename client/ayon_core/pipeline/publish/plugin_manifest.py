@@ -0,0 +1,489 @@
+"""Manifest of publish plugins in plugin directories.
+
+Manifest describes classes defined in python files of a plugin directory
+without importing them. Values are parsed from source code so only
+literal class attributes are known, e.g. 'hosts = ["maya"]'. Attributes
+which are not literal, are inherited, or are changed anywhere else in the
+file (e.g. 'hosts += ["maya"]' or 'Plugin.hosts = hosts'), are unknown and
+file with such class is always imported.
+
+Manifests are stored in launcher local dir and entries of files are
+rebuilt when size or modification time of the file changes.
+"""
+import os
+import ast
+import json
+import hashlib
+import tempfile
+import threading
+
+from ayon_core.lib import Logger, get_launcher_local_dir
+
+log = Logger.get_logger(__name__)
+
+# Subfolder of launcher local dir where manifests are stored
+MANIFEST_DIRNAME = "publish_plugin_manifests"
+# Increment when structure of manifest changes
+_MANIFEST_VERSION = 2
+# Class attributes stored to manifest
+_LIST_ATTRIBUTES = ("hosts", "families", "targets")
+_PARSED_ATTRIBUTES = _LIST_ATTRIBUTES + ("order", "settings_category")
+# Methods modifying list or set values in place
+_MODIFYING_METHODS = {
+    "append", "extend", "insert", "remove", "pop", "clear",
+    "add", "update", "discard",
+}
+_ORDER_VALUES = {
+    "CollectorOrder": 0,
+    "ValidatorOrder": 1,
+    "ExtractorOrder": 2,
+    "IntegratorOrder": 3,
+}
+
+
+def _get_literal_list(node):
+    try:
+        value = ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError):
+        return None
+    if (
+        isinstance(value, (list, tuple, set))
+        and all(isinstance(item, str) for item in value)
+    ):
+        return list(value)
+    return None
+
+
+def _get_order_value(node):
+    """Evaluate plugin order, e.g. 'pyblish.api.CollectorOrder + 0.1'.
+
+    Returns:
+        Union[float, None]: Order or None if order is not literal.
+
+    """
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, (int, float)):
+            return node.value
+        return None
+
+    if isinstance(node, (ast.Name, ast.Attribute)):
+        name = node.id if isinstance(node, ast.Name) else node.attr
+        return _ORDER_VALUES.get(name)
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        value = _get_order_value(node.operand)
+        if value is not None:
+            return -value
+        return None
+
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Sub)):
+        left = _get_order_value(node.left)
+        right = _get_order_value(node.right)
+        if left is None or right is None:
+            return None
+        if isinstance(node.op, ast.Add):
+            return left + right
+        return left - right
+    return None
+
+
+class _ChangedAttributesVisitor(ast.NodeVisitor):
+    """Find parsed class attributes changed outside of literal assignment.
+
+    Attribute is changed by augmented assignment or by modifying method
+    in class body, or by assignment to attribute of an object anywhere in
+    the module, e.g. 'Plugin.hosts = ...' or 'cls.hosts.append(...)'.
+
+    Attribute of object, which is not a class defined in the module, is
+    related to class in which body it is changed, or to all classes if it
+    is changed outside of classes.
+
+    Args:
+        class_names (Iterable[str]): Names of classes defined in module.
+
+    """
+    def __init__(self, class_names):
+        self._class_names = set(class_names)
+        # Stack of class names, 'None' for function scope
+        self._scopes = []
+        # Class name, or 'None' for all classes, and attribute name
+        self.changed = set()
+
+    def visit_ClassDef(self, node):
+        self._scopes.append(node.name)
+        for item in node.body:
+            # Literal assignments directly in class body are parsed
+            if not isinstance(item, (ast.Assign, ast.AnnAssign)):
+                self.visit(item)
+                continue
+            if item.value is not None:
+                self.visit(item.value)
+            for target in self._get_assign_targets(item):
+                if not isinstance(target, ast.Name):
+                    self._visit_target(target)
+        self._scopes.pop()
+
+    def visit_FunctionDef(self, node):
+        self._scopes.append(None)
+        self.generic_visit(node)
+        self._scopes.pop()
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+    visit_Lambda = visit_FunctionDef
+
+    def visit_Assign(self, node):
+        for target in node.targets:
+            self._visit_target(target)
+        self.visit(node.value)
+
+    def visit_AnnAssign(self, node):
+        self._visit_target(node.target)
+        if node.value is not None:
+            self.visit(node.value)
+
+    def visit_AugAssign(self, node):
+        self._visit_target(node.target)
+        self.visit(node.value)
+
+    def visit_Delete(self, node):
+        for target in node.targets:
+            self._visit_target(target)
+
+    def visit_Call(self, node):
+        func = node.func
+        if (
+            isinstance(func, ast.Attribute)
+            and func.attr in _MODIFYING_METHODS
+        ):
+            self._visit_target(func.value)
+
+        elif (
+            isinstance(func, ast.Name)
+            and func.id in ("setattr", "delattr")
+            and node.args
+        ):
+            attr_name = None
+            if len(node.args) > 1:
+                attr_node = node.args[1]
+                if isinstance(attr_node, ast.Constant):
+                    attr_name = attr_node.value
+            if attr_name is None or attr_name in _PARSED_ATTRIBUTES:
+                # Unknown attribute name changes all attributes
+                for key in (
+                    _PARSED_ATTRIBUTES if attr_name is None else [attr_name]
+                ):
+                    self._add_changed(node.args[0], key)
+        self.generic_visit(node)
+
+    @staticmethod
+    def _get_assign_targets(node):
+        if isinstance(node, ast.Assign):
+            return node.targets
+        return [node.target]
+
+    def _visit_target(self, target):
+        if isinstance(target, (ast.Tuple, ast.List)):
+            for item in target.elts:
+                self._visit_target(item)
+            return
+
+        if isinstance(target, ast.Starred):
+            self._visit_target(target.value)
+            return
+
+        # Item assignment, e.g. 'hosts[0] = "maya"'
+        if isinstance(target, ast.Subscript):
+            self._visit_target(target.value)
+            return
+
+        if isinstance(target, ast.Name):
+            # Only names in class body are class attributes
+            if (
+                target.id in _PARSED_ATTRIBUTES
+                and self._scopes
+                and self._scopes[-1] is not None
+            ):
+                self.changed.add((self._scopes[-1], target.id))
+            return
+
+        if (
+            isinstance(target, ast.Attribute)
+            and target.attr in _PARSED_ATTRIBUTES
+        ):
+            self._add_changed(target.value, target.attr)
+
+    def _add_changed(self, obj_node, key):
+        if (
+            isinstance(obj_node, ast.Name)
+            and obj_node.id in self._class_names
+        ):
+            self.changed.add((obj_node.id, key))
+            return
+
+        # Related to closest class, e.g. 'cls.hosts = ...' in method
+        for class_name in reversed(self._scopes):
+            if class_name is not None:
+                self.changed.add((class_name, key))
+                return
+        self.changed.add((None, key))
+
+
+def parse_plugin_classes(source):
+    """Parse information about classes defined in python source code.
+
+    Args:
+        source (Union[str, bytes]): Python source code.
+
+    Returns:
+        list[dict[str, Any]]: Name, order, hosts, families, targets and
+            settings category of classes. Unknown values are 'None'.
+
+    Raises:
+        SyntaxError: Source code is not valid python code.
+
+    """
+    output = []
+    tree = ast.parse(source)
+    visitor = _ChangedAttributesVisitor(
+        node.name
+        for node in tree.body
+        if isinstance(node, ast.ClassDef)
+    )
+    visitor.visit(tree)
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+
+        class_info = {
+            "name": node.name,
+            "order": None,
+            "hosts": None,
+            "families": None,
+            "targets": None,
+            "settings_category": None,
+        }
+        for item in node.body:
+            if isinstance(item, ast.Assign):
+                targets = item.targets
+            elif isinstance(item, ast.AnnAssign) and item.value is not None:
+                targets = [item.target]
+            else:
+                continue
+
+            for target in targets:
+                if not isinstance(target, ast.Name):
+                    continue
+                key = target.id
+                if key == "order":
+                    class_info[key] = _get_order_value(item.value)
+                elif key in _LIST_ATTRIBUTES:
+                    class_info[key] = _get_literal_list(item.value)
+                elif key == "settings_category":
+                    value = None
+                    if (
+                        isinstance(item.value, ast.Constant)
+                        and isinstance(item.value.value, str)
+                    ):
+                        value = item.value.value
+                    class_info[key] = value
+
+        # Attributes changed in other way than literal assignment
+        for class_name, key in visitor.changed:
+            if class_name is None or class_name == node.name:
+                class_info[key] = None
+        output.append(class_info)
+    return output
+
+
+def _class_is_applicable(class_info, hosts, targets):
+    plugin_hosts = class_info["hosts"]
+    if plugin_hosts is None:
+        return True
+
+    if (
+        "*" not in plugin_hosts
+        and not any(host in plugin_hosts for host in hosts)
+    ):
+        return False
+
+    plugin_targets = class_info["targets"]
+    if (
+        targets is not None
+        and plugin_targets is not None
+        and not set(plugin_targets).intersection(targets)
+    ):
+        return False
+    return True
+
+
+class PublishPluginsManifest:
+    """Manifest of publish plugins in a directory.
+
+    Args:
+        dirpath (str): Path to directory with publish plugins.
+
+    """
+    def __init__(self, dirpath):
+        self._dirpath = os.path.normpath(dirpath)
+        self._files = None
+        self._changed = False
+        self._lock = threading.Lock()
+
+    @property
+    def dirpath(self):
+        return self._dirpath
+
+    def get_manifest_path(self):
+        """Path to file where manifest is stored.
+
+        Returns:
+            str: Path to manifest file.
+
+        """
+        dirpath_hash = hashlib.sha1(
+            os.path.normcase(self._dirpath).encode("utf-8")
+        ).hexdigest()
+        return os.path.join(
+            get_launcher_local_dir(MANIFEST_DIRNAME),
+            "{}.json".format(dirpath_hash)
+        )
+
+    def get_file_classes(self, filepath):
+        """Information about classes defined in a file of the directory.
+
+        Entry of file is rebuilt if file changed since it was parsed.
+
+        Args:
+            filepath (str): Path to python file.
+
+        Returns:
+            Union[list[dict[str, Any]], None]: Information about classes
+                or None if file could not be parsed.
+
+        """
+        filename = os.path.basename(filepath)
+        stat_result = os.stat(filepath)
+        file_key = [stat_result.st_size, stat_result.st_mtime_ns]
+        with self._lock:
+            files = self._get_files()
+            file_info = files.get(filename)
+            if file_info is not None and file_info["key"] == file_key:
+                return file_info["classes"]
+
+        try:
+            with open(filepath, "rb") as stream:
+                classes = parse_plugin_classes(stream.read())
+        except (OSError, SyntaxError, ValueError):
+            classes = None
+
+        with self._lock:
+            files[filename] = {"key": file_key, "classes": classes}
+            self._changed = True
+        return classes
+
+    def is_file_applicable(self, filepath, hosts, targets=None):
+        """Can file contain plugins applicable to hosts and targets.
+
+        File is not applicable only if all classes in the file have
+        literal 'hosts' without any of passed hosts, or literal 'targets'
+        without any of passed targets.
+
+        Args:
+            filepath (str): Path to python file.
+            hosts (Iterable[str]): Registered hosts.
+            targets (Optional[Iterable[str]]): Registered targets. Targets
+                are not checked if not passed.
+
+        Returns:
+            bool: File should be imported.
+
+        """
+        classes = self.get_file_classes(filepath)
+        if not classes:
+            return True
+
+        hosts = list(hosts)
+        if targets is not None:
+            targets = set(targets)
+        return any(
+            _class_is_applicable(class_info, hosts, targets)
+            for class_info in classes
+        )
+
+    def save(self):
+        """Store manifest if it changed."""
+        with self._lock:
+            if not self._changed:
+                return
+            self._changed = False
+            data = {
+                "version": _MANIFEST_VERSION,
+                "dirpath": self._dirpath,
+                "files": self._files,
+            }
+
+        manifest_path = self.get_manifest_path()
+        manifest_dir = os.path.dirname(manifest_path)
+        try:
+            os.makedirs(manifest_dir, exist_ok=True)
+            # Write to temp file first so other processes never read
+            #   partially written file
+            fd, tmp_path = tempfile.mkstemp(dir=manifest_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as stream:
+                json.dump(data, stream)
+            os.replace(tmp_path, manifest_path)
+        except OSError:
+            log.debug(
+                "Failed to store plugins manifest '{}'".format(manifest_path),
+                exc_info=True
+            )
+
+    def _get_files(self):
+        if self._files is not None:
+            return self._files
+
+        self._files = {}
+        manifest_path = self.get_manifest_path()
+        if not os.path.exists(manifest_path):
+            return self._files
+
+        try:
+            with open(manifest_path, "r") as stream:
+                data = json.load(stream)
+        except (OSError, ValueError):
+            log.debug(
+                "Failed to read plugins manifest '{}'".format(manifest_path),
+                exc_info=True
+            )
+            return self._files
+
+        if (
+            data.get("version") == _MANIFEST_VERSION
+            and data.get("dirpath") == self._dirpath
+        ):
+            self._files = data.get("files") or {}
+        return self._files
+
+
+class _CacheItems:
+    manifests = {}
+    lock = threading.Lock()
+
+
+def get_publish_plugins_manifest(dirpath):
+    """Get manifest of publish plugins in a directory.
+
+    Args:
+        dirpath (str): Path to directory with publish plugins.
+
+    Returns:
+        PublishPluginsManifest: Manifest of the directory.
+
+    """
+    dirpath = os.path.normpath(dirpath)
+    with _CacheItems.lock:
+        manifest = _CacheItems.manifests.get(dirpath)
+        if manifest is None:
+            manifest = PublishPluginsManifest(dirpath)
+            _CacheItems.manifests[dirpath] = manifest
+    return manifest
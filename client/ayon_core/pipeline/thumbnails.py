@@ -1,10 +1,15 @@
 import os
+import json
 import time
+import shutil
+import hashlib
+import tempfile
 import collections
 
 import ayon_api
 
 from ayon_core.lib.local_settings import get_launcher_local_dir
+from ayon_core.lib.media_probe_cache import MediaProbeCache
 
 
 FileInfo = collections.namedtuple(
@@ -21,6 +26,11 @@ class ThumbnailsCache:
     thumbnail id validation and file names are thumbnail ids with matching
     extension. Extensions are predefined (.png and .jpeg).
 
+    Cache also contains thumbnails generated during publishing. These are
+    stored by fingerprint of source file (real path, size and modification
+    time) and options used for conversion, so publishing of unchanged
+    source can re-use thumbnail created by previous publishing.
+
     Cache has cleanup mechanism which is triggered on initialized by default.
 
     The cleanup has 2 levels:
@@ -39,6 +49,9 @@ class ThumbnailsCache:
     # Max size of thumbnail directory (in bytes)
     # - default 2 Gb
     max_filesize = 2 * 1024 * 1024 * 1024
+    # Subfolder for thumbnails generated from source files
+    # - dot prefix avoids collisions with project names
+    generated_dirname = ".generated"
 
     def __init__(self, cleanup=True):
         self._thumbnails_dir = None
@@ -221,6 +234,104 @@ class ThumbnailsCache:
 
         return thumbnail_path
 
+    def get_generated_dir(self):
+        """Directory where generated thumbnails are stored.
+
+        Returns:
+            str: Path to directory with generated thumbnails.
+        """
+
+        return os.path.join(self.thumbnails_dir, self.generated_dirname)
+
+    def get_generated_thumbnail_key(self, source_path, options=None):
+        """Fingerprint of source file and conversion options.
+
+        Args:
+            source_path (str): Path to source file of thumbnail.
+            options (Optional[Any]): JSON serializable options used for
+                conversion of source to thumbnail.
+
+        Returns:
+            Union[str, None]: Fingerprint or None if source file can't
+                be accessed.
+        """
+
+        file_key = MediaProbeCache.get_file_key(source_path)
+        if file_key is None:
+            return None
+        value = json.dumps(
+            [list(file_key), options], sort_keys=True, default=str
+        )
+        return hashlib.sha1(value.encode("utf-8")).hexdigest()
+
+    def get_generated_thumbnail_filepath(self, source_path, options=None):
+        """Get thumbnail generated from source file.
+
+        Args:
+            source_path (str): Path to source file of thumbnail.
+            options (Optional[Any]): JSON serializable options used for
+                conversion of source to thumbnail.
+
+        Returns:
+            Union[str, None]: Path to thumbnail image or None if thumbnail
+                of the source is not cached.
+        """
+
+        key = self.get_generated_thumbnail_key(source_path, options)
+        if key is None:
+            return None
+
+        generated_dir = self.get_generated_dir()
+        for ext in (
+            ".jpg",
+            ".png",
+        ):
+            filepath = os.path.join(generated_dir, key + ext)
+            if os.path.exists(filepath):
+                # Refresh modification time so used thumbnails are not
+                #   removed by soft cleanup
+                try:
+                    os.utime(filepath, None)
+                except OSError:
+                    pass
+                return filepath
+        return None
+
+    def store_generated_thumbnail(
+        self, source_path, thumbnail_path, options=None
+    ):
+        """Store thumbnail generated from source file to cache.
+
+        Args:
+            source_path (str): Path to source file of thumbnail.
+            thumbnail_path (str): Path to generated thumbnail image.
+            options (Optional[Any]): JSON serializable options used for
+                conversion of source to thumbnail.
+
+        Returns:
+            Union[str, None]: Path to cached thumbnail image or None if
+                thumbnail could not be cached.
+        """
+
+        key = self.get_generated_thumbnail_key(source_path, options)
+        if key is None:
+            return None
+
+        generated_dir = self.get_generated_dir()
+        ext = os.path.splitext(thumbnail_path)[1].lower()
+        filepath = os.path.join(generated_dir, key + ext)
+        try:
+            os.makedirs(generated_dir, exist_ok=True)
+            # Copy to temp file first so other processes never use
+            #   partially written file
+            fd, tmp_path = tempfile.mkstemp(dir=generated_dir, suffix=ext)
+            os.close(fd)
+            shutil.copyfile(thumbnail_path, tmp_path)
+            os.replace(tmp_path, filepath)
+        except OSError:
+            return None
+        return filepath
+
 
 class _CacheItems:
     thumbnails_cache = ThumbnailsCache()
@@ -261,3 +372,64 @@ def get_thumbnail_path(project_name, thumbnail_id):
             result.content_type
         )
     return None
+
+
+def get_generated_thumbnail_path(source_path, options=None):
+    """Get path to cached thumbnail generated from source file.
+
+    Args:
+        source_path (str): Path to source file of thumbnail.
+        options (Optional[Any]): JSON serializable options used for
+            conversion of source to thumbnail.
+
+    Returns:
+        Union[str, None]: Path to thumbnail image or None if thumbnail
+            of the source with the options was not generated yet.
+
+    """
+    return _CacheItems.thumbnails_cache.get_generated_thumbnail_filepath(
+        source_path, options
+    )
+
+
+def store_generated_thumbnail(source_path, thumbnail_path, options=None):
+    """Store thumbnail generated from source file to cache.
+
+    Args:
+        source_path (str): Path to source file of thumbnail.
+        thumbnail_path (str): Path to generated thumbnail image.
+        options (Optional[Any]): JSON serializable options used for
+            conversion of source to thumbnail.
+
+    Returns:
+        Union[str, None]: Path to cached thumbnail image or None if
+            thumbnail could not be cached.
+
+    """
+    return _CacheItems.thumbnails_cache.store_generated_thumbnail(
+        source_path, thumbnail_path, options
+    )
+
+
+def copy_generated_thumbnail(source_path, dst_path, options=None):
+    """Copy cached thumbnail generated from source file.
+
+    Args:
+        source_path (str): Path to source file of thumbnail.
+        dst_path (str): Path where thumbnail is copied to.
+        options (Optional[Any]): JSON serializable options used for
+            conversion of source to thumbnail.
+
+    Returns:
+        bool: Cached thumbnail was copied to the destination.
+
+    """
+    cached_path = get_generated_thumbnail_path(source_path, options)
+    if not cached_path:
+        return False
+
+    try:
+        shutil.copyfile(cached_path, dst_path)
+    except OSError:
+        return False
+    return True
@@ -1,6 +1,7 @@
 import collections
 import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any
 
 import clique
@@ -43,27 +44,89 @@ class DeleteOldVersions(load.ProductLoaderPlugin):
     ]
 
     requires_confirmation = True
+    # Number of threads processing folders (0 means automatic)
+    max_workers = 0
+
+    def _run_in_threads(self, func, items):
+        """Call function for each item in a thread pool.
+
+        Args:
+            func (Callable[[Any], Any]): Function called with an item.
+            items (Iterable[Any]): Items to process.
+
+        Yields:
+            tuple[Any, Any]: Item and function result in order of completion.
+
+        """
+        max_workers = self.max_workers or None
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(func, item): item
+                for item in items
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    def _log_progress(self, idx, count, path, size, delete):
+        action = "Deleted" if delete else "Calculated"
+        msg = "{} {}/{} folders ({}): {}".format(
+            action, idx, count, format_file_size(size), path
+        )
+        self.log.info(msg)
+        print(msg)
+
+    def _process_dir_tree(self, dir_path, delete):
+        """Calculate size of directory content and delete it.
+
+        Args:
+            dir_path (str): Directory path.
+            delete (bool): Delete content of the directory.
+
+        Returns:
+            int: Size of files in directory.
+
+        """
+        size = 0
+        subdir_paths = []
+        with os.scandir(dir_path) as scan_iter:
+            for entry in scan_iter:
+                if entry.is_dir(follow_symlinks=False):
+                    subdir_paths.append(entry.path)
+                    continue
+
+                size += entry.stat(follow_symlinks=False).st_size
+                if delete:
+                    os.remove(entry.path)
+                    self.log.debug("Removed file: {}".format(entry.path))
+
+        for subdir_path in subdir_paths:
+            size += self._process_dir_tree(subdir_path, delete)
+            if delete:
+                os.rmdir(subdir_path)
+        return size
 
     def delete_whole_dir_paths(self, dir_paths, delete=True):
         size = 0
 
-        for dir_path in dir_paths:
-            # Delete all files and folders in dir path
-            for root, dirs, files in os.walk(dir_path, topdown=False):
-                for name in files:
-                    file_path = os.path.join(root, name)
-                    size += os.path.getsize(file_path)
-                    if delete:
-                        os.remove(file_path)
-                        self.log.debug("Removed file: {}".format(file_path))
-
-                for name in dirs:
-                    if delete:
-                        os.rmdir(os.path.join(root, name))
-
-            if not delete:
-                continue
+        dir_paths = [
+            dir_path
+            for dir_path in dir_paths
+            if os.path.isdir(dir_path)
+        ]
+        dir_sizes = self._run_in_threads(
+            lambda dir_path: self._process_dir_tree(dir_path, delete),
+            dir_paths
+        )
+        for idx, (dir_path, dir_size) in enumerate(dir_sizes):
+            size += dir_size
+            self._log_progress(
+                idx + 1, len(dir_paths), dir_path, size, delete
+            )
+
+        if not delete:
+            return size
 
+        for dir_path in dir_paths:
             # Delete even the folder and it's parents folders if they are empty
             while True:
                 if not os.path.exists(dir_path):
@@ -102,71 +165,108 @@ class DeleteOldVersions(load.ProductLoaderPlugin):
 
         return (path.normalized(), sequence_path)
 
-    def delete_only_repre_files(self, dir_paths, file_paths, delete=True):
-        size = 0
+    def _process_repre_dir(self, dir_path, file_paths, delete):
+        """Calculate size of representation files in directory and delete them.
 
-        for dir_id, dir_path in dir_paths.items():
-            dir_files = os.listdir(dir_path)
-            collections, remainders = clique.assemble(dir_files)
-            for file_path, seq_path in file_paths[dir_id]:
-                file_path_base = os.path.split(file_path)[1]
-                # Just remove file if `frame` key was not in context or
-                # filled path is in remainders (single file sequence)
-                if not seq_path or file_path_base in remainders:
-                    if not os.path.exists(file_path):
-                        self.log.debug(
-                            "File was not found: {}".format(file_path)
-                        )
-                        continue
+        Content of the directory is listed only once with 'os.scandir' and
+        the listing is used for sizes and existence of files.
 
-                    size += os.path.getsize(file_path)
+        Args:
+            dir_path (str): Directory path.
+            file_paths (list[list[str]]): Filepath and sequence path of
+                representations in the directory.
+            delete (bool): Delete the files.
 
-                    if delete:
-                        os.remove(file_path)
-                        self.log.debug("Removed file: {}".format(file_path))
+        Returns:
+            int: Size of representation files.
 
-                    if file_path_base in remainders:
-                        remainders.remove(file_path_base)
+        """
+        size = 0
+        entries_by_name = {}
+        with os.scandir(dir_path) as scan_iter:
+            for entry in scan_iter:
+                entries_by_name[os.path.normcase(entry.name)] = entry
+
+        def _remove_file(_file_path):
+            entry = entries_by_name.pop(
+                os.path.normcase(os.path.basename(_file_path)), None
+            )
+            if entry is None:
+                return None
+
+            _size = entry.stat().st_size
+            if delete:
+                os.remove(entry.path)
+                self.log.debug("Removed file: {}".format(entry.path))
+            return _size
+
+        dir_files = [entry.name for entry in entries_by_name.values()]
+        collections, remainders = clique.assemble(dir_files)
+        for file_path, seq_path in file_paths:
+            file_path_base = os.path.split(file_path)[1]
+            # Just remove file if `frame` key was not in context or
+            # filled path is in remainders (single file sequence)
+            if not seq_path or file_path_base in remainders:
+                file_size = _remove_file(file_path)
+                if file_size is None:
+                    self.log.debug(
+                        "File was not found: {}".format(file_path)
+                    )
                     continue
 
-                seq_path_base = os.path.split(seq_path)[1]
-                head, tail = seq_path_base.split(self.sequence_splitter)
+                size += file_size
 
-                final_col = None
-                for collection in collections:
-                    if head != collection.head or tail != collection.tail:
-                        continue
-                    final_col = collection
-                    break
+                if file_path_base in remainders:
+                    remainders.remove(file_path_base)
+                continue
 
-                if final_col is not None:
-                    # Fill full path to head
-                    final_col.head = os.path.join(dir_path, final_col.head)
-                    for _file_path in final_col:
-                        if os.path.exists(_file_path):
+            seq_path_base = os.path.split(seq_path)[1]
+            head, tail = seq_path_base.split(self.sequence_splitter)
 
-                            size += os.path.getsize(_file_path)
+            final_col = None
+            for collection in collections:
+                if head != collection.head or tail != collection.tail:
+                    continue
+                final_col = collection
+                break
+
+            if final_col is not None:
+                for _file_name in final_col:
+                    file_size = _remove_file(_file_name)
+                    if file_size is not None:
+                        size += file_size
+
+                # Fill full path to head
+                final_col.head = os.path.join(dir_path, final_col.head)
+                _seq_path = final_col.format("{head}{padding}{tail}")
+                self.log.debug("Removed files: {}".format(_seq_path))
+                collections.remove(final_col)
+                continue
 
-                            if delete:
-                                os.remove(_file_path)
-                                self.log.debug(
-                                    "Removed file: {}".format(_file_path)
-                                )
+            file_size = _remove_file(file_path)
+            if file_size is None:
+                self.log.debug(
+                    "File was not found: {}".format(file_path)
+                )
+            else:
+                size += file_size
 
-                    _seq_path = final_col.format("{head}{padding}{tail}")
-                    self.log.debug("Removed files: {}".format(_seq_path))
-                    collections.remove(final_col)
+        return size
 
-                elif os.path.exists(file_path):
-                    size += os.path.getsize(file_path)
+    def delete_only_repre_files(self, dir_paths, file_paths, delete=True):
+        size = 0
 
-                    if delete:
-                        os.remove(file_path)
-                        self.log.debug("Removed file: {}".format(file_path))
-                else:
-                    self.log.debug(
-                        "File was not found: {}".format(file_path)
-                    )
+        dir_sizes = self._run_in_threads(
+            lambda dir_id: self._process_repre_dir(
+                dir_paths[dir_id], file_paths[dir_id], delete
+            ),
+            list(dir_paths.keys())
+        )
+        for idx, (dir_id, dir_size) in enumerate(dir_sizes):
+            size += dir_size
+            self._log_progress(
+                idx + 1, len(dir_paths), dir_paths[dir_id], size, delete
+            )
 
         # Delete as much as possible parent folders
         if not delete:
@@ -368,7 +468,23 @@ class DeleteOldVersions(load.ProductLoaderPlugin):
             "archive_product": versions_count == 0
         }
 
-    def main(self, project_name, data, remove_publish_folder):
+    def main(
+        self, project_name, data, remove_publish_folder, op_session=None
+    ):
+        """Delete old versions files and mark versions as deleted.
+
+        Args:
+            project_name (str): Project name.
+            data (dict[str, Any]): Data from 'get_data'.
+            remove_publish_folder (bool): Remove whole publish folders.
+            op_session (Optional[OperationsSession]): Session where entity
+                changes are added. Changes are committed immediately if
+                not passed.
+
+        Returns:
+            int: Size of removed files.
+
+        """
         # Size of files.
         size = 0
         if not data:
@@ -381,7 +497,10 @@ class DeleteOldVersions(load.ProductLoaderPlugin):
                 data["dir_paths"], data["file_paths_by_dir"]
             )
 
-        op_session = OperationsSession()
+        commit = op_session is None
+        if commit:
+            op_session = OperationsSession()
+
         for version in data["versions"]:
             orig_version_tags = version["tags"]
             version_tags = list(orig_version_tags)
@@ -399,7 +518,8 @@ class DeleteOldVersions(load.ProductLoaderPlugin):
                 project_name, "version", version["id"], changes
             )
 
-        op_session.commit()
+        if commit:
+            op_session.commit()
 
         return size
 
@@ -424,15 +544,26 @@ class DeleteOldVersions(load.ProductLoaderPlugin):
         ):
             return
 
+        # Entity changes of all contexts are sent to server at once
+        op_session = OperationsSession()
         try:
             size = 0
-            for count, context in enumerate(contexts):
-                data = self.get_data(context, versions_to_keep)
-                if not data:
-                    continue
-                project_name = context["project"]["name"]
-                size += self.main(project_name, data, remove_publish_folder)
-                print("Progressing {}/{}".format(count + 1, len(contexts)))
+            try:
+                for count, context in enumerate(contexts):
+                    data = self.get_data(context, versions_to_keep)
+                    if not data:
+                        continue
+                    project_name = context["project"]["name"]
+                    size += self.main(
+                        project_name, data, remove_publish_folder, op_session
+                    )
+                    print("Progressing {}/{}".format(
+                        count + 1, len(contexts)
+                    ))
+            finally:
+                # Changes of already processed contexts are committed
+                #   even if processing of other context failed
+                op_session.commit()
 
             msg = "Total size of files: {}".format(format_file_size(size))
             self.log.info(msg)
@@ -459,7 +590,9 @@ class CalculateOldVersions(DeleteOldVersions):
 
     requires_confirmation = False
 
-    def main(self, project_name, data, remove_publish_folder):
+    def main(
+        self, project_name, data, remove_publish_folder, op_session=None
+    ):
         size = 0
 
         if not data:
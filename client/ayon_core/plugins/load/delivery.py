@@ -1,4 +1,6 @@
+import os
 import copy
+import datetime
 import platform
 from collections import defaultdict
 
@@ -17,7 +19,8 @@ from ayon_core.pipeline.load import get_representation_path_with_anatomy
 from ayon_core.pipeline.delivery import (
     get_format_dict,
     check_destination_path,
-    deliver_single_file
+    get_single_file_delivery_path,
+    DeliveryTransfers,
 )
 
 
@@ -143,6 +146,9 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         progress_bar.setMaximum = 100
         progress_bar.setVisible(False)
 
+        progress_label = QtWidgets.QLabel(self)
+        progress_label.setVisible(False)
+
         text_area = QtWidgets.QTextEdit()
         text_area.setReadOnly(True)
         text_area.setVisible(False)
@@ -154,6 +160,7 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         layout.addStretch(1)
         layout.addWidget(btn_delivery)
         layout.addWidget(progress_bar)
+        layout.addWidget(progress_label)
         layout.addWidget(text_area)
 
         self.selected_label = selected_label
@@ -164,6 +171,7 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         self.renumber_frame = renumber_frame
         self.root_line_edit = root_line_edit
         self.progress_bar = progress_bar
+        self.progress_label = progress_label
         self.text_area = text_area
         self.btn_delivery = btn_delivery
 
@@ -188,6 +196,7 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
     def deliver(self):
         """Main method to loop through all selected representations"""
         self.progress_bar.setVisible(True)
+        self.progress_label.setVisible(True)
         self.btn_delivery.setEnabled(False)
         QtWidgets.QApplication.processEvents()
 
@@ -200,6 +209,11 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         format_dict = get_format_dict(self.anatomy, self.root_line_edit.text())
         renumber_frame = self.renumber_frame.isChecked()
         frame_offset = self.first_frame_start.value()
+        # Prepare all transfers first and process them at once
+        delivery_transfers = DeliveryTransfers(
+            progress_callback=self._on_transfer_progress,
+            log=self.log
+        )
         for repre in self._representations:
             if repre["name"] not in selected_repres:
                 continue
@@ -231,9 +245,11 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
             ]
 
             src_paths = []
+            size_by_src_path = {}
             for repre_file in repre["files"]:
                 src_path = self.anatomy.fill_root(repre_file["path"])
                 src_paths.append(src_path)
+                size_by_src_path[src_path] = repre_file.get("size")
             sources_and_frames = collect_frames(src_paths)
 
             frames = set(sources_and_frames.values())
@@ -262,9 +278,23 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
 
                 if frame is not None:
                     anatomy_data["frame"] = frame
-                new_report_items, uploaded = deliver_single_file(*args)
+                new_report_items, delivery_path = (
+                    get_single_file_delivery_path(*args)
+                )
                 report_items.update(new_report_items)
-                self._update_progress(uploaded)
+                if delivery_path is None:
+                    continue
+                delivery_transfers.add(
+                    os.path.normpath(src_path.replace("\\", "/")),
+                    delivery_path,
+                    size_by_src_path.get(src_path)
+                )
+
+        try:
+            delivery_transfers.process()
+        except Exception as exc:
+            self.log.error("Failed to transfer files.", exc_info=True)
+            report_items["Failed to transfer files"].append(str(exc))
 
         self.text_area.setText(self._format_report(report_items))
         self.text_area.setVisible(True)
@@ -351,12 +381,33 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
             self.template_file_label.setText(template_value["file"])
             self.btn_delivery.setEnabled(bool(self._get_selected_repres()))
 
-    def _update_progress(self, uploaded):
-        """Update progress bar after each repre copied."""
-        self.currently_uploaded += uploaded
+    def _on_transfer_progress(self, progress):
+        """Update progress bar and throughput during transfers."""
+        self.currently_uploaded = progress["transferred_files"]
 
-        ratio = self.currently_uploaded / self.files_selected
-        self.progress_bar.setValue(ratio * self.progress_bar.maximum())
+        total_bytes = progress["total_bytes"]
+        if total_bytes:
+            ratio = progress["transferred_bytes"] / total_bytes
+        elif progress["total_files"]:
+            ratio = self.currently_uploaded / progress["total_files"]
+        else:
+            ratio = 1.0
+        self.progress_bar.setValue(int(ratio * self.progress_bar.maximum()))
+
+        eta = progress["eta"]
+        eta_text = "-"
+        if eta is not None:
+            eta_text = str(datetime.timedelta(seconds=int(eta)))
+
+        self.progress_label.setText(
+            "{}/{} files | {}/s | ETA {}".format(
+                self.currently_uploaded,
+                progress["total_files"],
+                format_file_size(progress["bytes_per_second"]),
+                eta_text
+            )
+        )
+        QtWidgets.QApplication.processEvents()
 
     def _format_report(self, report_items):
         """Format final result and error details as html."""
@@ -0,0 +1,86 @@
+import os
+
+import pyblish.api
+
+from ayon_core.lib import (
+    configure_tool_scheduler,
+    is_headless_mode_enabled,
+)
+
+
+class CollectToolScheduler(pyblish.api.ContextPlugin):
+    """Configure limits of concurrently running media tools.
+
+    Limits are process wide and apply to all following plugins running
+    'ffmpeg' or 'oiiotool'. Headless publishing, e.g. on farm, uses
+    separate limit so farm nodes can run at full load while artist
+    workstations stay responsive.
+
+    Values from settings replace limits applied by previous publishing
+    in the same process. Value '0' of max processes uses number of CPU
+    cores, '0' of memory and load limits disables the check. Limits set
+    by environment variables have precedence.
+    """
+
+    order = pyblish.api.CollectorOrder - 0.49
+    label = "Collect Tool Scheduler"
+
+    # Maximum number of concurrently running tools, '0' uses number of cores
+    # - workstation uses low limit, tools are multithreaded on their own
+    max_processes = 2
+    farm_max_processes = 0
+    # Limits per tool e.g. '[{"name": "ffmpeg", "max_processes": 2}]'
+    tool_limits = []
+    # Don't start new process if there is less available memory
+    min_free_memory_mb = 0
+    # Don't start new process if system load per core is higher
+    max_load_factor = 0.0
+
+    def process(self, context):
+        max_processes = self.max_processes
+        if is_headless_mode_enabled():
+            max_processes = self.farm_max_processes
+        if not max_processes:
+            max_processes = os.cpu_count() or 1
+
+        tool_limits = {
+            item["name"]: item["max_processes"]
+            for item in self.tool_limits
+            if item["max_processes"]
+        }
+        max_processes = self._get_value(
+            "AYON_TOOL_MAX_PROCESSES", max_processes
+        )
+        min_free_memory_mb = self._get_value(
+            "AYON_TOOL_MIN_FREE_MEMORY_MB", self.min_free_memory_mb
+        )
+        max_load_factor = self._get_value(
+            "AYON_TOOL_MAX_LOAD_FACTOR", self.max_load_factor
+        )
+        self.log.debug((
+            "Tool scheduler limits from settings: max processes {},"
+            " tool limits {}, min free memory {}MB, max load factor {}"
+        ).format(
+            max_processes,
+            tool_limits,
+            min_free_memory_mb,
+            max_load_factor,
+        ))
+        configure_tool_scheduler(
+            max_processes,
+            tool_limits,
+            min_free_memory_mb,
+            max_load_factor,
+        )
+
+    def _get_value(self, env_key, value):
+        """Value from settings if is not set by environment.
+
+        Returns:
+            Union[int, float, None]: Value or None if scheduler should
+                not be changed.
+        """
+
+        if os.getenv(env_key):
+            return None
+        return value
@@ -117,30 +117,8 @@ class ExtractBurnin(publish.Extractor):
             if not self.repres_is_valid(repre):
                 continue
 
-            repre_burnin_links = repre.get("burnins", [])
-            self.log.debug(
-                "repre_burnin_links: {}".format(repre_burnin_links)
-            )
-
-            burnin_defs = copy.deepcopy(src_burnin_defs)
-
-            # Filter output definition by `burnin` representation key
-            repre_linked_burnins = [
-                burnin_def
-                for burnin_def in burnin_defs
-                if burnin_def["name"] in repre_burnin_links
-            ]
-            self.log.debug(
-                "repre_linked_burnins: {}".format(repre_linked_burnins)
-            )
-
-            # if any match then replace burnin defs and follow tag filtering
-            if repre_linked_burnins:
-                burnin_defs = repre_linked_burnins
-
-            # Filter output definition by representation tags (optional)
-            repre_burnin_defs = self.filter_burnins_by_tags(
-                burnin_defs, repre["tags"]
+            repre_burnin_defs = self.get_repre_burnin_defs(
+                repre, src_burnin_defs
             )
             if not repre_burnin_defs:
                 self.log.debug(
@@ -153,7 +131,52 @@ class ExtractBurnin(publish.Extractor):
 
         return filtered_repres
 
-    def main_process(self, instance):
+    def get_repre_burnin_defs(self, repre, src_burnin_defs):
+        """Burnin definitions for representation.
+
+        Args:
+            repre (dict): Representation.
+            src_burnin_defs (list): Burnin definitions.
+
+        Returns:
+            list[dict]: Burnin definitions linked to representation and
+                matching its tags.
+
+        """
+        repre_burnin_links = repre.get("burnins", [])
+        self.log.debug(
+            "repre_burnin_links: {}".format(repre_burnin_links)
+        )
+
+        burnin_defs = copy.deepcopy(src_burnin_defs)
+
+        # Filter output definition by `burnin` representation key
+        repre_linked_burnins = [
+            burnin_def
+            for burnin_def in burnin_defs
+            if burnin_def["name"] in repre_burnin_links
+        ]
+        self.log.debug(
+            "repre_linked_burnins: {}".format(repre_linked_burnins)
+        )
+
+        # if any match then replace burnin defs and follow tag filtering
+        if repre_linked_burnins:
+            burnin_defs = repre_linked_burnins
+
+        # Filter output definition by representation tags (optional)
+        return self.filter_burnins_by_tags(burnin_defs, repre["tags"])
+
+    def get_burnin_defs(self, instance):
+        """Burnin definitions of profile matching the instance.
+
+        Args:
+            instance (pyblish.api.Instance): Pyblish instance.
+
+        Returns:
+            list[dict[str, Any]]: Burnin definitions.
+
+        """
         host_name = instance.context.data["hostName"]
         product_type = instance.data["productType"]
         product_name = instance.data["productName"]
@@ -181,7 +204,7 @@ class ExtractBurnin(publish.Extractor):
             ).format(
                 host_name, product_type, product_name, task_name, task_type
             ))
-            return
+            return []
 
         # Pre-filter burnin definitions by instance families
         burnin_defs = self.filter_burnins_defs(profile, instance)
@@ -191,6 +214,147 @@ class ExtractBurnin(publish.Extractor):
                 " Host: \"{}\" | Product type: \"{}\" | Task name \"{}\""
                 " | Profile \"{}\""
             ).format(host_name, product_type, task_name, profile))
+        return burnin_defs
+
+    def get_burnin_values(self, burnin_def):
+        """Burnin values by position from burnin definition.
+
+        Args:
+            burnin_def (dict[str, Any]): Burnin definition.
+
+        Returns:
+            dict[str, str]: Burnin templates by position.
+
+        """
+        burnin_values = {}
+        for key in self.positions:
+            value = burnin_def.get(key)
+            if not value:
+                continue
+            # TODO remove replacements
+            burnin_values[key] = (
+                value
+                .replace("{task}", "{task[name]}")
+                .replace("{product[name]}", "{subset}")
+                .replace("{Product[name]}", "{Subset}")
+                .replace("{PRODUCT[NAME]}", "{SUBSET}")
+                .replace("{product[type]}", "{family}")
+                .replace("{Product[type]}", "{Family}")
+                .replace("{PRODUCT[TYPE]}", "{FAMILY}")
+                .replace("{folder[name]}", "{asset}")
+                .replace("{Folder[name]}", "{Asset}")
+                .replace("{FOLDER[NAME]}", "{ASSET}")
+            )
+        return burnin_values
+
+    def fill_burnin_data(self, instance, repre, burnin_data):
+        """Add anatomy, custom and representation data to burnin data.
+
+        Args:
+            instance (pyblish.api.Instance): Pyblish instance.
+            repre (dict): Processed representation.
+            burnin_data (dict): Burnin data to fill.
+
+        """
+        anatomy = instance.context.data["anatomy"]
+        # Add anatomy keys to burnin_data.
+        filled_anatomy = anatomy.format_all(burnin_data)
+        burnin_data["anatomy"] = filled_anatomy.get_solved()
+
+        custom_data = copy.deepcopy(
+            instance.data.get("customData") or {}
+        )
+        # Backwards compatibility (since 2022/04/07)
+        custom_data.update(
+            instance.data.get("custom_burnin_data") or {}
+        )
+
+        # Add context data burnin_data.
+        burnin_data["custom"] = custom_data
+
+        # Add data members.
+        burnin_data.update(instance.data.get("burninDataMembers", {}))
+
+        # Add source camera name to burnin data
+        camera_name = repre.get("camera_name")
+        if camera_name:
+            burnin_data["camera_name"] = camera_name
+
+    def get_burnin_filters(self, instance, repre, width, height, fps):
+        """Video filters drawing burnins on representation output.
+
+        Filters can be used by extractor rendering the representation, so
+        burnins are drawn during its encoding and second encoding by this
+        plugin is not needed. Only representation with single burnin
+        definition is supported.
+
+        Burnins using source timecode are not supported, because source
+        file is not probed, so they're drawn by ExtractBurnin.
+
+        Args:
+            instance (pyblish.api.Instance): Pyblish instance.
+            repre (dict): Representation which will be rendered.
+            width (int): Width of rendered output.
+            height (int): Height of rendered output.
+            fps (float): Frame rate of rendered output.
+
+        Returns:
+            Union[tuple[list[str], list[str]], None]: Video filters and
+                paths to temporary files that should be removed after
+                render. 'None' if burnins can't be drawn by the filters.
+
+        """
+        if (
+            not self.profiles
+            or not self.repres_is_valid(repre)
+        ):
+            return None
+
+        burnin_defs = self.get_burnin_defs(instance)
+        repre_burnin_defs = self.get_repre_burnin_defs(repre, burnin_defs)
+        if len(repre_burnin_defs) != 1:
+            return None
+
+        # Module is imported only when needed because it requires
+        #   OpenTimelineIO contrib and ffmpeg on import
+        try:
+            from ayon_core.scripts.otio_burnin import (
+                get_burnin_filters,
+                SOURCE_TIMECODE_KEY,
+            )
+        except Exception:
+            self.log.debug(
+                "Burnin filters builder is not available.", exc_info=True
+            )
+            return None
+
+        burnin_values = self.get_burnin_values(repre_burnin_defs[0])
+        # Source timecode requires ffprobe data of the source file
+        if any(
+            SOURCE_TIMECODE_KEY in value
+            for value in burnin_values.values()
+            if isinstance(value, str)
+        ):
+            return None
+
+        burnin_data, temp_data = self.prepare_basic_data(instance)
+        self.prepare_repre_data(instance, repre, burnin_data, temp_data)
+        self.fill_burnin_data(instance, repre, burnin_data)
+
+        burnin_options = self._get_burnin_options()
+        burnin_options["fps"] = fps
+        return get_burnin_filters(
+            burnin_data,
+            burnin_values,
+            width,
+            height,
+            fps,
+            burnin_options,
+        )
+
+    def main_process(self, instance):
+        burnin_defs = self.get_burnin_defs(instance)
+        if not burnin_defs:
             return
 
         burnins_per_repres = self._get_burnins_per_representations(
@@ -208,7 +372,6 @@ class ExtractBurnin(publish.Extractor):
         # Prepare basic data for processing
         _burnin_data, _temp_data = self.prepare_basic_data(instance)
 
-        anatomy = instance.context.data["anatomy"]
         scriptpath = self.burnin_script_path()
 
         # Args that will execute the script
@@ -259,28 +422,7 @@ class ExtractBurnin(publish.Extractor):
                     self.log
                 )
 
-            # Add anatomy keys to burnin_data.
-            filled_anatomy = anatomy.format_all(burnin_data)
-            burnin_data["anatomy"] = filled_anatomy.get_solved()
-
-            custom_data = copy.deepcopy(
-                instance.data.get("customData") or {}
-            )
-            # Backwards compatibility (since 2022/04/07)
-            custom_data.update(
-                instance.data.get("custom_burnin_data") or {}
-            )
-
-            # Add context data burnin_data.
-            burnin_data["custom"] = custom_data
-
-            # Add data members.
-            burnin_data.update(instance.data.get("burninDataMembers", {}))
-
-            # Add source camera name to burnin data
-            camera_name = repre.get("camera_name")
-            if camera_name:
-                burnin_data["camera_name"] = camera_name
+            self.fill_burnin_data(instance, repre, burnin_data)
 
             first_output = True
 
@@ -306,25 +448,7 @@ class ExtractBurnin(publish.Extractor):
                 elif "ftrackreview" in new_repre["tags"]:
                     new_repre["tags"].remove("ftrackreview")
 
-                burnin_values = {}
-                for key in self.positions:
-                    value = burnin_def.get(key)
-                    if not value:
-                        continue
-                    # TODO remove replacements
-                    burnin_values[key] = (
-                        value
-                        .replace("{task}", "{task[name]}")
-                        .replace("{product[name]}", "{subset}")
-                        .replace("{Product[name]}", "{Subset}")
-                        .replace("{PRODUCT[NAME]}", "{SUBSET}")
-                        .replace("{product[type]}", "{family}")
-                        .replace("{Product[type]}", "{Family}")
-                        .replace("{PRODUCT[TYPE]}", "{FAMILY}")
-                        .replace("{folder[name]}", "{asset}")
-                        .replace("{Folder[name]}", "{Asset}")
-                        .replace("{FOLDER[NAME]}", "{ASSET}")
-                    )
+                burnin_values = self.get_burnin_values(burnin_def)
 
                 # Remove "delete" tag from new representation
                 if "delete" in new_repre["tags"]:
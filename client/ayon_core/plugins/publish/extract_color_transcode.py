@@ -11,6 +11,7 @@ from ayon_core.lib import (
 
 from ayon_core.lib.transcoding import (
     convert_colorspace,
+    convert_colorspace_sequence,
     get_transcode_temp_directory,
 )
 
@@ -64,6 +65,14 @@ class ExtractOIIOTranscode(publish.Extractor):
     profiles = None
     options = None
 
+    # Maximum number of concurrent oiiotool processes converting chunks
+    #   of a sequence, '0' uses tool scheduler limit
+    max_workers = 0
+    # Minimum number of frames converted by one oiiotool process
+    min_chunk_size = 10
+    # Report progress of sequence conversion to log and publish events
+    report_progress = False
+
     def process(self, instance):
         if not self.profiles:
             self.log.debug("No profiles present for color transcode")
@@ -143,9 +152,49 @@ class ExtractOIIOTranscode(publish.Extractor):
                 additional_command_args = (output_def["oiiotool_args"]
                                            ["additional_command_args"])
 
-                files_to_convert = self._translate_to_sequence(
+                collection, remainder = self._split_to_sequence(
                     files_to_convert)
-                for file_name in files_to_convert:
+                if collection is not None:
+                    input_collection = clique.Collection(
+                        os.path.join(original_staging_dir, collection.head),
+                        collection.tail,
+                        collection.padding,
+                        indexes=collection.indexes
+                    )
+                    output_tail = collection.tail
+                    if output_extension:
+                        output_tail = "{}.{}".format(
+                            output_tail.rsplit(".", 1)[0], output_extension
+                        )
+                    output_collection = clique.Collection(
+                        os.path.join(new_staging_dir, collection.head),
+                        output_tail,
+                        collection.padding,
+                        indexes=collection.indexes
+                    )
+                    progress_callback = None
+                    if self.report_progress:
+                        progress_callback = (
+                            publish.get_tool_progress_callback(
+                                output_name, self.log
+                            )
+                        )
+                    convert_colorspace_sequence(
+                        input_collection,
+                        output_collection,
+                        config_path,
+                        source_colorspace,
+                        target_colorspace,
+                        view,
+                        display,
+                        additional_command_args,
+                        self.log,
+                        max_workers=self.max_workers,
+                        min_chunk_size=self.min_chunk_size,
+                        progress_callback=progress_callback,
+                    )
+
+                for file_name in remainder:
                     input_path = os.path.join(original_staging_dir,
                                               file_name)
                     output_path = self._get_output_file_path(input_path,
@@ -240,38 +289,30 @@ class ExtractOIIOTranscode(publish.Extractor):
             renamed_files.append(file_name)
         new_repre["files"] = renamed_files
 
-    def _translate_to_sequence(self, files_to_convert):
-        """Returns original list or list with filename formatted in single
-        sequence format.
+    def _split_to_sequence(self, files_to_convert):
+        """Split file names to frame sequence and remaining files.
 
-        Uses clique to find frame sequence, in this case it merges all frames
-        into sequence format (FRAMESTART-FRAMEEND#) and returns it.
-        If sequence not found, it returns original list
+        Uses clique to find frame sequence. Sequence is converted by
+        chunks in parallel, remaining files are converted one by one.
 
         Args:
             files_to_convert (list): list of file names
         Returns:
-            (list) of [file.1001-1010#.exr] or [fileA.exr, fileB.exr]
+            tuple[Union[clique.Collection, None], list[str]]: Sequence
+                of files or 'None' and list of remaining file names.
         """
         pattern = [clique.PATTERNS["frames"]]
         collections, remainder = clique.assemble(
             files_to_convert, patterns=pattern,
             assume_padded_when_ambiguous=True)
 
-        if collections:
-            if len(collections) > 1:
-                raise ValueError(
-                    "Too many collections {}".format(collections))
-
-            collection = collections[0]
-            frames = list(collection.indexes)
-            frame_str = "{}-{}#".format(frames[0], frames[-1])
-            file_name = "{}{}{}".format(collection.head, frame_str,
-                                        collection.tail)
-
-            files_to_convert = [file_name]
+        if not collections:
+            return None, list(files_to_convert)
 
-        return files_to_convert
+        if len(collections) > 1:
+            raise ValueError(
+                "Too many collections {}".format(collections))
+        return collections[0], remainder
 
     def _get_output_file_path(self, input_path, output_dir,
                               output_extension):
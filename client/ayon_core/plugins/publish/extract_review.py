@@ -1,10 +1,13 @@
 import os
 import re
 import copy
+import math
 import json
 import shutil
+import tempfile
 import subprocess
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 import clique
 import speedcopy
@@ -12,12 +15,17 @@ import pyblish.api
 
 from ayon_core.lib import (
     get_ffmpeg_tool_args,
+    get_tool_scheduler,
     filter_profiles,
+    create_file_link,
     path_to_subprocess_arg,
     run_subprocess,
+    run_subprocess_streamed,
 )
 from ayon_core.lib.transcoding import (
     IMAGE_EXTENSIONS,
+    FFmpegProgressParser,
+    get_ffmpeg_progress_args,
     get_ffprobe_streams,
     should_convert_for_ffmpeg,
     get_review_layer_name,
@@ -27,6 +35,7 @@ from ayon_core.lib.transcoding import (
 from ayon_core.pipeline.publish import (
     KnownPublishError,
     get_publish_instance_label,
+    get_tool_progress_callback,
 )
 from ayon_core.pipeline.publish.lib import add_repre_files_for_cleanup
 
@@ -103,6 +112,20 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     # Preset attributes
     profiles = []
+    # Render compatible outputs with single ffmpeg process
+    single_decode = False
+    # Draw burnins during review encoding instead of ExtractBurnin pass
+    fuse_burnins = False
+    # Encode long sequences in parallel segments concatenated at the end
+    segmented_encoding = False
+    # Number of concurrently encoded segments, '0' uses tool scheduler limit
+    segment_workers = 0
+    # Minimum number of frames in one segment
+    segment_min_frames = 250
+    # Filters which depend on frame number or time of the whole output
+    _segment_incompatible_filters = ("drawtext", "sendcmd", "fade", "trim")
+    # Report progress of ffmpeg encoding to log and publish events
+    report_progress = False
 
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
@@ -347,6 +370,8 @@ class ExtractReview(pyblish.api.InstancePlugin):
         layer_name
     ):
         fill_data = copy.deepcopy(instance.data["anatomyData"])
+        jobs = []
+        burnin_plugin = None
         for _output_def in output_definitions:
             output_def = copy.deepcopy(_output_def)
             # Make sure output definition has "tags" key
@@ -396,15 +421,6 @@ class ExtractReview(pyblish.api.InstancePlugin):
             )
 
             temp_data = self.prepare_temp_data(instance, repre, output_def)
-            files_to_clean = []
-            if temp_data["input_is_sequence"]:
-                self.log.debug("Checking sequence to fill gaps in sequence..")
-                files_to_clean = self.fill_sequence_gaps(
-                    files=temp_data["origin_repre"]["files"],
-                    staging_dir=new_repre["stagingDir"],
-                    start_frame=temp_data["frame_start"],
-                    end_frame=temp_data["frame_end"]
-                )
 
             # create or update outputName
             output_name = new_repre.get("outputName", "")
@@ -431,7 +447,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
             })
 
             try:  # temporary until oiiotool is supported cross platform
-                ffmpeg_args = self._ffmpeg_arguments(
+                ffmpeg_arg_parts = self._ffmpeg_argument_parts(
                     output_def,
                     instance,
                     new_repre,
@@ -450,29 +466,65 @@ class ExtractReview(pyblish.api.InstancePlugin):
                         ),
                         exc_info=True
                     )
-                    return
+                    break
                 raise NotImplementedError
 
-            subprcs_cmd = " ".join(ffmpeg_args)
+            job = {
+                "output_def": output_def,
+                "output_name": output_name,
+                "output_ext": output_ext,
+                "new_repre": new_repre,
+                "temp_data": temp_data,
+                "ffmpeg_arg_parts": ffmpeg_arg_parts,
+                "files_to_clean": [],
+            }
+            if self.fuse_burnins and "burnin" in new_repre["tags"]:
+                if burnin_plugin is None:
+                    burnin_plugin = self._get_burnin_plugin(instance)
+                if burnin_plugin:
+                    self._fuse_burnins(instance, job, burnin_plugin)
+            jobs.append(job)
+
+        if not jobs:
+            return
 
-            # run subprocess
-            self.log.debug("Executing: {}".format(subprcs_cmd))
+        files_to_clean = []
+        if jobs[0]["temp_data"]["input_is_sequence"]:
+            self.log.debug("Checking sequence to fill gaps in sequence..")
+            files_to_clean = self.fill_sequence_gaps(
+                files=repre["files"],
+                staging_dir=src_repre_staging_dir,
+                start_frame=jobs[0]["temp_data"]["frame_start"],
+                end_frame=jobs[0]["temp_data"]["frame_end"]
+            )
 
-            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+        try:
+            for jobs_group in self._group_jobs_by_input(jobs):
+                self._run_ffmpeg_jobs(jobs_group)
 
+        finally:
             # delete files added to fill gaps
-            if files_to_clean:
-                for f in files_to_clean:
-                    os.unlink(f)
-
+            for f in files_to_clean:
+                os.unlink(f)
+
+            for job in jobs:
+                for path in job["files_to_clean"]:
+                    if os.path.exists(path):
+                        os.remove(path)
+
+        for job in jobs:
+            output_name = job["output_name"]
+            output_ext = job["output_ext"]
+            temp_data = job["temp_data"]
+            new_repre = job["new_repre"]
             new_repre.update({
                 "fps": temp_data["fps"],
                 "name": "{}_{}".format(output_name, output_ext),
                 "outputName": output_name,
-                "outputDef": output_def,
+                "outputDef": job["output_def"],
                 "frameStartFtrack": temp_data["output_frame_start"],
                 "frameEndFtrack": temp_data["output_frame_end"],
-                "ffmpeg_cmd": subprcs_cmd
+                "ffmpeg_cmd": job["ffmpeg_cmd"]
             })
 
             # Force to pop these key if are in new repre
@@ -488,6 +540,488 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
             add_repre_files_for_cleanup(instance, new_repre)
 
+    def _get_burnin_plugin(self, instance):
+        """Burnin plugin with project settings used to fuse burnins.
+
+        Returns:
+            Union[pyblish.api.Plugin, bool]: Plugin or 'False' if burnins
+                can't be fused.
+
+        """
+        # Plugin is imported here to avoid its discovery from this module
+        from ayon_core.plugins.publish.extract_burnin import ExtractBurnin
+
+        project_settings = instance.context.data["project_settings"]
+        burnin_settings = (
+            project_settings["core"]["publish"].get("ExtractBurnin") or {}
+        )
+        if not burnin_settings.get("enabled", True):
+            return False
+
+        # Burnins are fused only if ExtractBurnin would process the instance
+        hosts = pyblish.api.registered_hosts()
+        if not any(
+            pyblish.api.plugins_by_host([ExtractBurnin], host)
+            for host in hosts
+        ):
+            self.log.debug(
+                "ExtractBurnin does not support hosts {}.".format(hosts)
+            )
+            return False
+
+        if not pyblish.api.instances_by_plugin([instance], ExtractBurnin):
+            self.log.debug(
+                "ExtractBurnin does not process families of the instance."
+            )
+            return False
+
+        burnin_plugin = ExtractBurnin()
+        burnin_plugin.log = self.log
+        burnin_plugin.profiles = burnin_settings.get("profiles")
+        burnin_plugin.options = burnin_settings.get("options")
+        return burnin_plugin
+
+    def _fuse_burnins(self, instance, job, burnin_plugin):
+        """Add burnin filters to output job.
+
+        Burnins are skipped by ExtractBurnin when are fused, so the output
+        is encoded only once.
+
+        Args:
+            instance (pyblish.api.Instance): Processed instance.
+            job (dict[str, Any]): Prepared output job.
+            burnin_plugin (pyblish.api.Plugin): Burnin plugin with settings.
+
+        """
+        new_repre = job["new_repre"]
+        temp_data = job["temp_data"]
+        # Burnin data use name of representation
+        new_repre["name"] = "{}_{}".format(
+            job["output_name"], job["output_ext"]
+        )
+        result = burnin_plugin.get_burnin_filters(
+            instance,
+            new_repre,
+            new_repre["resolutionWidth"],
+            new_repre["resolutionHeight"],
+            temp_data["fps"]
+        )
+        if result is None:
+            self.log.debug(
+                "Burnins of \"{}\" can't be fused to review.".format(
+                    new_repre["name"]
+                )
+            )
+            return
+
+        burnin_filters, burnin_files = result
+        input_args, video_filters, audio_filters, output_args = (
+            job["ffmpeg_arg_parts"]
+        )
+        video_filters = video_filters + burnin_filters
+        # Pass filters using script file to avoid escaping of burnin
+        #   text in shell command
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".txt", delete=False
+        ) as stream:
+            stream.write(",".join(video_filters))
+            filters_path = stream.name
+
+        job["files_to_clean"].extend(burnin_files)
+        job["files_to_clean"].append(filters_path)
+        job["ffmpeg_arg_parts"] = (
+            input_args,
+            [],
+            audio_filters,
+            ["-filter_script:v", path_to_subprocess_arg(filters_path)]
+            + output_args
+        )
+        # Burnins are already drawn, mark the output because it does not
+        #   have "burnin" tag anymore
+        new_repre["tags"].remove("burnin")
+        new_repre["burninsFused"] = True
+        if "delete" in new_repre["tags"]:
+            new_repre["tags"].remove("delete")
+        self.log.debug("Burnins fused to \"{}\".".format(new_repre["name"]))
+
+    def _group_jobs_by_input(self, jobs):
+        """Group output jobs which can be rendered with single ffmpeg process.
+
+        Jobs are grouped only if 'single_decode' is enabled. Jobs that can't
+        share decoding of input are returned as groups with single job.
+
+        Args:
+            jobs (list[dict[str, Any]]): Prepared output jobs.
+
+        Returns:
+            list[list[dict[str, Any]]]: Groups of jobs.
+
+        """
+        if not self.single_decode:
+            return [[job] for job in jobs]
+
+        groups = []
+        groups_by_input = {}
+        for job in jobs:
+            if not self._can_share_decode(job):
+                groups.append([job])
+                continue
+            input_args = tuple(job["ffmpeg_arg_parts"][0])
+            group = groups_by_input.get(input_args)
+            if group is None:
+                group = []
+                groups_by_input[input_args] = group
+                groups.append(group)
+            group.append(job)
+        return groups
+
+    def _can_share_decode(self, job):
+        """Output can be rendered from input decoded for other outputs.
+
+        Only image inputs with video input as first ffmpeg input and
+        at most one audio input are supported. Filters can't use labels
+        and arguments can't define own stream mapping.
+        """
+        temp_data = job["temp_data"]
+        input_ext = os.path.splitext(temp_data["full_input_path"])[1]
+        if (
+            not temp_data["input_is_sequence"]
+            and input_ext.lower().lstrip(".") not in self.image_exts
+        ):
+            return False
+
+        input_args, video_filters, audio_filters, output_args = (
+            job["ffmpeg_arg_parts"]
+        )
+        input_idxs = [
+            idx
+            for idx, arg in enumerate(input_args)
+            if arg == "-i" or arg.startswith("-i ")
+        ]
+        if (
+            len(input_idxs) > 2
+            or input_idxs[0] + 1 >= len(input_args)
+            or input_args[input_idxs[0]] != "-i"
+            or input_args[input_idxs[0] + 1] != path_to_subprocess_arg(
+                temp_data["full_input_path"]
+            )
+        ):
+            return False
+
+        for arg in input_args + output_args:
+            if arg.split(" ")[0] in (
+                "-filter_complex", "-filter_script:v", "-lavfi", "-map"
+            ):
+                return False
+
+        for value in video_filters + audio_filters:
+            if "[" in value or ";" in value:
+                return False
+        return True
+
+    def _run_ffmpeg_jobs(self, jobs):
+        """Render output jobs.
+
+        Multiple jobs are rendered with one ffmpeg process where input is
+        decoded once and split to each output. Each output is rendered
+        separately if the process fails.
+
+        Args:
+            jobs (list[dict[str, Any]]): Jobs sharing same input.
+
+        """
+        if len(jobs) > 1:
+            ffmpeg_args = self.ffmpeg_multi_output_args(
+                [job["ffmpeg_arg_parts"] for job in jobs]
+            )
+            subprcs_cmd = " ".join(ffmpeg_args)
+            try:
+                self._run_ffmpeg(
+                    ffmpeg_args,
+                    ", ".join(job["output_name"] for job in jobs),
+                    self._get_job_frames_count(jobs[0]),
+                )
+                for job in jobs:
+                    job["ffmpeg_cmd"] = subprcs_cmd
+                return
+
+            except RuntimeError:
+                self.log.warning(
+                    "Rendering of multiple outputs at once failed."
+                    " Rendering outputs one by one.",
+                    exc_info=True
+                )
+
+        for job in jobs:
+            ffmpeg_args = self.ffmpeg_full_args(*job["ffmpeg_arg_parts"])
+            subprcs_cmd = " ".join(ffmpeg_args)
+            job["ffmpeg_cmd"] = subprcs_cmd
+
+            segments = self._get_encoding_segments(job)
+            if segments:
+                try:
+                    self._encode_in_segments(job, segments)
+                    continue
+
+                except RuntimeError:
+                    self.log.warning(
+                        "Segmented encoding failed. Encoding output"
+                        " with single process.",
+                        exc_info=True
+                    )
+
+            # run subprocess
+            self._run_ffmpeg(
+                ffmpeg_args,
+                job["output_name"],
+                self._get_job_frames_count(job),
+            )
+
+    def _get_job_frames_count(self, job):
+        temp_data = job["temp_data"]
+        return (
+            temp_data["output_frame_end"]
+            - temp_data["output_frame_start"]
+            + 1
+        )
+
+    def _run_ffmpeg(self, ffmpeg_args, label, frames_count=None):
+        """Run ffmpeg and report progress of encoding.
+
+        Args:
+            ffmpeg_args (list[str]): Ffmpeg arguments where first item is
+                ffmpeg executable.
+            label (str): Label used in progress reports.
+            frames_count (Optional[int]): Expected number of output frames.
+
+        Raises:
+            RuntimeError: When ffmpeg process failed.
+
+        """
+        if not self.report_progress:
+            subprcs_cmd = " ".join(ffmpeg_args)
+            self.log.debug("Executing: {}".format(subprcs_cmd))
+            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+            return
+
+        # Progress arguments are global and must follow the executable
+        subprcs_cmd = " ".join(
+            ffmpeg_args[:1] + get_ffmpeg_progress_args() + ffmpeg_args[1:]
+        )
+        self.log.debug("Executing: {}".format(subprcs_cmd))
+        progress_parser = FFmpegProgressParser(
+            get_tool_progress_callback(label, self.log),
+            frames_count
+        )
+        run_subprocess_streamed(
+            subprcs_cmd,
+            shell=True,
+            logger=self.log,
+            output_callback=progress_parser,
+        )
+
+    def _get_encoding_segments(self, job):
+        """Split output frames to segments which can be encoded in parallel.
+
+        Only video outputs of image sequences are supported. Segments are
+        aligned to GOP size ('-g' argument) so each segment starts with
+        a key frame of the output.
+
+        Args:
+            job (dict[str, Any]): Prepared output job.
+
+        Returns:
+            list[tuple[int, int]]: Offset and frames count of each segment.
+                Empty list if output should be encoded with single process.
+
+        """
+        if not self.segmented_encoding:
+            return []
+
+        temp_data = job["temp_data"]
+        if (
+            not temp_data["input_is_sequence"]
+            or temp_data["output_ext_is_image"]
+        ):
+            return []
+
+        input_args, video_filters, audio_filters, output_args = (
+            job["ffmpeg_arg_parts"]
+        )
+        for arg in output_args:
+            arg_name = arg.split(" ")[0]
+            if arg_name in (
+                "-filter_complex", "-filter_script:v", "-lavfi", "-map"
+            ):
+                return []
+
+        for value in video_filters:
+            if any(
+                name in value
+                for name in self._segment_incompatible_filters
+            ):
+                return []
+
+        # Multiple audio inputs are merged with 'filter_complex'
+        audio_inputs = [arg for arg in input_args if arg.startswith("-i ")]
+        if len(audio_inputs) > 1:
+            return []
+
+        frames_count = (
+            temp_data["output_frame_end"]
+            - temp_data["output_frame_start"]
+            + 1
+        )
+        workers = (
+            self.segment_workers
+            or get_tool_scheduler().get_limit("ffmpeg")
+        )
+        segments_count = min(
+            workers, frames_count // max(1, self.segment_min_frames)
+        )
+        if segments_count < 2:
+            return []
+
+        gop_size = 1
+        for idx, arg in enumerate(output_args):
+            value = None
+            if arg == "-g" and idx + 1 < len(output_args):
+                value = output_args[idx + 1]
+            elif arg.startswith("-g "):
+                value = arg[3:]
+            if value is not None:
+                try:
+                    gop_size = max(1, int(value.strip()))
+                except ValueError:
+                    pass
+
+        segment_len = int(math.ceil(frames_count / segments_count))
+        segment_len = int(math.ceil(segment_len / gop_size)) * gop_size
+        return [
+            (offset, min(segment_len, frames_count - offset))
+            for offset in range(0, frames_count, segment_len)
+        ]
+
+    def _encode_in_segments(self, job, segments):
+        """Encode output in segments and concatenate them.
+
+        Segments contain only video and are encoded by concurrently running
+        ffmpeg processes. Segments are concatenated using concat demuxer
+        without re-encoding and audio is muxed during concatenation.
+
+        Args:
+            job (dict[str, Any]): Prepared output job.
+            segments (list[tuple[int, int]]): Offset and frames count of
+                each segment.
+
+        Raises:
+            RuntimeError: When any ffmpeg process failed.
+
+        """
+        input_args, video_filters, audio_filters, output_args = (
+            job["ffmpeg_arg_parts"]
+        )
+        video_input_idx = input_args.index("-i")
+        video_input_args = list(input_args[:video_input_idx + 2])
+        audio_input_args = list(input_args[video_input_idx + 2:])
+
+        start_number_idx = video_input_args.index("-start_number") + 1
+        start_number = int(video_input_args[start_number_idx])
+        # Duration of segments is defined by frames count
+        if "-to" in video_input_args:
+            idx = video_input_args.index("-to")
+            video_input_args[idx:idx + 2] = []
+
+        segment_output_args = []
+        skip_next = False
+        for arg in output_args[:-1]:
+            if skip_next:
+                skip_next = False
+                continue
+            if arg in ("-t", "-frames:v"):
+                skip_next = True
+                continue
+            if arg != "-y":
+                segment_output_args.append(arg)
+
+        output_path = output_args[-1]
+        output_ext = os.path.splitext(job["temp_data"]["full_output_path"])[1]
+        segments_dir = tempfile.mkdtemp(prefix="ayon_review_segments_")
+        try:
+            segment_cmds = []
+            segment_paths = []
+            for idx, (offset, frames_count) in enumerate(segments):
+                segment_path = os.path.join(
+                    segments_dir, "segment_{:04d}{}".format(idx, output_ext)
+                )
+                segment_input_args = list(video_input_args)
+                segment_input_args[start_number_idx] = str(
+                    start_number + offset
+                )
+                segment_args = self.ffmpeg_full_args(
+                    segment_input_args,
+                    list(video_filters),
+                    [],
+                    segment_output_args + [
+                        "-an",
+                        "-frames:v", str(frames_count),
+                        "-y", path_to_subprocess_arg(segment_path)
+                    ]
+                )
+                segment_cmds.append(" ".join(segment_args))
+                segment_paths.append(segment_path)
+
+            self.log.debug("Encoding {} segments in parallel.".format(
+                len(segment_cmds)
+            ))
+            with ThreadPoolExecutor(
+                max_workers=len(segment_cmds)
+            ) as executor:
+                futures = []
+                for subprcs_cmd in segment_cmds:
+                    self.log.debug("Executing: {}".format(subprcs_cmd))
+                    futures.append(executor.submit(
+                        run_subprocess,
+                        subprcs_cmd,
+                        shell=True,
+                        logger=self.log
+                    ))
+                for future in futures:
+                    future.result()
+
+            concat_list_path = os.path.join(segments_dir, "segments.txt")
+            with open(concat_list_path, "w") as stream:
+                for segment_path in segment_paths:
+                    stream.write("file '{}'\n".format(
+                        segment_path.replace("\\", "/")
+                    ))
+
+            concat_args = [
+                subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg")),
+                "-f", "concat",
+                "-safe", "0",
+                "-i", path_to_subprocess_arg(concat_list_path),
+            ]
+            concat_args.extend(audio_input_args)
+            concat_args.extend(["-map", "0:v"])
+            if audio_input_args and "-an" not in output_args:
+                concat_args.extend(["-map", "1:a:0?"])
+                if audio_filters:
+                    concat_args.append("-filter:a")
+                    concat_args.append(
+                        "\"{}\"".format(",".join(audio_filters))
+                    )
+            concat_args.extend(output_args[:-1])
+            # Video stream copy must be last to override codec arguments
+            concat_args.extend(["-c:v", "copy", output_path])
+
+            subprcs_cmd = " ".join(concat_args)
+            self.log.debug("Executing: {}".format(subprcs_cmd))
+            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+
+        finally:
+            shutil.rmtree(segments_dir, ignore_errors=True)
+
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
         # TODO GLOBAL ISSUE - Find better way how to find out if input
@@ -618,6 +1152,33 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 process.
             temp_data (dict): Base data for successful process.
         """
+        return self.ffmpeg_full_args(*self._ffmpeg_argument_parts(
+            output_def,
+            instance,
+            new_repre,
+            temp_data,
+            fill_data,
+            layer_name
+        ))
+
+    def _ffmpeg_argument_parts(
+        self,
+        output_def,
+        instance,
+        new_repre,
+        temp_data,
+        fill_data,
+        layer_name
+    ):
+        """Prepares ffmpeg input arguments, filters and output arguments.
+
+        Video and audio filters found in output arguments are moved to
+        filters.
+
+        Returns:
+            tuple[list[str], list[str], list[str], list[str]]: Input
+                arguments, video filters, audio filters and output arguments.
+        """
 
         # Get FFmpeg arguments from profile presets
         out_def_ffmpeg_args = output_def.get("ffmpeg_args") or {}
@@ -796,7 +1357,12 @@ class ExtractReview(pyblish.api.InstancePlugin):
             path_to_subprocess_arg(temp_data["full_output_path"])
         )
 
-        return self.ffmpeg_full_args(
+        ffmpeg_output_args = self._move_filters_from_output_args(
+            ffmpeg_output_args,
+            ffmpeg_video_filters,
+            ffmpeg_audio_filters
+        )
+        return (
             ffmpeg_input_args,
             ffmpeg_video_filters,
             ffmpeg_audio_filters,
@@ -844,6 +1410,93 @@ class ExtractReview(pyblish.api.InstancePlugin):
         Returns:
             list: Containing all arguments ready to run in subprocess.
         """
+        output_args = self._move_filters_from_output_args(
+            output_args, video_filters, audio_filters
+        )
+
+        all_args = [
+            subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
+        ]
+        all_args.extend(input_args)
+        if video_filters:
+            all_args.append("-filter:v")
+            all_args.append("\"{}\"".format(",".join(video_filters)))
+
+        if audio_filters:
+            all_args.append("-filter:a")
+            all_args.append("\"{}\"".format(",".join(audio_filters)))
+
+        all_args.extend(output_args)
+
+        return all_args
+
+    def ffmpeg_multi_output_args(self, args_parts):
+        """Create ffmpeg arguments rendering multiple outputs at once.
+
+        All outputs must have same input arguments. First input is decoded
+        only once and split to filters of each output using
+        'filter_complex'. Audio is mapped from second input if output
+        has audio.
+
+        Args:
+            args_parts (list[tuple[list, list, list, list]]): Input
+                arguments, video filters, audio filters and output arguments
+                of each output.
+
+        Returns:
+            list: Containing all arguments ready to run in subprocess.
+        """
+        input_args = args_parts[0][0]
+        audio_input_count = len([
+            arg for arg in input_args if arg.startswith("-i ")
+        ])
+        split_labels = "".join(
+            "[src{}]".format(idx) for idx in range(len(args_parts))
+        )
+        filter_graph = ["[0:v]split={}{}".format(
+            len(args_parts), split_labels
+        )]
+        all_output_args = []
+        for idx, parts in enumerate(args_parts):
+            _, video_filters, audio_filters, output_args = parts
+            output_args = self._move_filters_from_output_args(
+                output_args, video_filters, audio_filters
+            )
+            filter_graph.append("[src{}]{}[out{}]".format(
+                idx, ",".join(video_filters) or "null", idx
+            ))
+            all_output_args.extend(["-map", "\"[out{}]\"".format(idx)])
+            if audio_input_count and "-an" not in output_args:
+                all_output_args.extend(["-map", "1:a:0?"])
+                if audio_filters:
+                    all_output_args.append("-filter:a")
+                    all_output_args.append(
+                        "\"{}\"".format(",".join(audio_filters))
+                    )
+            all_output_args.extend(output_args)
+
+        all_args = [
+            subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
+        ]
+        all_args.extend(input_args)
+        all_args.append("-filter_complex")
+        all_args.append("\"{}\"".format(";".join(filter_graph)))
+        all_args.extend(all_output_args)
+        return all_args
+
+    def _move_filters_from_output_args(
+        self, output_args, video_filters, audio_filters
+    ):
+        """Move video and audio filters from output arguments to filters.
+
+        Args:
+            output_args (list): Collected ffmpeg output arguments.
+            video_filters (list): Collected video filters.
+            audio_filters (list): Collected audio filters.
+
+        Returns:
+            list: Output arguments without filters.
+        """
         output_args = self.split_ffmpeg_args(output_args)
 
         video_args_dentifiers = ["-vf", "-filter:v"]
@@ -861,29 +1514,15 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     arg = arg.replace(identifier, "").strip()
                     audio_filters.append(arg)
 
-        all_args = [
-            subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
-        ]
-        all_args.extend(input_args)
-        if video_filters:
-            all_args.append("-filter:v")
-            all_args.append("\"{}\"".format(",".join(video_filters)))
-
-        if audio_filters:
-            all_args.append("-filter:a")
-            all_args.append("\"{}\"".format(",".join(audio_filters)))
-
-        all_args.extend(output_args)
-
-        return all_args
+        return output_args
 
     def fill_sequence_gaps(self, files, staging_dir, start_frame, end_frame):
         # type: (list, str, int, int) -> list
         """Fill missing files in sequence by duplicating existing ones.
 
-        This will take nearest frame file and copy it with so as to fill
+        This will take nearest frame file and link it with so as to fill
         gaps in sequence. Last existing file there is is used to for the
-        hole ahead.
+        hole ahead. File is copied if link can't be created.
 
         Args:
             files (list): List of representation files.
@@ -927,7 +1566,8 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 raise KnownPublishError(
                     "Missing previously detected file: {}".format(src_fpath))
 
-            speedcopy.copyfile(src_fpath, hole_fpath)
+            if not create_file_link(src_fpath, hole_fpath):
+                speedcopy.copyfile(src_fpath, hole_fpath)
             added_files.append(hole_fpath)
 
         return added_files
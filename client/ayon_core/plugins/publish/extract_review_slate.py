@@ -1,5 +1,8 @@
 import os
 import re
+import json
+import hashlib
+import tempfile
 import subprocess
 from pprint import pformat
 
@@ -32,6 +35,8 @@ class ExtractReviewSlate(publish.Extractor):
 
     hosts = ["nuke", "shell"]
     optional = True
+    # Reuse encoded slate clips across outputs and instances of publishing
+    use_slate_cache = True
 
     def process(self, instance):
         inst_data = instance.data
@@ -257,42 +262,83 @@ class ExtractReviewSlate(publish.Extractor):
             # overrides output file
             output_args.append("-y")
 
-            slate_v_path = slate_path.replace(".png", ext)
-            output_args.append(
-                path_to_subprocess_arg(slate_v_path)
-            )
-            _remove_at_end.append(slate_v_path)
+            slate_cache_dir = None
+            slate_cache_key = None
+            if self.use_slate_cache:
+                slate_cache_dir = self._get_slate_cache_dir(instance.context)
+                slate_cache_key = self._get_slate_cache_key(
+                    slate_path, input_args + output_args
+                )
 
-            slate_args = [
-                subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg")),
-                " ".join(input_args),
-                " ".join(output_args)
-            ]
-            slate_subprocess_cmd = " ".join(slate_args)
+            if slate_cache_key:
+                slate_v_path = os.path.join(
+                    slate_cache_dir, slate_cache_key + ext
+                )
+            else:
+                slate_v_path = slate_path.replace(".png", ext)
+                _remove_at_end.append(slate_v_path)
 
-            # run slate generation subprocess
-            self.log.debug(
-                "Slate Executing: {}".format(slate_subprocess_cmd)
-            )
-            run_subprocess(
-                slate_subprocess_cmd, shell=True, logger=self.log
-            )
+            if slate_cache_key and os.path.exists(slate_v_path):
+                self.log.debug(
+                    "Using cached slate: {}".format(slate_v_path)
+                )
+            else:
+                output_args.append(
+                    path_to_subprocess_arg(slate_v_path)
+                )
+                slate_args = [
+                    subprocess.list2cmdline(
+                        get_ffmpeg_tool_args("ffmpeg")
+                    ),
+                    " ".join(input_args),
+                    " ".join(output_args)
+                ]
+                slate_subprocess_cmd = " ".join(slate_args)
+
+                # run slate generation subprocess
+                self.log.debug(
+                    "Slate Executing: {}".format(slate_subprocess_cmd)
+                )
+                self._run_cached_output(
+                    slate_subprocess_cmd, slate_v_path, shell=True
+                )
 
             # Create slate with silent audio track
             if input_audio:
                 # silent slate output path
                 slate_silent_path = "_silent".join(
                     os.path.splitext(slate_v_path))
-                _remove_at_end.append(slate_silent_path)
-                self._create_silent_slate(
-                    slate_v_path,
-                    slate_silent_path,
-                    audio_codec,
-                    audio_channels,
-                    audio_sample_rate,
-                    audio_channel_layout,
-                    input_frame_rate
-                )
+                if slate_cache_key:
+                    # Slate with silent audio depends also on audio
+                    #   of input
+                    slate_silent_path = "_{}".format(
+                        self._hash_value([
+                            audio_codec,
+                            audio_channels,
+                            audio_sample_rate,
+                            audio_channel_layout,
+                            input_frame_rate,
+                        ])
+                    ).join(os.path.splitext(slate_silent_path))
+                else:
+                    _remove_at_end.append(slate_silent_path)
+
+                if slate_cache_key and os.path.exists(slate_silent_path):
+                    self.log.debug(
+                        "Using cached silent slate: {}".format(
+                            slate_silent_path
+                        )
+                    )
+                else:
+                    self._create_silent_slate(
+                        slate_v_path,
+                        slate_silent_path,
+                        audio_codec,
+                        audio_channels,
+                        audio_sample_rate,
+                        audio_channel_layout,
+                        input_frame_rate
+                    )
 
                 # replace slate with silent slate for concat
                 slate_v_path = slate_silent_path
@@ -554,9 +600,61 @@ class ExtractReviewSlate(publish.Extractor):
         self.log.debug("Silent Slate Executing: {}".format(
             " ".join(slate_silent_args)
         ))
-        run_subprocess(
-            slate_silent_args, logger=self.log
-        )
+        self._run_cached_output(slate_silent_args, dst_path)
+
+    def _get_slate_cache_dir(self, context):
+        """Temp directory with encoded slates shared by whole publishing."""
+        cache_dir = context.data.get("slateCacheDir")
+        if not cache_dir or not os.path.isdir(cache_dir):
+            cache_dir = tempfile.mkdtemp(prefix="ayon_slates_")
+            self.log.debug(
+                "Created slate cache directory {}".format(cache_dir)
+            )
+            context.data["slateCacheDir"] = cache_dir
+            context.data["cleanupFullPaths"].append(cache_dir)
+        return cache_dir
+
+    def _get_slate_cache_key(self, slate_path, args):
+        """Hash of slate image content and arguments used for encoding.
+
+        Slate image content reflects slate template and fill data, the
+        arguments define resolution and codec of encoded slate.
+
+        Returns:
+            Union[str, None]: Cache key or None if slate image can't
+                be read.
+
+        """
+        content_hash = hashlib.sha1()
+        try:
+            with open(slate_path, "rb") as stream:
+                for chunk in iter(lambda: stream.read(1024 * 1024), b""):
+                    content_hash.update(chunk)
+        except OSError:
+            return None
+
+        # Path to slate image is not part of the key
+        slate_arg = path_to_subprocess_arg(slate_path)
+        return self._hash_value([
+            content_hash.hexdigest(),
+            [arg for arg in args if arg != slate_arg]
+        ])
+
+    def _hash_value(self, value):
+        value = json.dumps(value, default=str)
+        return hashlib.sha1(value.encode("utf-8")).hexdigest()
+
+    def _run_cached_output(self, cmd, output_path, **kwargs):
+        """Run subprocess and make sure partial output is not kept.
+
+        Output may be reused by other outputs from slate cache.
+        """
+        try:
+            run_subprocess(cmd, logger=self.log, **kwargs)
+        except Exception:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            raise
 
     def add_video_filter_args(self, args, inserting_arg):
         """
@@ -9,6 +9,7 @@ from ayon_core.lib import (
     get_ffmpeg_tool_args,
     get_ffprobe_data,
 
+    MediaProbeCache,
     is_oiio_supported,
     get_rescaled_command_arguments,
 
@@ -64,6 +65,10 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
         "output": []
     }
     product_names = []
+    # Prefer outputs of ExtractReview as source of thumbnail
+    reuse_review_outputs = False
+    # Re-use thumbnails generated from unchanged source files
+    use_thumbnail_cache = True
 
     def process(self, instance):
         # run main process
@@ -164,26 +169,14 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
         for repre in filtered_repres:
             repre_files = repre["files"]
             src_staging = os.path.normpath(repre["stagingDir"])
+            seek_seconds = None
             if not isinstance(repre_files, (list, tuple)):
-                # convert any video file to frame so oiio doesn't need to
-                # read video file (it is slow) and also we are having control
-                # over which frame is used for thumbnail
-                # this will also work with ffmpeg fallback conversion in case
-                # oiio is not supported
+                input_file = repre_files
                 repre_extension = os.path.splitext(repre_files)[1]
                 if repre_extension in VIDEO_EXTENSIONS:
-                    video_file_path = os.path.join(
-                        src_staging, repre_files
+                    seek_seconds = self._get_video_seek_seconds(
+                        os.path.join(src_staging, repre_files)
                     )
-                    file_path = self._create_frame_from_video(
-                        video_file_path,
-                        dst_staging
-                    )
-                    if file_path:
-                        src_staging, input_file = os.path.split(file_path)
-                else:
-                    # if it is not video file then just use first file
-                    input_file = repre_files
             else:
                 repre_files_thumb = copy.deepcopy(repre_files)
                 # exclude first frame if slate in representation tags
@@ -199,36 +192,49 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
             filename = os.path.splitext(input_file)[0]
             jpeg_file = filename + "_thumb.jpg"
             full_output_path = os.path.join(dst_staging, jpeg_file)
-            colorspace_data = repre.get("colorspaceData")
+            # Outputs of ExtractReview are already converted for viewing
+            #   but still carry colorspace data of their source
+            colorspace_data = None
+            if not self._is_review_output(repre):
+                colorspace_data = repre.get("colorspaceData")
 
             # only use OIIO if it is supported and representation has
             # colorspace data
-            if oiio_supported and colorspace_data:
+            use_oiio = bool(oiio_supported and colorspace_data)
+            cache_options = self._get_thumbnail_cache_options(
+                colorspace_data if use_oiio else None, seek_seconds
+            )
+            thumbnail_created = False
+            if self.use_thumbnail_cache:
+                # Thumbnails cache cleans up its directory on import
+                from ayon_core.pipeline.thumbnails import (
+                    copy_generated_thumbnail
+                )
+
+                thumbnail_created = copy_generated_thumbnail(
+                    full_input_path, full_output_path, cache_options
+                )
+            if thumbnail_created:
                 self.log.debug(
-                    "Trying to convert with OIIO "
-                    "with colorspace data: {}".format(colorspace_data)
+                    "Using cached thumbnail of {}".format(full_input_path)
                 )
-                # If the input can read by OIIO then use OIIO method for
-                # conversion otherwise use ffmpeg
-                thumbnail_created = self._create_thumbnail_oiio(
+            else:
+                thumbnail_created = self._create_thumbnail(
                     full_input_path,
                     full_output_path,
-                    colorspace_data
+                    dst_staging,
+                    colorspace_data if use_oiio else None,
+                    oiio_supported,
+                    seek_seconds,
                 )
-
-            # Try to use FFMPEG if OIIO is not supported or for cases when
-            #   oiiotool isn't available or representation is not having
-            #   colorspace data
-            if not thumbnail_created:
-                if oiio_supported:
-                    self.log.debug(
-                        "Converting with FFMPEG because input"
-                        " can't be read by OIIO."
+                if thumbnail_created and self.use_thumbnail_cache:
+                    from ayon_core.pipeline.thumbnails import (
+                        store_generated_thumbnail
                     )
 
-                thumbnail_created = self._create_thumbnail_ffmpeg(
-                    full_input_path, full_output_path
-                )
+                    store_generated_thumbnail(
+                        full_input_path, full_output_path, cache_options
+                    )
 
             # Skip representation and try next one if  wasn't created
             if not thumbnail_created:
@@ -351,8 +357,97 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
                 continue
 
             filtered_repres.append(repre)
+
+        if self.reuse_review_outputs:
+            # Frame of already encoded review is cheaper to decode than
+            #   frame of source, stable sort keeps order of the rest
+            filtered_repres.sort(
+                key=lambda repre: not self._is_reusable_review_output(repre)
+            )
         return filtered_repres
 
+    def _is_review_output(self, repre):
+        return "outputDef" in repre
+
+    def _is_reusable_review_output(self, repre):
+        """Output of ExtractReview without burnins.
+
+        Outputs with burnins fused by ExtractReview don't have "burnin" tag
+        but are marked with "burninsFused".
+        """
+        if not self._is_review_output(repre):
+            return False
+        tags = repre.get("tags") or []
+        return (
+            not repre.get("burnins")
+            and not repre.get("burninsFused")
+            and "burnin" not in tags
+        )
+
+    def _get_thumbnail_cache_options(self, colorspace_data, seek_seconds):
+        """Options affecting the thumbnail used as part of cache key."""
+        options = {
+            "target_size": self.target_size,
+            "background_color": self.background_color,
+            "ffmpeg_args": self.ffmpeg_args,
+            "seek_seconds": seek_seconds,
+        }
+        if colorspace_data:
+            options["colorspace_data"] = colorspace_data
+            options["oiiotool_defaults"] = self.oiiotool_defaults
+            # Changes in OCIO config file invalidate cached thumbnail
+            options["config_file"] = MediaProbeCache.get_file_key(
+                colorspace_data["config"]["path"]
+            )
+        return options
+
+    def _create_thumbnail(
+        self,
+        src_path,
+        dst_path,
+        dst_staging,
+        colorspace_data,
+        oiio_supported,
+        seek_seconds,
+    ):
+        thumbnail_created = False
+        if colorspace_data:
+            oiio_src_path = src_path
+            if seek_seconds is not None:
+                # convert video file to frame so oiio doesn't need to
+                # read video file (it is slow)
+                oiio_src_path = self._create_frame_from_video(
+                    src_path, dst_staging, seek_seconds
+                )
+
+            if oiio_src_path:
+                self.log.debug(
+                    "Trying to convert with OIIO "
+                    "with colorspace data: {}".format(colorspace_data)
+                )
+                # If the input can read by OIIO then use OIIO method for
+                # conversion otherwise use ffmpeg
+                thumbnail_created = self._create_thumbnail_oiio(
+                    oiio_src_path,
+                    dst_path,
+                    colorspace_data
+                )
+
+        # Try to use FFMPEG if OIIO is not supported or for cases when
+        #   oiiotool isn't available or representation is not having
+        #   colorspace data
+        if not thumbnail_created:
+            if oiio_supported:
+                self.log.debug(
+                    "Converting with FFMPEG because input"
+                    " can't be read by OIIO."
+                )
+
+            thumbnail_created = self._create_thumbnail_ffmpeg(
+                src_path, dst_path, seek_seconds
+            )
+        return thumbnail_created
+
     def _create_thumbnail_oiio(
         self,
         src_path,
@@ -424,7 +519,9 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
 
         return True
 
-    def _create_thumbnail_ffmpeg(self, src_path, dst_path):
+    def _create_thumbnail_ffmpeg(
+        self, src_path, dst_path, seek_seconds=None
+    ):
         self.log.debug("Extracting thumbnail with FFMPEG: {}".format(dst_path))
         resolution_arg = self._get_resolution_arg("ffmpeg", src_path)
         ffmpeg_path_args = get_ffmpeg_tool_args("ffmpeg")
@@ -442,6 +539,9 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
         ])
         # use same input args like with mov
         jpeg_items.extend(ffmpeg_args.get("input") or [])
+        # seek on input side so only one frame of video is decoded
+        if seek_seconds is not None:
+            jpeg_items.extend(["-ss", str(seek_seconds)])
         # input file
         jpeg_items.extend(["-i", path_to_subprocess_arg(src_path)])
         # output arguments from presets
@@ -468,7 +568,33 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
             )
             return False
 
-    def _create_frame_from_video(self, video_file_path, output_dir):
+    def _get_video_seek_seconds(self, video_file_path):
+        """Time in video file from which thumbnail is created."""
+        try:
+            video_data = get_ffprobe_data(video_file_path, logger=self.log)
+        except Exception:
+            self.log.warning(
+                "Failed to get duration of {}".format(video_file_path),
+                exc_info=True
+            )
+            return 0.0
+        # Use duration of the individual streams since it is returned with
+        # higher decimal precision than 'format.duration'. We need this
+        # more precise value for calculating the correct amount of frames
+        # for higher FPS ranges or decimal ranges, e.g. 29.97 FPS
+        duration = max(
+            (
+                float(stream.get("duration", 0))
+                for stream in video_data["streams"]
+                if stream.get("codec_type") == "video"
+            ),
+            default=0.0
+        )
+        return duration * self.duration_split
+
+    def _create_frame_from_video(
+        self, video_file_path, output_dir, seek_seconds
+    ):
         """Convert video file to one frame image via ffmpeg"""
         # create output file path
         base_name = os.path.basename(video_file_path)
@@ -476,25 +602,15 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
         output_thumb_file_path = os.path.join(
             output_dir, "{}.png".format(filename))
 
-        # Set video input attributes
+        # Set video input attributes before input so only single frame
+        #   is decoded after fast seek
         max_int = str(2147483647)
-        video_data = get_ffprobe_data(video_file_path, logger=self.log)
-        # Use duration of the individual streams since it is returned with
-        # higher decimal precision than 'format.duration'. We need this
-        # more precise value for calculating the correct amount of frames
-        # for higher FPS ranges or decimal ranges, e.g. 29.97 FPS
-        duration = max(
-            float(stream.get("duration", 0))
-            for stream in video_data["streams"]
-            if stream.get("codec_type") == "video"
-        )
-
         cmd_args = [
             "-y",
-            "-ss", str(duration * self.duration_split),
-            "-i", video_file_path,
             "-analyzeduration", max_int,
             "-probesize", max_int,
+            "-ss", str(seek_seconds),
+            "-i", video_file_path,
             "-vframes", "1"
         ]
 
@@ -34,6 +34,8 @@ class ExtractThumbnailFromSource(pyblish.api.InstancePlugin):
     label = "Extract Thumbnail (from source)"
     # Before 'ExtractThumbnail' in global plugins
     order = pyblish.api.ExtractorOrder - 0.00001
+    # Re-use thumbnails generated from unchanged source files
+    use_thumbnail_cache = True
 
     def process(self, instance):
         self._create_context_thumbnail(instance.context)
@@ -104,6 +106,19 @@ class ExtractThumbnailFromSource(pyblish.api.InstancePlugin):
         dst_filename = os.path.splitext(src_basename)[0] + "_thumb.jpg"
         full_output_path = os.path.join(dst_staging, dst_filename)
 
+        cache_options = {"plugin": self.__class__.__name__}
+        if self.use_thumbnail_cache:
+            # Thumbnails cache cleans up its directory on import
+            from ayon_core.pipeline.thumbnails import copy_generated_thumbnail
+
+            if copy_generated_thumbnail(
+                thumbnail_source, full_output_path, cache_options
+            ):
+                self.log.debug(
+                    "Using cached thumbnail of {}".format(thumbnail_source)
+                )
+                return full_output_path
+
         if oiio_supported:
             self.log.debug("Trying to convert with OIIO")
             # If the input can read by OIIO then use OIIO method for
@@ -127,6 +142,14 @@ class ExtractThumbnailFromSource(pyblish.api.InstancePlugin):
 
         # Skip representation and try next one if  wasn't created
         if thumbnail_created:
+            if self.use_thumbnail_cache:
+                from ayon_core.pipeline.thumbnails import (
+                    store_generated_thumbnail
+                )
+
+                store_generated_thumbnail(
+                    thumbnail_source, full_output_path, cache_options
+                )
             return full_output_path
 
         self.log.warning("Thumbnail has not been created.")
@@ -664,17 +664,11 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             if not is_sequence_representation:
                 files = [files]
 
-            repre_context = None
-            transfers = []
-            for src_file_name in files:
-                template_data["originalBasename"], _ = os.path.splitext(
-                    src_file_name)
-
-                dst = path_template_obj.format_strict(template_data)
-                src = os.path.join(stagingdir, src_file_name)
-                transfers.append((src, dst))
-                if repre_context is None:
-                    repre_context = dst.used_values
+            transfers, repre_context = (
+                self._prepare_original_basename_transfers(
+                    path_template_obj, template_data, stagingdir, files
+                )
+            )
 
             if not is_udim and first_index_padded is not None:
                 repre_context["frame"] = first_index_padded
@@ -721,22 +715,15 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             )
 
             # Construct destination collection from template
-            repre_context = None
-            dst_filepaths = []
-            for index in destination_indexes:
-                if is_udim:
-                    template_data["udim"] = index
-                else:
-                    template_data["frame"] = index
-                template_filled = path_template_obj.format_strict(
-                    template_data
+            dst_collection, repre_context = (
+                self._format_destination_collection(
+                    path_template_obj,
+                    template_data,
+                    destination_indexes,
+                    destination_padding,
+                    is_udim
                 )
-                dst_filepaths.append(template_filled)
-                if repre_context is None:
-                    self.log.debug(
-                        "Template filled: {}".format(str(template_filled))
-                    )
-                    repre_context = template_filled.used_values
+            )
 
             # Make sure context contains frame
             # NOTE: Frame would not be available only if template does not
@@ -749,9 +736,6 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             if instance.data.get("renderlayer"):
                 repre_context["renderlayer"] = instance.data["renderlayer"]
 
-            # Update the destination indexes and padding
-            dst_collection = clique.assemble(dst_filepaths)[0][0]
-            dst_collection.padding = destination_padding
             if len(src_collection.indexes) != len(dst_collection.indexes):
                 raise KnownPublishError((
                     "This is a bug. Source sequence frames length"
@@ -759,10 +743,10 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
                 ))
 
             # Multiple file transfers
-            transfers = []
-            for src_file_name, dst in zip(src_collection, dst_collection):
-                src = os.path.join(stagingdir, src_file_name)
-                transfers.append((src, dst))
+            transfers = [
+                (os.path.join(stagingdir, src_file_name), dst)
+                for src_file_name, dst in zip(src_collection, dst_collection)
+            ]
 
         else:
             # Single file
@@ -847,6 +831,122 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             "published_files": [transfer[1] for transfer in transfers]
         }
 
+    def _prepare_original_basename_transfers(
+        self, path_template_obj, template_data, stagingdir, files
+    ):
+        """Prepare transfers for template using 'originalBasename'.
+
+        The template is formatted only once with a placeholder instead of
+        the original basename and destinations are created by replacing
+        the placeholder. Each file is formatted separately only if the
+        placeholder can't be found in the filled template.
+
+        Args:
+            path_template_obj (StringTemplate): Publish path template.
+            template_data (dict[str, Any]): Data used to fill the template.
+            stagingdir (str): Directory with source files.
+            files (list[str]): Source filenames.
+
+        Returns:
+            tuple[list[tuple[str, str]], dict[str, Any]]: Transfers and
+                representation context.
+
+        """
+        basenames = [
+            os.path.splitext(src_file_name)[0]
+            for src_file_name in files
+        ]
+        placeholder = "__originalBasename_{}__".format(create_entity_id())
+        template_filled = None
+        if len(files) > 1:
+            template_data["originalBasename"] = placeholder
+            template_filled = path_template_obj.format_strict(template_data)
+
+        if template_filled is not None and placeholder in template_filled:
+            repre_context = template_filled.used_values
+            repre_context["originalBasename"] = basenames[0]
+            template_data["originalBasename"] = basenames[-1]
+            transfers = [
+                (
+                    os.path.join(stagingdir, src_file_name),
+                    template_filled.replace(placeholder, basename)
+                )
+                for src_file_name, basename in zip(files, basenames)
+            ]
+            return transfers, repre_context
+
+        repre_context = None
+        transfers = []
+        for src_file_name, basename in zip(files, basenames):
+            template_data["originalBasename"] = basename
+            dst = path_template_obj.format_strict(template_data)
+            src = os.path.join(stagingdir, src_file_name)
+            transfers.append((src, dst))
+            if repre_context is None:
+                repre_context = dst.used_values
+        return transfers, repre_context
+
+    def _format_destination_collection(
+        self, path_template_obj, template_data, indexes, padding, is_udim
+    ):
+        """Create destination collection of sequence representation.
+
+        Template is formatted only for first and last index. Head and tail
+        of the destination collection are taken from the filled paths and
+        all destination paths are created from the collection without
+        formatting the template for each index. Template is formatted for
+        each index only if frame can't be detected in filled paths, e.g.
+        when frame is used in multiple places of the template.
+
+        Args:
+            path_template_obj (StringTemplate): Publish path template.
+            template_data (dict[str, Any]): Data used to fill the template.
+            indexes (list[int]): Destination frame or udim indexes.
+            padding (int): Destination padding.
+            is_udim (bool): Indexes are udims.
+
+        Returns:
+            tuple[clique.Collection, dict[str, Any]]: Destination collection
+                and representation context.
+
+        """
+        index_key = "udim" if is_udim else "frame"
+        filled_paths = []
+        for index in (indexes[0], indexes[-1]):
+            template_data[index_key] = index
+            filled_paths.append(
+                path_template_obj.format_strict(template_data)
+            )
+        self.log.debug("Template filled: {}".format(str(filled_paths[0])))
+        repre_context = filled_paths[0].used_values
+
+        collections, _ = clique.assemble(filled_paths)
+        if len(indexes) > 1 and len(collections) == 1:
+            collection = collections[0]
+            return (
+                clique.Collection(
+                    collection.head,
+                    collection.tail,
+                    padding,
+                    indexes=set(indexes)
+                ),
+                repre_context
+            )
+
+        self.log.debug(
+            "Couldn't detect frame in filled template,"
+            " formatting template for each index."
+        )
+        dst_filepaths = []
+        for index in indexes:
+            template_data[index_key] = index
+            dst_filepaths.append(
+                path_template_obj.format_strict(template_data)
+            )
+        dst_collection = clique.assemble(dst_filepaths)[0][0]
+        dst_collection.padding = padding
+        return dst_collection, repre_context
+
     def create_version_data(self, instance):
         """Create the data dictionary for the version
 
@@ -2,6 +2,7 @@ import os
 import copy
 import errno
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import clique
 import pyblish.api
@@ -90,6 +91,8 @@ class IntegrateHeroVersion(
     # *but all other plugins must be successfully completed
 
     use_hardlinks = False
+    # Number of threads used to link or copy files (0 means automatic)
+    transfer_workers = 0
 
     def process(self, instance):
         if not self.is_active(instance.data):
@@ -414,12 +417,9 @@ class IntegrateHeroVersion(
 
             # Copy(hardlink) paths of source and destination files
             # TODO should we *only* create hardlinks?
-            # TODO should we keep files for deletion until this is successful?
-            for src_path, dst_path in src_to_dst_file_paths:
-                self.copy_file(src_path, dst_path)
-
-            for src_path, dst_path in other_file_paths_mapping:
-                self.copy_file(src_path, dst_path)
+            self.transfer_files(
+                src_to_dst_file_paths + other_file_paths_mapping
+            )
 
             # Update prepared representation etity data with files
             #   and integrate it to server.
@@ -608,10 +608,38 @@ class IntegrateHeroVersion(
             ).format(path))
         return path
 
-    def copy_file(self, src_path, dst_path):
-        # TODO check drives if are the same to check if cas hardlink
-        dirname = os.path.dirname(dst_path)
+    def transfer_files(self, src_to_dst_file_paths):
+        """Transfer files to hero publish directory.
+
+        Destination folders are created first, then files are linked or
+        copied in parallel.
 
+        Args:
+            src_to_dst_file_paths (list[tuple[str, str]]): Source and
+                destination file paths.
+
+        """
+        transfers = []
+        dirnames = set()
+        for src_path, dst_path in src_to_dst_file_paths:
+            src_path = os.path.normpath(src_path)
+            dst_path = os.path.normpath(str(dst_path))
+            transfers.append((src_path, dst_path))
+            dirnames.add(os.path.dirname(dst_path))
+
+        for dirname in dirnames:
+            self._create_folder(dirname)
+
+        max_workers = self.transfer_workers or None
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._copy_file, *transfer)
+                for transfer in transfers
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+    def _create_folder(self, dirname):
         try:
             os.makedirs(dirname)
             self.log.debug("Folder(s) created: \"{}\"".format(dirname))
@@ -622,6 +650,8 @@ class IntegrateHeroVersion(
 
             self.log.debug("Folder already exists: \"{}\"".format(dirname))
 
+    def _copy_file(self, src_path, dst_path):
+        # TODO check drives if are the same to check if cas hardlink
         if self.use_hardlinks:
             # First try hardlink and copy if paths are cross drive
             self.log.debug("Hardlinking file \"{}\" to \"{}\"".format(
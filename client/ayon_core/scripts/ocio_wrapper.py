@@ -5,12 +5,14 @@ that don't have access to OpenColorIO or their version of OpenColorIO is
 not compatible.
 """
 
+import sys
 import json
 from pathlib import Path
 
 import click
 
 from ayon_core.pipeline.colorspace import (
+    OCIO_WORKER_RESPONSE_PREFIX,
     has_compatible_ocio_package,
     get_display_view_colorspace_name,
     get_config_file_rules_colorspace_from_filepath,
@@ -211,6 +213,62 @@ def _get_display_view_colorspace_name(
     )
 
 
+# Functions available to 'serve' command
+_SERVE_METHODS = {
+    "get_ocio_config_colorspaces": get_ocio_config_colorspaces,
+    "get_ocio_config_views": get_ocio_config_views,
+    "get_config_version_data": get_config_version_data,
+    "get_config_file_rules_colorspace_from_filepath": (
+        get_config_file_rules_colorspace_from_filepath
+    ),
+    "get_display_view_colorspace_name": get_display_view_colorspace_name,
+}
+
+
+@main.command(
+    name="serve",
+    help="Answer queries received as JSON lines on stdin")
+def _serve():
+    """Answer queries until stdin is closed.
+
+    Wrapper command for processes without access to OpenColorIO which
+    need to send multiple queries. Loaded configs are kept in memory
+    between queries.
+
+    Each request is a JSON line with "id", "method" and "params" keys.
+    Response is a JSON line with "id" and "result" or "error" keys,
+    prefixed with 'OCIO_WORKER_RESPONSE_PREFIX'. Method "shutdown" stops
+    the process.
+
+    Example of use:
+    > pyton.exe ./ocio_wrapper.py serve
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError:
+            continue
+
+        method = request.get("method")
+        if method == "shutdown":
+            break
+
+        response = {"id": request.get("id")}
+        try:
+            func = _SERVE_METHODS[method]
+            response["result"] = func(**(request.get("params") or {}))
+        except Exception as exc:
+            response["error"] = "{}: {}".format(exc.__class__.__name__, exc)
+
+        sys.stdout.write(
+            OCIO_WORKER_RESPONSE_PREFIX + json.dumps(response) + "\n"
+        )
+        sys.stdout.flush()
+
+
 if __name__ == "__main__":
     if not has_compatible_ocio_package():
         raise RuntimeError("OpenColorIO is not available.")
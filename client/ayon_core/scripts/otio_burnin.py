@@ -1,9 +1,11 @@
 import os
 import sys
+import copy
 import subprocess
 import platform
 import json
 import tempfile
+from fractions import Fraction
 from string import Formatter
 
 import opentimelineio_contrib.adapters.ffmpeg_burnins as ffmpeg_burnins
@@ -12,6 +14,7 @@ from ayon_core.lib import (
     get_ffmpeg_codec_args,
     get_ffmpeg_format_args,
     convert_ffprobe_fps_value,
+    get_media_probe_cache,
 )
 
 FFMPEG_EXE_COMMAND = subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
@@ -47,8 +50,14 @@ def _get_ffprobe_data(source):
         "-print_format", "json",
         "-show_format",
         "-show_streams",
-        source
     )
+    probe_cache = get_media_probe_cache()
+    output = probe_cache.get(source, command)
+    if output is not None:
+        return json.loads(output)
+
+    probe_args = list(command)
+    command.append(source)
     kwargs = {
         "stdout": subprocess.PIPE,
     }
@@ -62,6 +71,7 @@ def _get_ffprobe_data(source):
     out = proc.communicate()[0]
     if proc.returncode != 0:
         raise RuntimeError("Failed to run: %s" % command)
+    probe_cache.set(source, probe_args, out.decode("utf-8"))
     return json.loads(out)
 
 
@@ -138,6 +148,8 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
 
         super().__init__(source, source_streams)
 
+        # Copy class options so they're not shared across objects
+        self.options_init = copy.deepcopy(self.options_init)
         if options_init:
             self.options_init.update(options_init)
 
@@ -340,6 +352,18 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
         ))
         self.add_text(text_for_size, align, frame_start, frame_end, options)
 
+    def get_filters(self):
+        """Video filters drawing burnins.
+
+        Filters can be used in other ffmpeg command so burnins are rendered
+        during encoding of the source. Temporary files in 'cleanup_paths'
+        must exist until the command finishes.
+
+        Returns:
+            list[str]: Video filters.
+        """
+        return list(self.filters["drawtext"])
+
     def _get_current_frame_expression(self, frame_start, frame_end):
         if frame_start is None:
             return None
@@ -588,72 +612,24 @@ def prepare_fill_values(burnin_template, data):
     return fill_values, listed_keys, missing_keys
 
 
-def burnins_from_data(
-    input_path, output_path, data,
-    codec_data=None, options=None, burnin_values=None, overwrite=True,
-    full_input_path=None, first_frame=None, source_ffmpeg_cmd=None
+def prepare_burnins(
+    input_path, data, options=None, burnin_values=None, ffprobe_data=None,
+    first_frame=None
 ):
-    """This method adds burnins to video/image file based on presets setting.
-
-    Extension of output MUST be same as input. (mov -> mov, avi -> avi,...)
+    """Prepare burnins object with filters for burnin values.
 
     Args:
         input_path (str): Full path to input file where burnins should be add.
-        output_path (str): Full path to output file where output will be
-            rendered.
-        data (dict): Data required for burnin settings (more info below).
-        codec_data (list): All codec related arguments in list.
+        data (dict): Data required for burnin settings. Data are modified.
         options (dict): Options for burnins.
         burnin_values (dict): Contain positioned values.
-        overwrite (bool): Output will be overwritten if already exists,
-            True by default.
-
-    Presets must be set separately. Should be dict with 2 keys:
-    - "options" - sets look of burnins - colors, opacity,...
-        (more info: ModifiedBurnins doc)
-                - *OPTIONAL* default values are used when not included
-    - "burnins" - contains dictionary with burnins settings
-                - *OPTIONAL* burnins won't be added (easier is not to use this)
-        - each key of "burnins" represents Alignment,
-        there are 6 possibilities:
-            TOP_LEFT        TOP_CENTERED        TOP_RIGHT
-            BOTTOM_LEFT     BOTTOM_CENTERED     BOTTOM_RIGHT
-        - value must be string with text you want to burn-in
-        - text may contain specific formatting keys (exmplained below)
-
-    Requirement of *data* keys is based on presets.
-    - "frame_start" - is required when "timecode" or "current_frame" ins keys
-    - "frame_start_tc" - when "timecode" should start with different frame
-    - *keys for static text*
-
-    EXAMPLE:
-    preset = {
-        "options": {*OPTIONS FOR LOOK*},
-        "burnins": {
-            "TOP_LEFT": "static_text",
-            "TOP_RIGHT": "{shot}",
-            "BOTTOM_LEFT": "TC: {timecode}",
-            "BOTTOM_RIGHT": "{frame_start}{current_frame}"
-        }
-    }
+        ffprobe_data (Optional[dict]): Ffprobe data of input. Input is
+            probed if not passed.
+        first_frame (Optional[int]): First frame of input sequence.
 
-    For this preset we'll need at least this data:
-    data = {
-        "frame_start": 1001,
-        "shot": "sh0010"
-    }
-
-    When Timecode should start from 1 then data need:
-    data = {
-        "frame_start": 1001,
-        "frame_start_tc": 1,
-        "shot": "sh0010"
-    }
+    Returns:
+        ModifiedBurnins: Burnins object with prepared filters.
     """
-    ffprobe_data = None
-    if full_input_path:
-        ffprobe_data = _get_ffprobe_data(full_input_path)
-
     burnin = ModifiedBurnins(input_path, ffprobe_data, options, first_frame)
 
     frame_start = data.get("frame_start")
@@ -703,7 +679,6 @@ def burnins_from_data(
     if source_timecode is not None:
         data[SOURCE_TIMECODE_KEY[1:-1]] = SOURCE_TIMECODE_KEY
 
-    clean_up_paths = []
     for align_text, value in burnin_values.items():
         if not value:
             continue
@@ -789,6 +764,119 @@ def burnins_from_data(
 
         burnin.add_text(text, align, frame_start, frame_end)
 
+    return burnin
+
+
+def get_burnin_filters(
+    data, burnin_values, width, height, fps, options=None
+):
+    """Build ffmpeg video filters drawing burnins.
+
+    Filters can be added to ffmpeg command which renders output of the
+    resolution, so burnins don't require another encoding of the output.
+
+    Input file is not probed, so source timecode ('{source_timecode}') is
+    not available in burnin values.
+
+    Args:
+        data (dict): Data required for burnin settings.
+        burnin_values (dict): Contain positioned values.
+        width (int): Width of rendered output.
+        height (int): Height of rendered output.
+        fps (float): Frame rate of rendered output.
+        options (Optional[dict]): Options for burnins.
+
+    Returns:
+        tuple[list[str], list[str]]: Video filters and paths to temporary
+            files used by filters. The files should be removed after render.
+    """
+    frame_rate = Fraction(str(fps)).limit_denominator(1001)
+    ffprobe_data = {
+        "streams": [{
+            "codec_type": "video",
+            "width": width,
+            "height": height,
+            "r_frame_rate": "{}/{}".format(
+                frame_rate.numerator, frame_rate.denominator
+            ),
+        }]
+    }
+    burnin = prepare_burnins(
+        "", copy.deepcopy(data), options, burnin_values, ffprobe_data
+    )
+    return burnin.get_filters(), list(burnin.cleanup_paths)
+
+
+def burnins_from_data(
+    input_path, output_path, data,
+    codec_data=None, options=None, burnin_values=None, overwrite=True,
+    full_input_path=None, first_frame=None, source_ffmpeg_cmd=None
+):
+    """This method adds burnins to video/image file based on presets setting.
+
+    Extension of output MUST be same as input. (mov -> mov, avi -> avi,...)
+
+    Args:
+        input_path (str): Full path to input file where burnins should be add.
+        output_path (str): Full path to output file where output will be
+            rendered.
+        data (dict): Data required for burnin settings (more info below).
+        codec_data (list): All codec related arguments in list.
+        options (dict): Options for burnins.
+        burnin_values (dict): Contain positioned values.
+        overwrite (bool): Output will be overwritten if already exists,
+            True by default.
+
+    Presets must be set separately. Should be dict with 2 keys:
+    - "options" - sets look of burnins - colors, opacity,...
+        (more info: ModifiedBurnins doc)
+                - *OPTIONAL* default values are used when not included
+    - "burnins" - contains dictionary with burnins settings
+                - *OPTIONAL* burnins won't be added (easier is not to use this)
+        - each key of "burnins" represents Alignment,
+        there are 6 possibilities:
+            TOP_LEFT        TOP_CENTERED        TOP_RIGHT
+            BOTTOM_LEFT     BOTTOM_CENTERED     BOTTOM_RIGHT
+        - value must be string with text you want to burn-in
+        - text may contain specific formatting keys (exmplained below)
+
+    Requirement of *data* keys is based on presets.
+    - "frame_start" - is required when "timecode" or "current_frame" ins keys
+    - "frame_start_tc" - when "timecode" should start with different frame
+    - *keys for static text*
+
+    EXAMPLE:
+    preset = {
+        "options": {*OPTIONS FOR LOOK*},
+        "burnins": {
+            "TOP_LEFT": "static_text",
+            "TOP_RIGHT": "{shot}",
+            "BOTTOM_LEFT": "TC: {timecode}",
+            "BOTTOM_RIGHT": "{frame_start}{current_frame}"
+        }
+    }
+
+    For this preset we'll need at least this data:
+    data = {
+        "frame_start": 1001,
+        "shot": "sh0010"
+    }
+
+    When Timecode should start from 1 then data need:
+    data = {
+        "frame_start": 1001,
+        "frame_start_tc": 1,
+        "shot": "sh0010"
+    }
+    """
+    ffprobe_data = None
+    if full_input_path:
+        ffprobe_data = _get_ffprobe_data(full_input_path)
+
+    burnin = prepare_burnins(
+        input_path, data, options, burnin_values, ffprobe_data, first_frame
+    )
+
     ffmpeg_args = []
     if codec_data:
         # Use codec definition from method arguments
@@ -818,8 +906,6 @@ def burnins_from_data(
     burnin.render(
         output_path, args=ffmpeg_args_str, overwrite=overwrite, **data
     )
-    for path in clean_up_paths:
-        os.remove(path)
 
 
 if __name__ == "__main__":
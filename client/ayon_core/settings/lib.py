@@ -79,14 +79,17 @@ class _AyonSettingsCache:
     def get_value_by_project(cls, project_name):
         cache_item = _AyonSettingsCache.cache_by_project_name[project_name]
         if cache_item.is_outdated:
-            if cls._use_bundles():
-                value = ayon_api.get_addons_settings(
-                    bundle_name=cls._get_bundle_name(),
-                    project_name=project_name,
-                    variant=cls._get_variant()
-                )
-            else:
-                value = ayon_api.get_addons_settings(project_name)
+            from ayon_core.lib import profile_phase
+
+            with profile_phase("settings_fetch"):
+                if cls._use_bundles():
+                    value = ayon_api.get_addons_settings(
+                        bundle_name=cls._get_bundle_name(),
+                        project_name=project_name,
+                        variant=cls._get_variant()
+                    )
+                else:
+                    value = ayon_api.get_addons_settings(project_name)
             cache_item.update_value(value)
         return cache_item.get_value()
 
@@ -0,0 +1,42 @@
+import textwrap
+
+from ayon_core.lib.python_module_tools import import_filepath_cached
+
+PLUGIN_SOURCE = textwrap.dedent('''
+    class Plugin:
+        families = ["review"]
+        hosts = families
+        profiles = {"default": ["review"]}
+        label = "Plugin"
+
+        @classmethod
+        def apply_settings(cls):
+            cls.families.append("render")
+            cls.profiles["default"].append("render")
+            cls.profiles["other"] = []
+            cls.label = "Changed"
+            cls.optional = True
+''')
+
+
+def test_reused_module_restores_class_attributes(tmp_path):
+    filepath = tmp_path / "plugin.py"
+    filepath.write_text(PLUGIN_SOURCE)
+
+    module = import_filepath_cached(str(filepath))
+    module.Plugin.apply_settings()
+
+    reused_module = import_filepath_cached(str(filepath))
+    assert reused_module is module
+    plugin = reused_module.Plugin
+    assert plugin.families == ["review"]
+    assert plugin.hosts is plugin.families
+    assert plugin.profiles == {"default": ["review"]}
+    assert plugin.label == "Plugin"
+    assert not hasattr(plugin, "optional")
+
+    # Changes of restored values don't affect next restore
+    plugin.apply_settings()
+    plugin = import_filepath_cached(str(filepath)).Plugin
+    assert plugin.families == ["review"]
+    assert plugin.profiles == {"default": ["review"]}
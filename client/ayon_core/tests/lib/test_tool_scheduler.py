@@ -0,0 +1,199 @@
+import os
+import time
+import threading
+
+import pytest
+
+from ayon_core.lib import tool_scheduler
+from ayon_core.lib.tool_scheduler import (
+    ToolScheduler,
+    get_tool_name_from_args,
+)
+
+# Seconds to wait for a thread state
+TIMEOUT = 5
+
+
+class _Process:
+    """Thread holding scheduler slot until it is released."""
+
+    def __init__(self, scheduler, tool_name, priority=0, started=None):
+        self.started = threading.Event()
+        self._release = threading.Event()
+        self._started_order = started
+        self._scheduler = scheduler
+        self._tool_name = tool_name
+        self._priority = priority
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        with self._scheduler.acquire(self._tool_name, self._priority):
+            if self._started_order is not None:
+                self._started_order.append(self._priority)
+            self.started.set()
+            self._release.wait(TIMEOUT)
+
+    def release(self):
+        self._release.set()
+        self._thread.join(TIMEOUT)
+
+
+def _wait_for(func):
+    end = time.monotonic() + TIMEOUT
+    while not func():
+        if time.monotonic() > end:
+            raise AssertionError("Condition was not met in time")
+        time.sleep(0.01)
+
+
+def _waiting_count(scheduler, tool_name):
+    return scheduler.get_stats().get(tool_name, {}).get("waiting", 0)
+
+
+@pytest.fixture
+def scheduler_factory():
+    processes = []
+
+    def factory(*args, **kwargs):
+        scheduler = ToolScheduler(*args, **kwargs)
+        scheduler.poll_interval = 0.01
+
+        def start(tool_name, priority=0, started=None):
+            process = _Process(scheduler, tool_name, priority, started)
+            processes.append(process)
+            return process
+
+        scheduler.start = start
+        return scheduler
+
+    yield factory
+    for process in processes:
+        process.release()
+
+
+def test_max_processes(scheduler_factory):
+    scheduler = scheduler_factory(max_processes=2)
+    first = scheduler.start("ffmpeg")
+    second = scheduler.start("oiiotool")
+    assert first.started.wait(TIMEOUT)
+    assert second.started.wait(TIMEOUT)
+
+    third = scheduler.start("ffmpeg")
+    _wait_for(lambda: _waiting_count(scheduler, "ffmpeg") == 1)
+    assert not third.started.is_set()
+
+    second.release()
+    assert third.started.wait(TIMEOUT)
+    stats = scheduler.get_stats()
+    assert stats["ffmpeg"]["max_concurrent"] == 2
+    assert stats["oiiotool"]["processes"] == 1
+
+
+def test_tool_limits(scheduler_factory):
+    scheduler = scheduler_factory(max_processes=4, tool_limits={"ffmpeg": 1})
+    assert scheduler.get_limit("ffmpeg") == 1
+    assert scheduler.get_limit("oiiotool") == 4
+
+    first = scheduler.start("ffmpeg")
+    assert first.started.wait(TIMEOUT)
+    second = scheduler.start("ffmpeg")
+    _wait_for(lambda: _waiting_count(scheduler, "ffmpeg") == 1)
+
+    # Other tool is not limited by waiting process
+    other = scheduler.start("oiiotool")
+    assert other.started.wait(TIMEOUT)
+    assert not second.started.is_set()
+
+    first.release()
+    assert second.started.wait(TIMEOUT)
+
+
+def test_configure(scheduler_factory):
+    scheduler = scheduler_factory(max_processes=2, tool_limits={"ffmpeg": 1})
+    # Values which are not passed are not changed
+    scheduler.configure(min_free_memory_mb=100)
+    assert scheduler.get_max_processes() == 2
+    assert scheduler.get_limit("ffmpeg") == 1
+
+    # Zero uses number of CPU cores, empty limits remove tool limits
+    scheduler.configure(max_processes=0, tool_limits={})
+    assert scheduler.get_max_processes() == (os.cpu_count() or 1)
+    assert scheduler.get_limit("ffmpeg") == scheduler.get_max_processes()
+
+
+def test_priority_order(scheduler_factory):
+    scheduler = scheduler_factory(max_processes=1)
+    started = []
+    first = scheduler.start("ffmpeg", started=started)
+    assert first.started.wait(TIMEOUT)
+
+    low = scheduler.start("ffmpeg", priority=0, started=started)
+    _wait_for(lambda: _waiting_count(scheduler, "ffmpeg") == 1)
+    high = scheduler.start("ffmpeg", priority=10, started=started)
+    _wait_for(lambda: _waiting_count(scheduler, "ffmpeg") == 2)
+
+    first.release()
+    assert high.started.wait(TIMEOUT)
+    assert not low.started.is_set()
+    high.release()
+    assert low.started.wait(TIMEOUT)
+    assert started == [0, 10, 0]
+
+
+@pytest.mark.parametrize(
+    "kwargs,patched_func,value",
+    [
+        ({"min_free_memory_mb": 1024}, "_get_available_memory_mb", 1),
+        ({"max_load_factor": 1.0}, "_get_load_factor", 100.0),
+    ]
+)
+def test_always_start_if_nothing_is_running(
+    monkeypatch, scheduler_factory, kwargs, patched_func, value
+):
+    monkeypatch.setattr(tool_scheduler, patched_func, lambda: value)
+    scheduler = scheduler_factory(max_processes=4, **kwargs)
+
+    # System resources are exhausted but nothing is running
+    first = scheduler.start("ffmpeg")
+    assert first.started.wait(TIMEOUT)
+
+    second = scheduler.start("ffmpeg")
+    _wait_for(lambda: _waiting_count(scheduler, "ffmpeg") == 1)
+    assert not second.started.is_set()
+
+    first.release()
+    assert second.started.wait(TIMEOUT)
+
+
+def test_failed_process_stats():
+    scheduler = ToolScheduler(max_processes=1)
+    with pytest.raises(RuntimeError):
+        with scheduler.acquire("ffmpeg"):
+            raise RuntimeError("Failed")
+
+    with scheduler.acquire("ffmpeg") as slot:
+        slot["failed"] = True
+
+    with scheduler.acquire("ffmpeg"):
+        assert scheduler.get_stats()["ffmpeg"]["running"] == 1
+
+    stats = scheduler.get_stats()["ffmpeg"]
+    assert stats["processes"] == 3
+    assert stats["failed"] == 2
+    assert stats["running"] == 0
+
+
+@pytest.mark.parametrize(
+    "args,expected",
+    [
+        (["ffmpeg", "-i", "input.mov"], "ffmpeg"),
+        (["/usr/bin/oiiotool", "input.exr"], "oiiotool"),
+        (["/opt/tools/FFMPEG.exe", "-version"], "ffmpeg"),
+        ("\"/opt/ffmpeg\" -i input.mov", "ffmpeg"),
+        (["python", "ffmpeg"], None),
+        ([], None),
+    ]
+)
+def test_get_tool_name_from_args(args, expected):
+    assert get_tool_name_from_args(args) == expected
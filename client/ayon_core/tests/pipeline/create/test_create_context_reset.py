@@ -0,0 +1,308 @@
+"""Incremental reset of CreateContext.
+
+Creators are loaded from temporary plugin directory and store instances
+in module level 'SCENE' instead of a workfile. Creator calls are logged
+to 'CALLS'. Server and settings queries are replaced by static data.
+"""
+import os
+import textwrap
+
+import pytest
+
+from ayon_core.pipeline.create import (
+    CreateContext,
+    creator_plugins,
+    register_creator_plugin_path,
+    deregister_creator_plugin_path,
+)
+from ayon_core.pipeline.create import context as context_module
+
+CREATORS_SOURCE = textwrap.dedent('''
+    from ayon_core.pipeline.create import (
+        Creator,
+        AutoCreator,
+        CreatedInstance,
+    )
+
+    SCENE = {"changing": [], "static": [], "unknown": [], "auto": []}
+    CALLS = []
+
+
+    class _Base:
+        def collect_instances(self):
+            CALLS.append(self.identifier)
+            for data in SCENE[self.identifier]:
+                self._add_instance_to_context(
+                    CreatedInstance.from_existing(dict(data), self)
+                )
+
+        def update_instances(self, update_list):
+            for item in update_list:
+                for data in SCENE[self.identifier]:
+                    if data["instance_id"] == item.instance.id:
+                        data.update(item.instance.data_to_store())
+
+        def remove_instances(self, instances):
+            ids = {instance.id for instance in instances}
+            SCENE[self.identifier][:] = [
+                data
+                for data in SCENE[self.identifier]
+                if data["instance_id"] not in ids
+            ]
+            for instance in instances:
+                self._remove_instance_from_context(instance)
+
+
+    class _BaseCreator(_Base, Creator):
+        product_type = "test"
+
+        def create(self, product_name, data, pre_create_data):
+            instance = CreatedInstance(
+                self.product_type, product_name, data, self
+            )
+            SCENE[self.identifier].append(instance.data_to_store())
+            self._add_instance_to_context(instance)
+            return instance
+
+
+    class ChangingCreator(_BaseCreator):
+        """Collection state follows the scene."""
+        identifier = "changing"
+        label = "Changing"
+
+        def get_collection_state(self):
+            return repr(SCENE[self.identifier])
+
+
+    class StaticCreator(_BaseCreator):
+        """Collection state never changes, only dirty marking collects."""
+        identifier = "static"
+        label = "Static"
+
+        def get_collection_state(self):
+            return "static"
+
+
+    class UnknownCreator(_BaseCreator):
+        """Collection state is not known, always collects."""
+        identifier = "unknown"
+        label = "Unknown"
+
+
+    class Auto(_Base, AutoCreator):
+        identifier = "auto"
+        product_type = "workfile"
+
+        def get_collection_state(self):
+            return repr(SCENE[self.identifier])
+
+        def create(self):
+            CALLS.append("create:auto")
+            if not SCENE["auto"]:
+                instance = CreatedInstance(
+                    "workfile",
+                    "workfileMain",
+                    {"folderPath": "/folder", "task": "task"},
+                    self
+                )
+                SCENE["auto"].append(instance.data_to_store())
+                self._add_instance_to_context(instance)
+''')
+
+
+class Host:
+    name = "test"
+
+    def __init__(self):
+        self.context_data = {}
+
+    def get_context_data(self):
+        return dict(self.context_data)
+
+    def update_context_data(self, data, changes):
+        self.context_data = data
+
+    def get_context_title(self):
+        return "test"
+
+    def get_current_context(self):
+        return {
+            "project_name": "project",
+            "folder_path": "/folder",
+            "task_name": "task",
+        }
+
+
+@pytest.fixture
+def plugin_path(tmp_path):
+    path = str(tmp_path)
+    with open(os.path.join(path, "create_test.py"), "w") as stream:
+        stream.write(CREATORS_SOURCE)
+    register_creator_plugin_path(path)
+    yield path
+    deregister_creator_plugin_path(path)
+
+
+@pytest.fixture
+def create_context(monkeypatch, plugin_path):
+    monkeypatch.setenv("AYON_HOST_NAME", "test")
+    for module in (creator_plugins, context_module):
+        monkeypatch.setattr(
+            module, "get_project_settings", lambda *args, **kwargs: {}
+        )
+    monkeypatch.setattr(
+        context_module,
+        "is_func_signature_supported",
+        lambda *args, **kwargs: False
+    )
+    monkeypatch.setattr(
+        CreateContext,
+        "get_current_project_entity",
+        lambda self: {"name": "project"}
+    )
+    monkeypatch.setattr(
+        CreateContext,
+        "get_instances_context_info",
+        lambda self, instances=None: {}
+    )
+    monkeypatch.setattr(
+        creator_plugins.BaseCreator,
+        "get_product_name",
+        lambda self, *args, **kwargs: self.product_type + "Main"
+    )
+    context = CreateContext(Host(), discover_publish_plugins=False)
+    _get_calls(context).clear()
+    return context
+
+
+def _get_module_globals(context):
+    # Module is loaded from plugin path and is not in 'sys.modules'
+    creator = context.creators["changing"]
+    return type(creator).create.__globals__
+
+
+def _get_calls(context):
+    return _get_module_globals(context)["CALLS"]
+
+
+def _get_scene(context):
+    return _get_module_globals(context)["SCENE"]
+
+
+def _create(context, identifier):
+    return context.create(
+        identifier,
+        "Main",
+        folder_entity={"path": "/folder", "id": "folder_id"},
+        task_entity={"name": "task"},
+    )
+
+
+def _reset(context, incremental=True):
+    calls = _get_calls(context)
+    calls.clear()
+    context.reset(discover_publish_plugins=False, incremental=incremental)
+    calls = _get_calls(context)
+    output = set(calls)
+    calls.clear()
+    return output
+
+
+def test_initial_reset_collects_all(create_context):
+    assert _reset(create_context, incremental=False) == {
+        "changing", "static", "unknown", "auto", "create:auto"
+    }
+    assert [
+        instance.creator_identifier
+        for instance in create_context.instances
+    ] == ["auto"]
+
+
+def test_unchanged_creators_are_not_collected(create_context):
+    _create(create_context, "changing")
+    _create(create_context, "static")
+    _reset(create_context)
+    instances_by_id = dict(create_context.instances_by_id)
+
+    # Only creator without collection state is collected
+    assert _reset(create_context) == {"unknown"}
+    # Instances of not collected creators are kept
+    assert set(create_context.instances_by_id) == set(instances_by_id)
+    for instance_id, instance in instances_by_id.items():
+        assert create_context.instances_by_id[instance_id] is instance
+
+
+def test_changed_collection_state(create_context):
+    _create(create_context, "changing")
+    _reset(create_context)
+
+    # Instance added to scene outside of create context
+    scene = _get_scene(create_context)
+    scene["changing"].append(
+        dict(scene["changing"][0], instance_id="other", variant="Other")
+    )
+    assert _reset(create_context) == {"changing", "unknown"}
+    assert "other" in create_context.instances_by_id
+
+
+def test_dirty_after_create(create_context):
+    _reset(create_context)
+    _create(create_context, "static")
+    assert "static" in _reset(create_context)
+    assert "static" not in _reset(create_context)
+
+
+def test_dirty_after_update(create_context):
+    instance = _create(create_context, "static")
+    _reset(create_context)
+
+    instance = create_context.instances_by_id[instance.id]
+    instance["variant"] = "Other"
+    create_context.save_changes()
+    assert "static" in _reset(create_context)
+    assert create_context.instances_by_id[instance.id]["variant"] == "Other"
+
+
+def test_dirty_after_remove(create_context):
+    instance = _create(create_context, "static")
+    _reset(create_context)
+
+    create_context.remove_instances(
+        [create_context.instances_by_id[instance.id]]
+    )
+    assert "static" in _reset(create_context)
+    assert instance.id not in create_context.instances_by_id
+
+
+def test_unsaved_changes_are_recollected(create_context):
+    instance = _create(create_context, "static")
+    _reset(create_context)
+
+    create_context.instances_by_id[instance.id]["variant"] = "Other"
+    assert "static" in _reset(create_context)
+    # Unsaved changes are lost on reset
+    assert create_context.instances_by_id[instance.id]["variant"] == "Main"
+
+
+def test_mark_creators_dirty(create_context):
+    _reset(create_context)
+    create_context.mark_creators_dirty(["static"])
+    assert _reset(create_context) == {"static", "unknown"}
+
+    create_context.mark_creators_dirty()
+    assert _reset(create_context) >= {"changing", "static", "auto"}
+
+
+def test_changed_plugin_file_is_rediscovered(create_context, plugin_path):
+    _reset(create_context)
+    creator = create_context.creators["static"]
+
+    filepath = os.path.join(plugin_path, "create_test.py")
+    stat_result = os.stat(filepath)
+    os.utime(filepath, ns=(
+        stat_result.st_atime_ns,
+        stat_result.st_mtime_ns + 1000000000
+    ))
+    calls = _reset(create_context)
+    assert create_context.creators["static"] is not creator
+    assert {"changing", "static", "unknown", "auto"} <= calls
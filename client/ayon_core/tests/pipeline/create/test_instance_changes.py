@@ -0,0 +1,188 @@
+import pytest
+
+from ayon_core.lib.attribute_definitions import BoolDef, NumberDef
+from ayon_core.pipeline.create.changes import TrackChangesItem
+from ayon_core.pipeline.create.structures import CreatedInstance
+
+
+def _create_instance(data=None):
+    instance_data = {
+        "folderPath": "/shots/sh010",
+        "task": "compositing",
+        "variant": "Main",
+        "members": ["node_1", "node_2"],
+        "options": {"resolution": [1920, 1080]},
+        "creator_attributes": {"review": True},
+        "publish_attributes": {"ValidatePlugin": {"active": True}},
+    }
+    instance_data.update(data or {})
+    return CreatedInstance(
+        "render",
+        "renderMain",
+        instance_data,
+        creator_identifier="render",
+        creator_label="Render",
+        group_label="Render",
+        creator_attr_defs=[
+            BoolDef("review", default=False),
+            NumberDef("priority", default=50),
+        ],
+    )
+
+
+@pytest.fixture
+def instance():
+    instance = _create_instance()
+    instance.mark_as_stored()
+    return instance
+
+
+def test_new_instance_has_changes():
+    instance = _create_instance({"family": "render"})
+    assert instance.has_changes()
+    changes = instance.changes()
+    assert changes
+    # Legacy key is removed from data
+    assert "family" in changes.removed_keys
+
+
+def test_stored_instance_has_no_changes(instance):
+    assert not instance.has_changes()
+    assert not instance.changes()
+    assert not instance.changes().changed_keys
+
+
+def test_set_value(instance):
+    instance["variant"] = "Other"
+    assert instance.has_changes()
+    changes = instance.changes()
+    assert changes.changed_keys == {"variant"}
+    assert changes["variant"].old_value == "Main"
+    assert changes["variant"].new_value == "Other"
+
+
+def test_set_same_value(instance):
+    instance["variant"] = "Main"
+    assert not instance.has_changes()
+    assert not instance.changes()
+
+
+def test_new_key(instance):
+    instance["comment"] = "Note"
+    changes = instance.changes()
+    assert changes.changed_keys == {"comment"}
+    assert changes["comment"].old_value is None
+    assert changes["comment"].new_value == "Note"
+
+
+def test_pop_key(instance):
+    instance.pop("task")
+    assert instance.has_changes()
+    changes = instance.changes()
+    assert changes.changed_keys == {"task"}
+    assert changes.removed_keys == {"task"}
+
+
+def test_in_place_list_change(instance):
+    instance["members"].append("node_3")
+    assert instance.has_changes()
+    changes = instance.changes()
+    assert changes.changed_keys == {"members"}
+    assert changes["members"].old_value == ["node_1", "node_2"]
+    assert changes["members"].new_value == ["node_1", "node_2", "node_3"]
+
+
+def test_in_place_dict_change(instance):
+    instance["options"]["resolution"][0] = 3840
+    changes = instance.changes()
+    assert changes.changed_keys == {"options"}
+    assert changes["options"]["resolution"].old_value == [1920, 1080]
+    assert changes["options"]["resolution"].new_value == [3840, 1080]
+
+
+def test_attribute_values_change(instance):
+    instance.creator_attributes["review"] = False
+    changes = instance.changes()
+    assert changes.changed_keys == {"creator_attributes"}
+    assert changes["creator_attributes"].changes == {
+        "review": (True, False)
+    }
+
+    instance.mark_as_stored()
+    instance.publish_attributes["ValidatePlugin"]["active"] = False
+    changes = instance.changes()
+    assert changes.changed_keys == {"publish_attributes"}
+    assert changes["publish_attributes"]["ValidatePlugin"].changes == {
+        "active": (True, False)
+    }
+
+
+def test_mark_as_stored(instance):
+    instance["variant"] = "Other"
+    instance["members"].append("node_3")
+    instance.pop("task")
+    changes = instance.changes()
+    instance.mark_as_stored()
+
+    assert not instance.has_changes()
+    assert not instance.changes()
+    # Changes created before store are not affected
+    assert changes.changed_keys == {"variant", "members", "task"}
+    assert changes["variant"].old_value == "Main"
+    assert changes["members"].old_value == ["node_1", "node_2"]
+
+    # Stored origin data are not shared with data
+    instance["members"].append("node_4")
+    assert instance.changes().changed_keys == {"members"}
+    assert instance.origin_data["members"] == [
+        "node_1", "node_2", "node_3"
+    ]
+
+
+def test_changes_values_are_copies(instance):
+    instance["members"].append("node_3")
+    changes = instance.changes()
+    new_value = changes["members"].new_value
+    new_value.append("node_4")
+    assert instance["members"] == ["node_1", "node_2", "node_3"]
+    assert changes.changes["members"][1] == ["node_1", "node_2", "node_3"]
+
+
+def test_changes_are_snapshot(instance):
+    instance["variant"] = "Other"
+    changes = instance.changes()
+    # Changes of changed and unchanged values after changes were created
+    instance["members"].append("node_3")
+    instance["options"]["resolution"][0] = 3840
+    instance["variant"] = "Third"
+    instance.creator_attributes["review"] = False
+
+    assert changes.changed_keys == {"variant"}
+    assert changes["variant"].new_value == "Other"
+    assert changes["members"].new_value == ["node_1", "node_2"]
+    assert changes.new_value["options"]["resolution"] == [1920, 1080]
+    assert changes["creator_attributes"]["review"].new_value is True
+
+
+def test_track_changes_copies_values():
+    old_value = {"a": [1]}
+    new_value = {"a": [1, 2]}
+    changes = TrackChangesItem(old_value, new_value)
+    new_value["a"].append(3)
+    old_value["a"].append(4)
+    assert changes["a"].old_value == [1]
+    assert changes["a"].new_value == [1, 2]
+
+
+def test_track_changes_candidate_keys():
+    old_value = {"a": 1, "b": 2, "c": 3}
+    new_value = {"a": 1, "b": 5, "c": 4, "d": 6}
+    changes = TrackChangesItem(old_value, new_value, candidate_keys={"b"})
+    # Not candidate keys are considered unchanged, added keys are changed
+    assert changes.changed_keys == {"b", "d"}
+
+    changes = TrackChangesItem(old_value, new_value)
+    assert changes.changed_keys == {"b", "c", "d"}
+
+    changes = TrackChangesItem(old_value, dict(old_value), candidate_keys=[])
+    assert not changes
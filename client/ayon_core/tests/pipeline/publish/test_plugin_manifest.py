@@ -0,0 +1,152 @@
+import textwrap
+
+import pytest
+
+from ayon_core.pipeline.publish.plugin_manifest import parse_plugin_classes
+
+
+def _parse(source):
+    return {
+        class_info["name"]: class_info
+        for class_info in parse_plugin_classes(textwrap.dedent(source))
+    }
+
+
+def test_literal_attributes():
+    classes = _parse("""
+        import pyblish.api
+
+
+        class CollectSomething(pyblish.api.InstancePlugin):
+            order = pyblish.api.CollectorOrder + 0.1
+            hosts = ["maya", "nuke"]
+            families = ("review", )
+            targets: list = ["farm"]
+            settings_category = "core"
+    """)
+    class_info = classes["CollectSomething"]
+    assert class_info["order"] == pytest.approx(0.1)
+    assert class_info["hosts"] == ["maya", "nuke"]
+    assert class_info["families"] == ["review"]
+    assert class_info["targets"] == ["farm"]
+    assert class_info["settings_category"] == "core"
+
+
+def test_not_literal_attributes():
+    classes = _parse("""
+        HOSTS = ["maya"]
+
+
+        class CollectSomething(Base):
+            order = get_order()
+            hosts = HOSTS
+
+
+        class CollectOther(Base):
+            pass
+    """)
+    for class_info in classes.values():
+        assert class_info["order"] is None
+        assert class_info["hosts"] is None
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        # Augmented assignment in class body
+        """
+        class Plugin(Base):
+            hosts = ["maya"]
+            hosts += ["nuke"]
+        """,
+        # Assignment in conditional block of class body
+        """
+        class Plugin(Base):
+            hosts = ["maya"]
+            if NUKE:
+                hosts = ["nuke"]
+        """,
+        # Modifying method in class body
+        """
+        class Plugin(Base):
+            hosts = ["maya"]
+            hosts.append("nuke")
+        """,
+        # Module level assignment to class attribute
+        """
+        class Plugin(Base):
+            hosts = ["maya"]
+
+        Plugin.hosts = ["nuke"]
+        """,
+        # Module level augmented assignment
+        """
+        class Plugin(Base):
+            hosts = ["maya"]
+
+        Plugin.hosts += ["nuke"]
+        """,
+        # Module level modifying method
+        """
+        class Plugin(Base):
+            hosts = ["maya"]
+
+        Plugin.hosts.extend(["nuke"])
+        """,
+        # Module level 'setattr'
+        """
+        class Plugin(Base):
+            hosts = ["maya"]
+
+        setattr(Plugin, "hosts", ["nuke"])
+        """,
+        # Class method changing class attribute
+        """
+        class Plugin(Base):
+            hosts = ["maya"]
+
+            @classmethod
+            def apply_settings(cls, project_settings):
+                cls.hosts = project_settings["hosts"]
+        """,
+        # Attribute of unknown object changes all classes
+        """
+        class Plugin(Base):
+            hosts = ["maya"]
+
+        for plugin in (Plugin, ):
+            plugin.hosts = ["nuke"]
+        """,
+    ]
+)
+def test_changed_hosts_are_unknown(source):
+    classes = _parse(source)
+    assert classes["Plugin"]["hosts"] is None
+
+
+def test_changes_of_other_class_and_local_names():
+    classes = _parse("""
+        class Plugin(Base):
+            hosts = ["maya"]
+            families = ["review"]
+
+            def process(self, instance):
+                hosts = ["nuke"]
+                hosts.append("houdini")
+                families = instance.data["families"]
+                families.append("render")
+
+
+        class Other(Base):
+            hosts = ["maya"]
+
+        Other.hosts = ["nuke"]
+    """)
+    assert classes["Plugin"]["hosts"] == ["maya"]
+    assert classes["Plugin"]["families"] == ["review"]
+    assert classes["Other"]["hosts"] is None
+
+
+def test_invalid_source():
+    with pytest.raises(SyntaxError):
+        parse_plugin_classes("class Plugin(:")
@@ -0,0 +1,88 @@
+import pytest
+
+from ayon_core.pipeline import colorspace
+from ayon_core.pipeline.colorspace import ColorspaceResolver
+
+COLORSPACES = ["Gamma 2.2", "Gamma 2.4", "ACEScg", "sRGB"]
+
+
+@pytest.fixture
+def resolver_factory(monkeypatch):
+    """Create resolver without OCIO config on disk."""
+    monkeypatch.setattr(
+        colorspace,
+        "get_ocio_config_colorspaces",
+        lambda config_path: {"colorspaces": {
+            name: {} for name in COLORSPACES
+        }}
+    )
+    monkeypatch.setattr(
+        colorspace,
+        "compatibility_check_config_version",
+        lambda config_path, *args, **kwargs: False
+    )
+
+    def factory(file_rules=None):
+        return ColorspaceResolver({"path": "config.ocio"}, file_rules)
+    return factory
+
+
+def test_colorspace_names_differ_by_numbers(resolver_factory):
+    resolver = resolver_factory()
+    assert resolver.get_colorspace_names([
+        "/path/img_Gamma_2.2.exr",
+        "/path/img_Gamma_2.4.exr",
+    ]) == {
+        "/path/img_Gamma_2.2.exr": "Gamma 2.2",
+        "/path/img_Gamma_2.4.exr": "Gamma 2.4",
+    }
+
+
+def test_file_rules_differ_by_numbers(resolver_factory):
+    resolver = resolver_factory([
+        {"pattern": r"_001\.", "ext": "exr", "colorspace": "ACEScg"},
+        {"pattern": r"_002\.", "ext": "exr", "colorspace": "sRGB"},
+    ])
+    assert resolver.get_file_rules_colorspace_name(
+        "/path/plate_001.exr") == "ACEScg"
+    assert resolver.get_file_rules_colorspace_name(
+        "/path/plate_002.exr") == "sRGB"
+    assert resolver.get_colorspace_name("/path/plate_001.exr") == "ACEScg"
+    assert resolver.get_colorspace_name("/path/plate_002.exr") == "sRGB"
+
+
+def test_file_rules_last_matching_rule_wins(resolver_factory):
+    resolver = resolver_factory([
+        {"pattern": "plate", "ext": "exr", "colorspace": "ACEScg"},
+        {"pattern": "plate_srgb", "ext": "exr", "colorspace": "sRGB"},
+    ])
+    assert resolver.get_colorspace_name(
+        "/path/plate_srgb.1001.exr") == "sRGB"
+    assert resolver.get_colorspace_name(
+        "/path/plate.1001.exr") == "ACEScg"
+    # Extension of rule does not match
+    assert resolver.get_file_rules_colorspace_name(
+        "/path/plate.1001.png") is None
+
+
+def test_sequence_frames(resolver_factory):
+    resolver = resolver_factory(
+        [{"pattern": "plate", "ext": "exr", "colorspace": "ACEScg"}]
+    )
+    filepaths = [
+        "/path/plate.{:04}.exr".format(frame)
+        for frame in range(1001, 1004)
+    ]
+    assert set(resolver.get_colorspace_names(filepaths).values()) == {
+        "ACEScg"
+    }
+
+
+def test_validate_missing_colorspace(resolver_factory):
+    resolver = resolver_factory(
+        [{"pattern": "plate", "ext": "exr", "colorspace": "Missing"}]
+    )
+    with pytest.raises(KeyError):
+        resolver.get_colorspace_name("/path/plate.exr")
+    assert resolver.get_colorspace_name(
+        "/path/plate.exr", validate=False) == "Missing"
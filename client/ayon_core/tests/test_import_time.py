@@ -0,0 +1,124 @@
+"""Guard cold import time of 'ayon_core.lib' and 'ayon_core.pipeline'.
+
+Packages export their functions lazily, so importing them must not import
+heavy submodules. Import is measured with 'python -X importtime' in a new
+process. Import time is compared with budget only if it is set by
+'AYON_IMPORT_TIME_BUDGET_MS' environment variable, because wall clock time
+is not reliable on shared machines.
+
+Submodules must stay available as attributes of the packages, as they were
+when the packages imported all names eagerly.
+"""
+import os
+import sys
+import subprocess
+
+import pytest
+
+# Modules which must not be imported on import of the package
+HEAVY_MODULES = (
+    "ayon_api",
+    "ayon_core.lib.transcoding",
+    "ayon_core.lib.attribute_definitions",
+    "ayon_core.pipeline.anatomy",
+    "ayon_core.pipeline.create",
+    "ayon_core.pipeline.load",
+    "ayon_core.pipeline.publish",
+    "ayon_core.pipeline.colorspace",
+)
+
+
+def _run_python(code):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+    return subprocess.run(
+        [sys.executable] + code,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+
+
+def _get_import_times(module_name):
+    """Import module in new process and return cumulative import times.
+
+    Returns:
+        dict[str, int]: Cumulative import time in microseconds by module.
+
+    """
+    process = _run_python(
+        ["-X", "importtime", "-c", "import {}".format(module_name)]
+    )
+    assert process.returncode == 0, process.stderr
+
+    output = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            cumulative = int(parts[1])
+        except ValueError:
+            continue
+        output[parts[2].strip()] = cumulative
+    return output
+
+
+@pytest.mark.parametrize(
+    "module_name", ["ayon_core.lib", "ayon_core.pipeline"]
+)
+def test_cold_import(module_name):
+    import_times = _get_import_times(module_name)
+    assert module_name in import_times
+
+    imported_heavy = [
+        name
+        for name in HEAVY_MODULES
+        if name in import_times
+    ]
+    assert not imported_heavy, (
+        "Import of '{}' imported {}".format(module_name, imported_heavy)
+    )
+
+    budget_ms = os.getenv("AYON_IMPORT_TIME_BUDGET_MS")
+    if not budget_ms:
+        return
+
+    budget_ms = int(budget_ms)
+    import_ms = import_times[module_name] / 1000
+    assert import_ms <= budget_ms, (
+        "Import of '{}' took {:.1f}ms, budget is {}ms".format(
+            module_name, import_ms, budget_ms
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    "module_name,attr_names",
+    [
+        ("ayon_core.lib", ["transcoding", "path_tools"]),
+        (
+            "ayon_core.pipeline",
+            ["publish", "create", "load", "context_tools", "workfile"]
+        ),
+    ]
+)
+def test_submodule_attributes(module_name, attr_names):
+    # Submodules are available as attributes without explicit import
+    code = "\n".join(
+        ["import {} as module".format(module_name)]
+        + ["module.{}".format(attr_name) for attr_name in attr_names]
+        + [
+            "try:",
+            "    module.not_existing_submodule",
+            "except AttributeError:",
+            "    pass",
+            "else:",
+            "    raise AssertionError('Missing attribute was resolved')",
+        ]
+    )
+    process = _run_python(["-c", code])
+    assert process.returncode == 0, process.stderr
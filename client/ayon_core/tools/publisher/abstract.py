@@ -127,11 +127,16 @@ class AbstractPublisherCommon(ABC):
         pass
 
     @abstractmethod
-    def reset(self):
+    def reset(self, incremental=False):
         """Reset whole controller.
 
         This should reset create context, publish context and all variables
         that are related to it.
+
+        Args:
+            incremental (Optional[bool]): Discover plugins and collect
+                instances only if something changed since previous reset.
+                Explicit refresh by user should do full reset.
         """
 
         pass
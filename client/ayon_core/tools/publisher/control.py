@@ -45,6 +45,8 @@ class PublisherController(
         "publish.process.stopped" - Publishing stopped/paused process.
         "publish.process.plugin.changed" - Plugin state has changed.
         "publish.process.instance.changed" - Instance state has changed.
+        "publish.process.tool_progress.changed" - Progress of external
+            tool run by processed plugin has changed.
         "publish.has_validated.changed" - Attr 'publish_has_validated'
             changed.
         "publish.is_running.changed" - Attr 'publish_is_running' changed.
@@ -319,8 +321,13 @@ class PublisherController(
             for product_entity in product_entities
         }
 
-    def reset(self):
-        """Reset everything related to creation and publishing."""
+    def reset(self, incremental=False):
+        """Reset everything related to creation and publishing.
+
+        Args:
+            incremental (Optional[bool]): Discover plugins and collect
+                instances only if something changed since previous reset.
+        """
         self.stop_publish()
 
         self._emit_event("controller.reset.started")
@@ -328,7 +335,7 @@ class PublisherController(
         self._hierarchy_model.reset()
 
         # Publish part must be reset after plugins
-        self._create_model.reset()
+        self._create_model.reset(incremental)
         self._publish_model.reset()
 
         self._emit_event("controller.reset.finished")
@@ -431,7 +438,7 @@ class PublisherController(
 
         self._create_model.trigger_convertor_items(convertor_identifiers)
 
-        self.reset()
+        self.reset(incremental=True)
 
     def create(
         self, creator_identifier, product_name, instance_data, options
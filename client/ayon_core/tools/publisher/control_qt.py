@@ -80,10 +80,10 @@ class QtPublisherController(PublisherController):
         #   '_main_thread_processor' loop
         self._item_process_in_loop = False
 
-    def reset(self):
+    def reset(self, incremental=False):
         self._main_thread_processor.clear()
         self._item_process_in_loop = False
-        super().reset()
+        super().reset(incremental)
 
     def _start_publish(self, up_validation):
         self._publish_model.set_publish_up_validation(up_validation)
@@ -247,17 +247,31 @@ class CreateModel:
     def host_context_has_changed(self) -> bool:
         return self._create_context.context_has_changed
 
-    def reset(self):
+    def reset(self, incremental=False):
+        """Reset create context.
+
+        Incremental reset skips discovery of plugins if plugin files did
+        not change, and collects instances only by creators which were used
+        since previous reset, or which report changed collection state.
+
+        Args:
+            incremental (Optional[bool]): Discover plugins and collect
+                instances only if something changed.
+        """
         self._create_context.reset_preparation()
 
+        # Collect all instances if host context changed
+        if self._create_context.context_has_changed:
+            self._create_context.mark_creators_dirty()
+
         # Reset current context
         self._create_context.reset_current_context()
 
-        self._create_context.reset_plugins()
+        self._create_context.reset_plugins(incremental=incremental)
         # Reset creator items
         self._creator_items = None
 
-        self._reset_instances()
+        self._reset_instances(incremental=incremental)
         self._create_context.reset_finalization()
 
     def get_creator_items(self) -> Dict[str, CreatorItem]:
@@ -638,13 +652,13 @@ class CreateModel:
 
         return self._create_context.creators
 
-    def _reset_instances(self):
+    def _reset_instances(self, incremental=False):
         """Reset create instances."""
 
         self._create_context.reset_context_data()
         with self._create_context.bulk_instances_collection():
             try:
-                self._create_context.reset_instances()
+                self._create_context.reset_instances(incremental)
             except CreatorsOperationFailed as exc:
                 self._emit_event(
                     "instances.collection.failed",
@@ -666,7 +680,7 @@ class CreateModel:
                 )
 
             try:
-                self._create_context.execute_autocreators()
+                self._create_context.execute_autocreators(incremental)
 
             except CreatorsOperationFailed as exc:
                 self._emit_event(
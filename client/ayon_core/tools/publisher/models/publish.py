@@ -9,6 +9,7 @@ from typing import Optional, Dict, List, Union, Any, Iterable
 import arrow
 import pyblish.plugin
 
+from ayon_core.lib import register_event_callback
 from ayon_core.pipeline import (
     PublishValidationError,
     KnownPublishError,
@@ -897,6 +898,11 @@ class PublishModel:
             self._default_iterator()
         )
 
+        # Progress of external tools, e.g. ffmpeg, run by publish plugins
+        register_event_callback(
+            "publish.tool.progress", self._on_tool_progress
+        )
+
     def reset(self):
         create_context = self._controller.get_create_context()
         self._publish_up_validation = False
@@ -1073,6 +1079,19 @@ class PublishModel:
     def _emit_event(self, topic: str, data: Optional[Dict[str, Any]] = None):
         self._controller.emit_event(topic, data, PUBLISH_EVENT_SOURCE)
 
+    def _on_tool_progress(self, event):
+        if not self._publish_is_running:
+            return
+        self._emit_event(
+            "publish.process.tool_progress.changed",
+            {
+                "label": event["label"],
+                "frame": event["frame"],
+                "total_frames": event["total_frames"],
+                "done": event["done"],
+            }
+        )
+
     def _set_finished(self, value: bool):
         if self._publish_has_finished != value:
             self._publish_has_finished = value
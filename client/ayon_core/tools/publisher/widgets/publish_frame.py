@@ -183,6 +183,10 @@ class PublishFrame(QtWidgets.QWidget):
         controller.register_event_callback(
             "publish.process.plugin.changed", self._on_plugin_change
         )
+        controller.register_event_callback(
+            "publish.process.tool_progress.changed",
+            self._on_tool_progress_change
+        )
 
         self._shrunk_anim = shrunk_anim
 
@@ -366,6 +370,26 @@ class PublishFrame(QtWidgets.QWidget):
         self._plugin_label.setText(event["plugin_label"])
         QtWidgets.QApplication.processEvents()
 
+    def _on_tool_progress_change(self, event):
+        """Show progress of external tool next to plugin label."""
+
+        if event["done"]:
+            self._plugin_label.setText(self._last_plugin_label or "")
+            return
+
+        frame = event["frame"]
+        total_frames = event["total_frames"]
+        if total_frames:
+            progress = "{:.0f}%".format(
+                min(100.0, frame * 100.0 / total_frames)
+            )
+        else:
+            progress = "frame {}".format(frame)
+        self._plugin_label.setText("{} - {} {}".format(
+            self._last_plugin_label or "", event["label"], progress
+        ))
+        QtWidgets.QApplication.processEvents()
+
     def _on_publish_stop(self):
         self._progress_bar.setValue(self._controller.get_publish_progress())
 
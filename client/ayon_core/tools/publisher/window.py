@@ -566,7 +566,8 @@ class PublisherWindow(QtWidgets.QDialog):
         # Reset if requested
         if self._reset_on_show:
             self._reset_on_show = False
-            self.reset()
+            # Automatic refresh, only changes are collected
+            self.reset(incremental=True)
 
     def _checks_before_save(self, explicit_save):
         """Save of changes may trigger some issues.
@@ -628,8 +629,8 @@ class PublisherWindow(QtWidgets.QDialog):
             return False
         return self._controller.save_changes()
 
-    def reset(self):
-        self._controller.reset()
+    def reset(self, incremental=False):
+        self._controller.reset(incremental)
 
     def set_context_label(self, label):
         self._context_label.setText(label)
@@ -427,6 +427,8 @@ class ProjectPushItemProcess:
 
     # TODO where to get host?!!!
     host_name = "republisher"
+    # Number of threads transferring files ('None' to decide automatically)
+    transfer_workers = None
 
     def __init__(self, model, item):
         self._model = model
@@ -452,7 +454,9 @@ class ProjectPushItemProcess:
 
         self._status = ProjectPushItemStatus()
         self._operations = OperationsSession()
-        self._file_transaction = FileTransaction()
+        self._file_transaction = FileTransaction(
+            max_workers=self.transfer_workers
+        )
 
         self._messages = []
 
@@ -1019,7 +1023,8 @@ class ProjectPushItemProcess:
             repre_filepaths = []
             published_path = None
             for src_file in repre_item.src_files:
-                file_data = copy.deepcopy(repre_format_data)
+                # Only top level keys are changed for each file
+                file_data = dict(repre_format_data)
                 frame = src_file.frame
                 if frame is not None:
                     file_data["frame"] = frame
@@ -1076,12 +1081,16 @@ class ProjectPushItemProcess:
             }
             new_repre_files = []
             for (path, rootless_path) in repre_filepaths:
+                # Use stat captured during transfer
+                stat_result = self._file_transaction.get_transferred_stat(
+                    path
+                )
                 new_repre_files.append({
                     "id": create_entity_id(),
                     "name": os.path.basename(rootless_path),
                     "path": rootless_path,
-                    "size": os.path.getsize(path),
-                    "hash": source_hash(path),
+                    "size": stat_result.st_size,
+                    "hash": source_hash(path, stat_result=stat_result),
                     "hash_type": "op3",
                 })
 
@@ -8,7 +8,7 @@ import os
 import pyblish.api
 
 from ayon_core.host import ILoadHost
-from ayon_core.lib import Logger
+from ayon_core.lib import Logger, profile_phase
 from ayon_core.pipeline import registered_host
 
 from .lib import qt_app_context
@@ -53,6 +53,7 @@ class HostToolsHelper:
 
         return self._workfiles_tool
 
+    @profile_phase("tool_launch:workfiles")
     def show_workfiles(
         self, parent=None, use_context=None, save=None, on_top=None
     ):
@@ -81,6 +82,7 @@ class HostToolsHelper:
 
         return self._loader_tool
 
+    @profile_phase("tool_launch:loader")
     def show_loader(self, parent=None, use_context=None):
         """Loader tool for loading representations."""
         with qt_app_context():
@@ -106,6 +108,7 @@ class HostToolsHelper:
 
         return self._creator_tool
 
+    @profile_phase("tool_launch:creator")
     def show_creator(self, parent=None):
         """Show tool to create new instantes for publishing."""
         with qt_app_context():
@@ -129,6 +132,7 @@ class HostToolsHelper:
 
         return self._subset_manager_tool
 
+    @profile_phase("tool_launch:subsetmanager")
     def show_subset_manager(self, parent=None):
         """Show tool display/remove existing created instances."""
         with qt_app_context():
@@ -155,6 +159,7 @@ class HostToolsHelper:
 
         return self._scene_inventory_tool
 
+    @profile_phase("tool_launch:sceneinventory")
     def show_scene_inventory(self, parent=None):
         """Show tool maintain loaded containers."""
         with qt_app_context():
@@ -171,10 +176,12 @@ class HostToolsHelper:
         """Create, cache and return library loader tool window."""
         return self.get_loader_tool(parent)
 
+    @profile_phase("tool_launch:libraryloader")
     def show_library_loader(self, parent=None):
         """Loader tool for loading representations from library project."""
         return self.show_loader(parent)
 
+    @profile_phase("tool_launch:publish")
     def show_publish(self, parent=None):
         """Try showing the most desirable publish GUI
 
@@ -219,6 +226,7 @@ class HostToolsHelper:
             self._experimental_tools_dialog = ExperimentalToolsDialog(parent)
         return self._experimental_tools_dialog
 
+    @profile_phase("tool_launch:experimental_tools")
     def show_experimental_tools_dialog(self, parent=None):
         """Show dialog with experimental tools."""
         with qt_app_context():
@@ -246,6 +254,7 @@ class HostToolsHelper:
 
         return self._publisher_tool
 
+    @profile_phase("tool_launch:publisher")
     def show_publisher_tool(self, parent=None, controller=None, tab=None):
         with qt_app_context():
             window = self.get_publisher_tool(parent, controller)
@@ -51,6 +51,72 @@ class CollectCommentPIModel(BaseSettingsModel):
     families: list[str] = SettingsField(default_factory=list, title="Families")
 
 
+def _tool_scheduler_tools_enum():
+    return [
+        {"value": "ffmpeg", "label": "ffmpeg"},
+        {"value": "oiiotool", "label": "oiiotool"},
+    ]
+
+
+class ToolSchedulerLimitModel(BaseSettingsModel):
+    _layout = "compact"
+    name: str = SettingsField(
+        "ffmpeg",
+        title="Tool",
+        enum_resolver=_tool_scheduler_tools_enum
+    )
+    max_processes: int = SettingsField(
+        0,
+        title="Max processes",
+        ge=0
+    )
+
+
+class CollectToolSchedulerModel(BaseSettingsModel):
+    _isGroup = True
+    max_processes: int = SettingsField(
+        2,
+        title="Max processes",
+        description=(
+            "Maximum number of concurrently running media tools"
+            " on workstation. Tools are multithreaded, so low value keeps"
+            " workstation responsive. Value '0' uses number of CPU cores."
+        ),
+        ge=0
+    )
+    farm_max_processes: int = SettingsField(
+        0,
+        title="Max processes on farm",
+        description=(
+            "Maximum number of concurrently running media tools"
+            " in headless publishing. Value '0' uses number of CPU cores."
+        ),
+        ge=0
+    )
+    tool_limits: list[ToolSchedulerLimitModel] = SettingsField(
+        default_factory=list,
+        title="Limits per tool"
+    )
+    min_free_memory_mb: int = SettingsField(
+        0,
+        title="Min free memory (MB)",
+        description=(
+            "New process waits until there is more available memory."
+            " Value '0' disables the check."
+        ),
+        ge=0
+    )
+    max_load_factor: float = SettingsField(
+        0.0,
+        title="Max load per CPU core",
+        description=(
+            "New process waits while system load per CPU core is higher."
+            " Value '0' disables the check."
+        ),
+        ge=0.0
+    )
+
+
 class CollectFramesFixDefModel(BaseSettingsModel):
     enabled: bool = SettingsField(True)
     rewrite_version_enable: bool = SettingsField(
@@ -263,6 +329,22 @@ class ExtractThumbnailModel(BaseSettingsModel):
     ffmpeg_args: ExtractThumbnailFFmpegModel = SettingsField(
         default_factory=ExtractThumbnailFFmpegModel
     )
+    reuse_review_outputs: bool = SettingsField(
+        False,
+        title="Reuse review outputs",
+        description=(
+            "Create thumbnail from review output without burnins"
+            " instead of source files when available."
+        )
+    )
+    use_thumbnail_cache: bool = SettingsField(
+        True,
+        title="Use thumbnail cache",
+        description=(
+            "Re-use thumbnail created by previous publishing"
+            " of unchanged source file."
+        )
+    )
 
 
 def _extract_oiio_transcoding_type():
@@ -343,6 +425,10 @@ class ExtractOIIOTranscodeProfileModel(BaseSettingsModel):
 
 class ExtractOIIOTranscodeModel(BaseSettingsModel):
     enabled: bool = SettingsField(True)
+    report_progress: bool = SettingsField(
+        False, title="Report progress",
+        description="Log progress of sequence conversion and show it in "
+                    "Publisher.")
     profiles: list[ExtractOIIOTranscodeProfileModel] = SettingsField(
         default_factory=list, title="Profiles"
     )
@@ -531,6 +617,28 @@ class ExtractReviewProfileModel(BaseSettingsModel):
 class ExtractReviewModel(BaseSettingsModel):
     _isGroup = True
     enabled: bool = SettingsField(True)
+    single_decode: bool = SettingsField(
+        False, title="Decode input once for all outputs",
+        description="Render compatible output definitions with single "
+                    "ffmpeg process so input sequence is decoded only once.")
+    fuse_burnins: bool = SettingsField(
+        False, title="Render burnins with review",
+        description="Draw burnins during review encoding when output has "
+                    "single burnin definition, instead of encoding the "
+                    "review again in Extract Burnin.")
+    segmented_encoding: bool = SettingsField(
+        False, title="Segmented encoding",
+        description="Encode long image sequences to video in segments "
+                    "processed in parallel and concatenated without "
+                    "re-encoding.")
+    segment_workers: int = SettingsField(
+        0, title="Segment workers", ge=0,
+        description="Number of segments encoded at once. Use 0 to use "
+                    "limit of tool scheduler.")
+    report_progress: bool = SettingsField(
+        False, title="Report progress",
+        description="Log progress of ffmpeg encoding and show it in "
+                    "Publisher.")
     profiles: list[ExtractReviewProfileModel] = SettingsField(
         default_factory=list,
         title="Profiles"
@@ -787,6 +895,10 @@ class IntegrateHeroVersionModel(BaseSettingsModel):
                     "Windows being unable to delete any of the hardlinks if "
                     "any of the links is in use creating issues with updating "
                     "hero versions.")
+    transfer_workers: int = SettingsField(
+        0, title="Transfer workers", ge=0,
+        description="Number of threads used to link or copy files of hero "
+                    "version. Use 0 to decide by available CPU count.")
 
 
 class CleanUpModel(BaseSettingsModel):
@@ -828,6 +940,10 @@ class PublishPuginsModel(BaseSettingsModel):
         default_factory=CollectFramesFixDefModel,
         title="Collect Frames to Fix",
     )
+    CollectToolScheduler: CollectToolSchedulerModel = SettingsField(
+        default_factory=CollectToolSchedulerModel,
+        title="Collect Tool Scheduler",
+    )
     CollectUSDLayerContributions: CollectUSDLayerContributionsModel = SettingsField(
         default_factory=CollectUSDLayerContributionsModel,
         title="Collect USD Layer Contributions",
@@ -932,6 +1048,13 @@ DEFAULT_PUBLISH_VALUES = {
         "enabled": True,
         "rewrite_version_enable": True
     },
+    "CollectToolScheduler": {
+        "max_processes": 2,
+        "farm_max_processes": 0,
+        "tool_limits": [],
+        "min_free_memory_mb": 0,
+        "max_load_factor": 0.0
+    },
     "CollectUSDLayerContributions": {
         "enabled": True,
         "contribution_layers": [
@@ -1013,14 +1136,22 @@ DEFAULT_PUBLISH_VALUES = {
                 "-apply_trc gamma22"
             ],
             "output": []
-        }
+        },
+        "reuse_review_outputs": False,
+        "use_thumbnail_cache": True
     },
     "ExtractOIIOTranscode": {
         "enabled": True,
+        "report_progress": False,
         "profiles": []
     },
     "ExtractReview": {
         "enabled": True,
+        "single_decode": False,
+        "fuse_burnins": False,
+        "segmented_encoding": False,
+        "segment_workers": 0,
+        "report_progress": False,
         "profiles": [
             {
                 "product_types": [],
@@ -1222,7 +1353,8 @@ DEFAULT_PUBLISH_VALUES = {
             "mayaScene",
             "simpleUnrealTexture"
         ],
-        "use_hardlinks": False
+        "use_hardlinks": False,
+        "transfer_workers": 0
     },
     "CleanUp": {
         "paterns": [],